@@ -0,0 +1,37 @@
+"""Suites de performance (voir `python -m chessManager.benchmarks`).
+
+Les noms exportés sont importés à leur premier accès (`__getattr__`), comme
+dans `chessManager.storage` : `main.py --startup-report` importe
+`chessManager.benchmarks.startup` sans charger la suite ni l'application.
+"""
+
+import importlib
+
+# Nom exporté → module qui le définit
+_EXPORTS = {
+    "generate_tournament": ".generator",
+    "generate_players": ".generator",
+    "BenchmarkResult": ".suite",
+    "run_benchmarks": ".suite",
+    "benchmark_scale": ".suite",
+    "compare_results": ".suite",
+    "measure_startup": ".startup",
+    "check_startup": ".startup",
+}
+
+
+def __getattr__(name: str):
+    """Importe à la demande le module d'un nom exporté."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
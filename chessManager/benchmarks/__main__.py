@@ -0,0 +1,105 @@
+"""Suite de performance : python -m chessManager.benchmarks [--scale 1000x7 ...]
+
+Écrit un rapport JSON (temps et pic mémoire par opération et par échelle) et,
+avec --baseline, signale les opérations plus lentes que dans un rapport précédent.
+Mesure aussi le démarrage jusqu'au premier menu (`main.py --startup-report`)
+et le compare aux budgets de `startup.STARTUP_BUDGETS`.
+Code de sortie 1 si une régression ou un dépassement de budget est détecté.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from tabulate import tabulate
+
+from constant import DEFAULT_ENCODING
+from chessManager.benchmarks.suite import DEFAULT_SCALES, DEFAULT_THRESHOLD, run_benchmarks, compare_results
+from chessManager.benchmarks.startup import STARTUP_TOURNAMENTS, check_startup
+
+
+def parse_scale(value: str):
+    """Convertit « JOUEURSxRONDES » (ex. 1000x7) en couple d'entiers."""
+    try:
+        players, rounds = (int(v) for v in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Échelle invalide : {value} (attendu JOUEURSxRONDES)")
+    return players, rounds
+
+
+def format_measure(value) -> str:
+    """Formate une mesure du démarrage : durée en ms, nombre, ou liste de modules."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(value) or "aucun"
+    if isinstance(value, float):
+        return f"{value * 1000:.2f} ms"
+    return str(value)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chessManager.benchmarks", description=__doc__)
+    parser.add_argument(
+        "--scale", type=parse_scale, action="append", dest="scales",
+        help="JOUEURSxRONDES, répétable (défaut : %s)" % " ".join(f"{p}x{r}" for p, r in DEFAULT_SCALES),
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="exécutions chronométrées par opération")
+    parser.add_argument("--seed", type=int, default=0, help="graine du générateur")
+    parser.add_argument("--output", type=Path, default=Path("benchmarks.json"), help="rapport JSON à écrire")
+    parser.add_argument("--baseline", type=Path, help="rapport JSON de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="ratio signalé comme régression")
+    parser.add_argument(
+        "--startup-tournaments", type=int, default=STARTUP_TOURNAMENTS,
+        help="tournois du dossier de données pour la mesure du démarrage",
+    )
+    args = parser.parse_args(argv)
+
+    # Les chemins sont résolus avant que la suite ne change de dossier courant
+    output = args.output.resolve()
+    baseline = args.baseline.resolve() if args.baseline else None
+
+    report = run_benchmarks(args.scales, args.repeat, args.seed)
+    report["startup"] = check_startup(args.startup_tournaments, args.repeat, seed=args.seed)
+    output.write_text(json.dumps(report, indent=4), encoding=DEFAULT_ENCODING)
+
+    rows = [
+        [r["name"], f'{r["players"]}x{r["rounds"]}', f'{r["best"] * 1000:.2f}', f'{r["mean"] * 1000:.2f}',
+         f'{r["peak_memory"] / 1024:.0f}']
+        for r in report["results"]
+    ]
+    print(tabulate(rows, headers=["Opération", "Échelle", "Meilleur (ms)", "Moyenne (ms)", "Pic (Kio)"]))
+
+    startup = report["startup"]
+    print(f'\nDémarrage jusqu\'au premier menu ({startup["tournaments"]} tournois) :')
+    print(tabulate(
+        [[name, format_measure(value), format_measure(startup["budgets"].get(name))]
+         for name, value in startup["measures"].items()],
+        headers=["Mesure", "Meilleur", "Budget"],
+    ))
+    print(f"\n✅ Rapport écrit dans {output}")
+
+    for e in startup["exceeded"]:
+        print(f'⚠️ Démarrage : {e["name"]} {format_measure(e["current"])} '
+              f'(budget {format_measure(e["budget"])})')
+    if not startup["exceeded"]:
+        print("✅ Démarrage dans les budgets")
+
+    regressions = []
+    if baseline is not None:
+        regressions = compare_results(
+            report, json.loads(baseline.read_text(encoding=DEFAULT_ENCODING)), args.threshold
+        )
+        for r in regressions:
+            print(
+                f'⚠️ {r["name"]} ({r["players"]}x{r["rounds"]}) : '
+                f'{r["baseline"] * 1000:.2f} ms → {r["current"] * 1000:.2f} ms (x{r["ratio"]:.2f})'
+            )
+        if not regressions:
+            print(f"✅ Aucune régression par rapport à {baseline}")
+    return 1 if regressions or startup["exceeded"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
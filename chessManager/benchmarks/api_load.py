@@ -0,0 +1,165 @@
+"""Charge de l'API HTTP : python -m chessManager.benchmarks.api_load [--arbiters 1 --arbiters 10 ...]
+
+Démarre le serveur (`chessManager.server`) dans un dossier temporaire avec un
+tournoi synthétique, puis simule des arbitres simultanés : chacun a sa propre
+connexion et saisit, un par un, les résultats de sa part des échiquiers de la
+ronde en cours. La ronde se clôture au dernier résultat et la suivante est
+appariée par le serveur ; chaque arbitre consulte alors le classement, puis
+passe à la ronde suivante.
+
+Mesures, par nombre d'arbitres : requêtes par seconde, latences (médiane,
+95e centile, maximum) et nombre de sauvegardes (une sauvegarde groupée couvre
+les résultats reçus pendant la précédente).
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from tabulate import tabulate
+
+from chessManager.controllers.tournaments_control import TournamentController
+from chessManager.server import HttpClient, TournamentService, serve
+from chessManager.storage import JsonTournamentStore
+from chessManager.benchmarks.generator import generate_tournament
+from chessManager.benchmarks.suite import quiet, workspace
+
+RESULTS = ("1", "0", "0.5")
+
+
+@dataclass
+class LoadReport:
+    """Bilan d'une simulation.
+
+    Attributes:
+        arbiters (int): Nombre d'arbitres simultanés.
+        elapsed (float): Durée totale en secondes.
+        latencies (List[float]): Durée de chaque requête, en secondes.
+        commits (int): Nombre de sauvegardes effectuées par le serveur.
+        errors (int): Réponses en erreur (code HTTP >= 400).
+    """
+
+    arbiters: int
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    commits: int = 0
+    errors: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Requêtes par seconde."""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latence au centile `q` (0 à 1), en secondes."""
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def _arbiter(client: HttpClient, tournament_id: int, boards: List[int], rng: random.Random, report):
+    """Saisit les résultats des échiquiers d'un arbitre, puis consulte le classement."""
+    for board in boards:
+        start = time.perf_counter()
+        status, _ = await client.request(
+            "POST", f"/tournaments/{tournament_id}/results", {"board": board, "result": rng.choice(RESULTS)}
+        )
+        report.latencies.append(time.perf_counter() - start)
+        report.errors += status >= 400
+    start = time.perf_counter()
+    status, _ = await client.request("GET", f"/tournaments/{tournament_id}/standings")
+    report.latencies.append(time.perf_counter() - start)
+    report.errors += status >= 400
+
+
+async def simulate(arbiters: int, players: int, rounds: int, seed: int = 0) -> LoadReport:
+    """Joue `rounds` rondes d'un tournoi de `players` joueurs avec `arbiters` arbitres simultanés.
+
+    À appeler dans un dossier de travail temporaire (voir `workspace`).
+
+    Returns:
+        LoadReport: Le bilan de la simulation.
+    """
+    store = JsonTournamentStore()
+    tournament = generate_tournament(players, rounds, played_rounds=0, seed=seed)
+    store.insert_tournament(tournament)
+    store.compact()
+
+    controller = TournamentController(store=store)
+    report = LoadReport(arbiters=arbiters)
+    save_changes = controller.save_changes
+
+    def counted_save_changes(*tournaments):
+        report.commits += 1
+        return save_changes(*tournaments)
+
+    controller.save_changes = counted_save_changes
+    service = TournamentService(controller)
+    server = await serve(service, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    clients = [HttpClient("127.0.0.1", port) for _ in range(arbiters)]
+    rng = random.Random(seed)
+    tid = tournament.tournament_id
+
+    start = time.perf_counter()
+    try:
+        await clients[0].request("POST", f"/tournaments/{tid}/rounds")
+        for _ in range(rounds):
+            status, rnd = await clients[0].request("GET", f"/tournaments/{tid}/rounds/current")
+            if status != 200:
+                break
+            boards = [m["board"] for m in rnd["matches"]]
+            await asyncio.gather(
+                *(
+                    _arbiter(client, tid, boards[k::arbiters], random.Random(rng.random()), report)
+                    for k, client in enumerate(clients)
+                )
+            )
+        report.elapsed = time.perf_counter() - start
+    finally:
+        for client in clients:
+            await client.close()
+        server.close()
+        await server.wait_closed()
+        await service.close()
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chessManager.benchmarks.api_load", description=__doc__)
+    parser.add_argument(
+        "--arbiters", type=int, action="append", help="arbitres simultanés, répétable (défaut : 1 et 10)"
+    )
+    parser.add_argument("--players", type=int, default=400, help="joueurs du tournoi synthétique")
+    parser.add_argument("--rounds", type=int, default=5, help="rondes jouées")
+    parser.add_argument("--seed", type=int, default=0, help="graine du générateur")
+    args = parser.parse_args(argv)
+
+    table = []
+    for arbiters in args.arbiters or [1, 10]:
+        with workspace(), quiet():
+            report = asyncio.run(simulate(arbiters, args.players, args.rounds, args.seed))
+        table.append(
+            [
+                arbiters,
+                len(report.latencies),
+                f"{report.elapsed:.2f}",
+                f"{report.throughput:.0f}",
+                f"{report.percentile(0.5) * 1000:.2f}",
+                f"{report.percentile(0.95) * 1000:.2f}",
+                f"{max(report.latencies, default=0.0) * 1000:.2f}",
+                report.commits,
+                report.errors,
+            ]
+        )
+    headers = [
+        "Arbitres", "Requêtes", "Durée (s)", "Req/s", "Médiane (ms)", "p95 (ms)", "Max (ms)", "Sauvegardes", "Erreurs"
+    ]
+    print(tabulate(table, headers=headers))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
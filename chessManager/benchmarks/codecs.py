@@ -0,0 +1,130 @@
+"""Débit des codecs JSON : python -m chessManager.benchmarks.codecs [--scale 5000x9 ...]
+
+Pour chaque échelle, un tournoi synthétique est écrit puis relu avec :
+    - le chemin d'origine (`json.dump(..., indent=4)` puis `json.load` et
+      `Tournament.from_record`), comme référence ;
+    - chaque codec disponible (`storage.codec`), en mode indenté et compact.
+
+Mesures : écriture du snapshot, lecture en dictionnaires, lecture en modèles
+(dictionnaires puis `Tournament.from_record`, comme au chargement d'un
+tournoi), en Mio/s rapportés à la taille du fichier.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from tabulate import tabulate
+
+from constant import DEFAULT_ENCODING
+from chessManager.models import Tournament
+from chessManager.storage.codec import CODECS, get_codec
+from chessManager.benchmarks.__main__ import parse_scale
+from chessManager.benchmarks.generator import generate_tournament
+from chessManager.benchmarks.suite import measure
+
+DEFAULT_CODEC_SCALES = [(1000, 7), (5000, 9)]
+
+
+def _baseline_cases(record: dict, path: Path) -> Dict[str, callable]:
+    """Chemin d'origine : json.dump indenté, json.load puis from_record."""
+
+    def save():
+        with open(path, "w", encoding=DEFAULT_ENCODING) as f:
+            json.dump(record, f, indent=4)
+
+    def load():
+        with open(path, "r", encoding=DEFAULT_ENCODING) as f:
+            return json.load(f)
+
+    return {"save": save, "load": load, "hydrate": lambda: Tournament.from_record(load())}
+
+
+def _codec_cases(codec, record: dict, path: Path, compact: bool) -> Dict[str, callable]:
+    """Même parcours avec un codec de `storage.codec`."""
+
+    def save():
+        with open(path, "wb") as f:
+            f.write(codec.dumps(record, compact=compact))
+
+    def read() -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    return {
+        "save": save,
+        "load": lambda: codec.loads(read()),
+        "hydrate": lambda: Tournament.from_record(codec.loads(read())),
+    }
+
+
+def benchmark_codecs(players: int, rounds: int, repeat: int = 3, seed: int = 0) -> List[dict]:
+    """Mesure écriture, lecture et hydratation d'un tournoi pour chaque codec.
+
+    Args:
+        players (int): Nombre de joueurs du tournoi synthétique.
+        rounds (int): Nombre de rondes jouées.
+        repeat (int): Exécutions chronométrées par opération (meilleur temps retenu).
+        seed (int): Graine du générateur.
+
+    Returns:
+        List[dict]: Une ligne par variante (codec, mode, taille, temps et débits).
+    """
+    record = generate_tournament(players, rounds, seed=seed).to_record()
+    variants = [("json.dump indent=4 (origine)", None, False)]
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        variants += [(f"{name} indenté", codec, False), (f"{name} compact", codec, True)]
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="chessmanager-codec-") as tmp:
+        path = Path(tmp) / "Tournaments.json"
+        for label, codec, compact in variants:
+            if codec is None:
+                cases = _baseline_cases(record, path)
+            else:
+                cases = _codec_cases(codec, record, path, compact)
+            cases["save"]()
+            size = os.path.getsize(path)
+            row = {"variant": label, "scale": f"{players}x{rounds}", "size": size}
+            for operation, fn in cases.items():
+                times, _ = measure(fn, repeat=repeat)
+                row[operation] = min(times)
+            rows.append(row)
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chessManager.benchmarks.codecs", description=__doc__)
+    parser.add_argument("--scale", type=parse_scale, action="append", dest="scales", help="JOUEURSxRONDES, répétable")
+    parser.add_argument("--repeat", type=int, default=3, help="exécutions chronométrées par opération")
+    parser.add_argument("--seed", type=int, default=0, help="graine du générateur")
+    args = parser.parse_args(argv)
+
+    table = []
+    for players, rounds in args.scales or DEFAULT_CODEC_SCALES:
+        for row in benchmark_codecs(players, rounds, args.repeat, args.seed):
+            mib = row["size"] / 2 ** 20
+            table.append(
+                [
+                    row["variant"],
+                    row["scale"],
+                    f"{mib:.2f}",
+                    f"{row['save'] * 1000:.1f} ({mib / row['save']:.0f} Mio/s)",
+                    f"{row['load'] * 1000:.1f} ({mib / row['load']:.0f} Mio/s)",
+                    f"{row['hydrate'] * 1000:.1f}",
+                ]
+            )
+    headers = ["Codec", "Échelle", "Taille (Mio)", "Écriture (ms)", "Lecture (ms)", "Lecture + modèles (ms)"]
+    print(tabulate(table, headers=headers))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
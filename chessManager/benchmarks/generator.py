@@ -0,0 +1,82 @@
+import contextlib
+import io
+import random
+
+from chessManager.models import Tournament, Player
+from chessManager.controllers.rounds_control import prepare_next_round
+
+# Résultats tirés au hasard : (blancs, noirs)
+RESULTS = ((1.0, 0.0), (0.5, 0.5), (0.0, 1.0))
+
+
+def generate_players(count: int, rng: random.Random) -> list[Player]:
+    """Génère des joueurs fictifs aux identifiants uniques.
+
+    Args:
+        count (int): Nombre de joueurs.
+        rng (random.Random): Générateur aléatoire (pour des jeux reproductibles).
+
+    Returns:
+        list[Player]: Les joueurs générés.
+    """
+    return [
+        Player(
+            name=f"Joueur {i:06d}",
+            birthdate=f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1950, 2015)}",
+            national_chess_id=f"BX{i:06d}",
+            address=f"{rng.randint(1, 200)} rue des Échecs",
+        )
+        for i in range(count)
+    ]
+
+
+def play_round(tournament: Tournament, rng: random.Random):
+    """Apparie la ronde en cours, tire des résultats au hasard et la clôture.
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+        rng (random.Random): Générateur aléatoire.
+    """
+    rnd = prepare_next_round(tournament)
+    if rnd is None:
+        return
+    for match in rnd.matches:
+        tournament.record_result(rnd, match, *rng.choice(RESULTS))
+    rnd.end_round()
+
+
+def generate_tournament(
+    players: int, rounds: int, played_rounds: int = None, seed: int = 0, name: str = None
+) -> Tournament:
+    """Construit un tournoi synthétique avec les vrais modèles et le moteur d'appariement.
+
+    Les rondes jouées sont appariées par `prepare_next_round` puis reçoivent des
+    résultats aléatoires ; les messages de la console sont masqués.
+
+    Args:
+        players (int): Nombre de joueurs.
+        rounds (int): Nombre de rondes prévues.
+        played_rounds (int, optional): Nombre de rondes jouées et clôturées
+            (défaut : toutes).
+        seed (int, optional): Graine du générateur aléatoire.
+        name (str, optional): Nom du tournoi.
+
+    Returns:
+        Tournament: Le tournoi généré.
+    """
+    rng = random.Random(seed)
+    tournament = Tournament(
+        name=name or f"Bench {players}x{rounds}",
+        location="Benchmark",
+        start_date="01/01/2025",
+        end_date="02/01/2025",
+        number_of_rounds=rounds,
+    )
+    for player in generate_players(players, rng):
+        tournament.add_player(player)
+
+    played = rounds if played_rounds is None else min(played_rounds, rounds)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(played):
+            play_round(tournament, rng)
+    return tournament
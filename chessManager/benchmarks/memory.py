@@ -0,0 +1,124 @@
+"""Mémoire occupée par les matchs selon leur représentation : python -m chessManager.benchmarks.memory
+
+Décode N matchs sérialisés en JSON (comme au chargement d'un tournoi) et
+mesure, avec tracemalloc, la mémoire retenue une fois le JSON décodé libéré :
+    - des objets Match sans `__slots__` (ancienne représentation, pour référence) ;
+    - des objets Match avec `__slots__` (représentation par défaut) ;
+    - une ronde en colonnes (`MatchColumns`).
+"""
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from tabulate import tabulate
+
+from chessManager.models import Player, Match, MatchColumns
+from chessManager.benchmarks.generator import generate_players
+
+DEFAULT_MATCHES = 1_000_000
+
+
+@dataclass
+class DictMatch:
+    """Match sans `__slots__` (représentation d'origine), pour comparaison."""
+
+    white_player: Player
+    white_player_score: Optional[float]
+    black_player: Player
+    black_player_score: Optional[float]
+
+
+def match_tuples(count: int, players: List[Player], seed: int = 0) -> str:
+    """Génère des matchs sérialisés en JSON au format `Match.to_tuple`.
+
+    Args:
+        count (int): Le nombre de matchs.
+        players (List[Player]): Les joueurs référencés.
+        seed (int): La graine du générateur.
+
+    Returns:
+        str: La liste JSON des matchs ([blanc, score], [noir, score]).
+    """
+    rng = random.Random(seed)
+    ids = [p.national_chess_id for p in players]
+    tuples = []
+    for _ in range(count):
+        white, black = rng.sample(ids, 2)
+        score = rng.choice((0.0, 0.5, 1.0))
+        tuples.append([[white, score], [black, 1.0 - score]])
+    return json.dumps(tuples)
+
+
+def retained(build: Callable[[], object]) -> int:
+    """Mesure la mémoire encore allouée après une construction (résultat gardé en vie).
+
+    Args:
+        build (Callable): Construit la structure mesurée.
+
+    Returns:
+        int: Les octets retenus par la structure.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def measure_layouts(count: int = DEFAULT_MATCHES, player_count: int = 2000, seed: int = 0) -> Dict[str, int]:
+    """Mesure la mémoire de `count` matchs dans chaque représentation.
+
+    Args:
+        count (int): Le nombre de matchs.
+        player_count (int): Le nombre de joueurs référencés.
+        seed (int): La graine du générateur.
+
+    Returns:
+        Dict[str, int]: Octets retenus par représentation.
+    """
+    players = generate_players(player_count, random.Random(seed))
+    by_id = {p.national_chess_id: p for p in players}
+    raw = match_tuples(count, players, seed)
+
+    # Chaque construction décode le JSON : les scores décodés (un float par
+    # valeur) restent en vie tant qu'un objet Match les référence
+    def columns():
+        matches = MatchColumns(players)
+        for t in json.loads(raw):
+            matches.append_tuple(t)
+        return matches
+
+    return {
+        "Match (__dict__)": retained(
+            lambda: [DictMatch(by_id[w], ws, by_id[b], bs) for (w, ws), (b, bs) in json.loads(raw)]
+        ),
+        "Match (__slots__)": retained(lambda: [Match.from_tuple(t, by_id) for t in json.loads(raw)]),
+        "MatchColumns": retained(columns),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chessManager.benchmarks.memory", description=__doc__)
+    parser.add_argument("--matches", type=int, default=DEFAULT_MATCHES, help="nombre de matchs")
+    parser.add_argument("--seed", type=int, default=0, help="graine du générateur")
+    args = parser.parse_args(argv)
+
+    results = measure_layouts(args.matches, seed=args.seed)
+    table = [
+        [layout, f"{size / 2 ** 20:.1f}", f"{size / args.matches:.1f}"] for layout, size in results.items()
+    ]
+    print(tabulate(table, headers=["Représentation", "Mémoire (Mio)", "Octets / match"]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,290 @@
+"""Démarrage jusqu'au premier menu : python main.py --startup-report [--json]
+
+Mesure, dans le processus de `main.py`, avant tout import de l'application :
+    - le temps d'import des modules du premier menu, par groupe ;
+    - le chargement des tournois par le contrôleur, dont le décodage JSON
+      (`json`, codec du journal) et l'hydratation des modèles (en-têtes,
+      tournois) ;
+    - la construction du menu principal ;
+    - pour chaque étape, les blocs mémoire encore alloués à la fin
+      (`sys.getallocatedblocks`) et le nombre de modules importés.
+
+Ce module n'importe au chargement que des modules déjà présents au
+lancement de l'interpréteur : il ne fausse pas la mesure des imports.
+
+`check_startup` lance le rapport dans un processus neuf, sur un dossier de
+tournois synthétiques, et le compare à `STARTUP_BUDGETS` ; la suite de
+performance (`python -m chessManager.benchmarks`) échoue si un budget est
+dépassé.
+"""
+
+import importlib
+import sys
+import time
+
+# Budgets du démarrage, vérifiés par la suite de performance : durées en secondes
+# (`wall` : processus complet, interpréteur compris), blocs alloués et nombre de modules lourds chargés
+STARTUP_BUDGETS = {
+    "imports": 0.100,
+    "json_parse": 0.010,
+    "hydration": 0.010,
+    "load": 0.030,
+    "total": 0.150,
+    "wall": 0.300,
+    "allocated_blocks": 60_000,
+    "heavy_modules": 0,
+}
+
+# Tournois synthétiques du dossier de données utilisé par `check_startup`
+STARTUP_TOURNAMENTS = 200
+
+# Modules lourds signalés s'ils sont importés avant le premier menu
+HEAVY_MODULES = ("numpy", "sqlite3", "msgspec", "orjson", "tabulate", "concurrent.futures", "asyncio")
+
+
+def _import_backend():
+    """Importe le module du backend de stockage configuré (celui qu'ouvre le contrôleur)."""
+    from constant import STORAGE_BACKEND
+    import chessManager.storage as storage
+
+    getattr(storage, storage.BACKENDS[STORAGE_BACKEND])
+
+
+# Modules du premier menu, par groupe, dans l'ordre où ils sont chargés
+FIRST_MENU_IMPORTS = (
+    ("constantes", lambda: importlib.import_module("constant")),
+    ("modèles", lambda: importlib.import_module("chessManager.models")),
+    ("stockage", _import_backend),
+    ("contrôleurs", lambda: importlib.import_module("chessManager.controllers.tournaments_control")),
+    ("vues", lambda: importlib.import_module("chessManager.views.menu")),
+)
+
+
+class _Timer:
+    """Cumule la durée des appels des fonctions enveloppées (appels imbriqués comptés une fois)."""
+
+    def __init__(self):
+        self.total = 0.0
+        self.calls = 0
+        self._depth = 0
+
+    def wrap(self, fn):
+        def timed(*args, **kwargs):
+            if self._depth:
+                return fn(*args, **kwargs)
+            self._depth = 1
+            self.calls += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.total += time.perf_counter() - start
+                self._depth = 0
+
+        return timed
+
+
+class _TimedCodec:
+    """Codec du journal dont le décodage (`loads`) est chronométré."""
+
+    def __init__(self, codec, timer: _Timer):
+        self._codec = codec
+        self.loads = timer.wrap(codec.loads)
+
+    def __getattr__(self, name):
+        return getattr(self._codec, name)
+
+
+class _Hooks:
+    """Enveloppe temporairement les fonctions de décodage JSON et les constructeurs des modèles."""
+
+    def __init__(self, parse: _Timer, hydration: _Timer):
+        self.parse = parse
+        self.hydration = hydration
+        self._saved = []
+
+    def _patch(self, owner, name, value):
+        self._saved.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, value)
+
+    def install(self):
+        import json
+        from chessManager.models import Tournament, TournamentHeader
+
+        self._patch(json, "load", self.parse.wrap(json.load))
+        self._patch(json, "loads", self.parse.wrap(json.loads))
+        self._patch(TournamentHeader, "__init__", self.hydration.wrap(TournamentHeader.__init__))
+        self._patch(Tournament, "from_record", staticmethod(self.hydration.wrap(Tournament.from_record)))
+        journal = sys.modules.get("chessManager.storage.journal")
+        if journal is not None:
+            codec = journal.TournamentJournal.__dict__["codec"]
+            self._patch(
+                journal.TournamentJournal, "codec", property(lambda j: _TimedCodec(codec.fget(j), self.parse))
+            )
+
+    def remove(self):
+        while self._saved:
+            owner, name, value = self._saved.pop()
+            setattr(owner, name, value)
+
+
+def _phase(phases: list, label: str, step):
+    """Exécute une étape du démarrage et enregistre sa durée, ses blocs alloués et ses imports.
+
+    Returns:
+        Any: Le résultat de l'étape.
+    """
+    blocks = sys.getallocatedblocks()
+    modules = len(sys.modules)
+    start = time.perf_counter()
+    result = step()
+    phases.append(
+        {
+            "phase": label,
+            "time": time.perf_counter() - start,
+            "allocated_blocks": sys.getallocatedblocks() - blocks,
+            "modules": len(sys.modules) - modules,
+        }
+    )
+    return result
+
+
+def measure_startup(build_menu) -> dict:
+    """Mesure le démarrage de l'application jusqu'au premier menu (sans l'afficher).
+
+    À appeler avant tout import de l'application : les modules déjà chargés ne
+    sont pas comptés.
+
+    Args:
+        build_menu (Callable): Construit le menu principal à partir du contrôleur
+            (`main.build_main_menu`).
+
+    Returns:
+        dict: Le rapport, sérialisable en JSON : étapes (`phases`), durées en
+        secondes (`imports`, `load`, `json_parse`, `hydration`, `menu`,
+        `total`), blocs alloués, modules importés et modules lourds chargés.
+    """
+    phases = []
+    blocks = sys.getallocatedblocks()
+    modules = len(sys.modules)
+    for label, step in FIRST_MENU_IMPORTS:
+        _phase(phases, f"import {label}", step)
+    imports = sum(p["time"] for p in phases)
+
+    from chessManager.controllers.tournaments_control import TournamentController
+
+    parse, hydration = _Timer(), _Timer()
+    hooks = _Hooks(parse, hydration)
+    hooks.install()
+    try:
+        controller = _phase(phases, "chargement des tournois", TournamentController)
+    finally:
+        hooks.remove()
+    _phase(phases, "menu principal", lambda: build_menu(controller))
+
+    return {
+        "phases": phases,
+        "imports": imports,
+        "load": phases[-2]["time"],
+        "json_parse": parse.total,
+        "json_parse_calls": parse.calls,
+        "hydration": hydration.total,
+        "hydrated_objects": hydration.calls,
+        "menu": phases[-1]["time"],
+        "total": sum(p["time"] for p in phases),
+        "process_cpu": time.process_time(),
+        "allocated_blocks": sys.getallocatedblocks() - blocks,
+        "modules": len(sys.modules) - modules,
+        "tournaments": len(controller.headers),
+        "heavy_modules": [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+
+
+def print_startup_report(report: dict, as_json: bool = False):
+    """Affiche le rapport de démarrage (tableau par étape, ou document JSON).
+
+    Args:
+        report (dict): Le rapport de `measure_startup`.
+        as_json (bool): Écrire le rapport en JSON sur la sortie standard.
+    """
+    import json
+
+    if as_json:
+        print(json.dumps(report, ensure_ascii=False, indent=4))
+        return
+    from tabulate import tabulate
+
+    rows = [
+        [p["phase"], f'{p["time"] * 1000:.2f}', p["allocated_blocks"], p["modules"]]
+        for p in report["phases"]
+    ]
+    rows.append(["total", f'{report["total"] * 1000:.2f}', report["allocated_blocks"], report["modules"]])
+    print(tabulate(rows, headers=["Étape", "Durée (ms)", "Blocs alloués", "Modules importés"]))
+    print(
+        f'\nChargement de {report["tournaments"]} tournoi(s) : '
+        f'décodage JSON {report["json_parse"] * 1000:.2f} ms ({report["json_parse_calls"]} appel(s)), '
+        f'hydratation {report["hydration"] * 1000:.2f} ms ({report["hydrated_objects"]} objet(s))'
+    )
+    print(f'Temps CPU du processus jusqu\'au premier menu : {report["process_cpu"] * 1000:.2f} ms')
+    heavy = ", ".join(report["heavy_modules"]) or "aucun"
+    print(f"Modules lourds chargés : {heavy}")
+
+
+def check_startup(
+    tournaments: int = STARTUP_TOURNAMENTS, repeat: int = 3, budgets: dict = None, seed: int = 0
+) -> dict:
+    """Mesure le démarrage dans des processus neufs et le compare aux budgets.
+
+    Le dossier de données temporaire contient `tournaments` petits tournois.
+    Un premier lancement (non mesuré) écrit le catalogue des tournois : les
+    lancements mesurés suivent le chemin d'un démarrage habituel. Chaque
+    mesure retenue est la meilleure des `repeat` lancements.
+
+    Args:
+        tournaments (int): Nombre de tournois synthétiques.
+        repeat (int): Nombre de lancements mesurés.
+        budgets (dict, optional): Budgets par mesure (défaut : `STARTUP_BUDGETS`).
+        seed (int): Graine du générateur.
+
+    Returns:
+        dict: Les meilleures mesures (`measures`, dont `wall` : durée du
+        processus complet), les budgets et les budgets dépassés (`exceeded`).
+    """
+    import json
+    import subprocess
+    from pathlib import Path
+
+    import constant
+    from chessManager.storage import JsonTournamentStore
+    from chessManager.benchmarks.generator import generate_tournament
+    from chessManager.benchmarks.suite import workspace
+
+    budgets = STARTUP_BUDGETS if budgets is None else budgets
+    command = [sys.executable, str(Path(constant.__file__).with_name("main.py")), "--startup-report", "--json"]
+    with workspace() as folder:
+        store = JsonTournamentStore()
+        with store.transaction():
+            for i in range(tournaments):
+                store.insert_tournament(generate_tournament(16, 4, played_rounds=2, seed=seed + i))
+        store.compact()
+        store.close()
+
+        runs = []
+        for _ in range(repeat + 1):
+            start = time.perf_counter()
+            output = subprocess.run(command, cwd=folder, capture_output=True, check=True, text=True).stdout
+            report = json.loads(output)
+            report["wall"] = time.perf_counter() - start
+            runs.append(report)
+
+    measured = runs[1:]
+    keys = ["imports", "load", "json_parse", "hydration", "menu", "total", "process_cpu", "wall", "allocated_blocks"]
+    measures = {key: min(r[key] for r in measured) for key in keys}
+    measures["modules"] = measured[-1]["modules"]
+    measures["heavy_modules"] = measured[-1]["heavy_modules"]
+    exceeded = []
+    for key, budget in budgets.items():
+        current = measures[key]
+        if (len(current) if isinstance(current, list) else current) > budget:
+            exceeded.append({"name": key, "budget": budget, "current": current})
+    return {"tournaments": tournaments, "measures": measures, "budgets": dict(budgets), "exceeded": exceeded}
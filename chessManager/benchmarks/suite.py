@@ -0,0 +1,252 @@
+import contextlib
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from unittest import mock
+
+from constant import DEFAULT_ENCODING
+from chessManager.models import Tournament
+from chessManager.storage import JsonTournamentStore
+from chessManager.controllers.rounds_control import prepare_next_round, reset_last_round_and_rescore
+from chessManager.controllers.tournaments_control import TournamentController
+from chessManager.views.display_tournament import display_tournament_list, display_tournament_players_list
+from chessManager.views.display_round import display_round_detail, display_tournament_rounds_list
+from chessManager.benchmarks.generator import generate_tournament
+
+# Échelles par défaut : (joueurs, rondes)
+DEFAULT_SCALES = [(100, 5), (1000, 7), (5000, 9)]
+
+# Ratio de temps au-delà duquel une mesure est signalée comme régression
+DEFAULT_THRESHOLD = 1.25
+
+
+@dataclass
+class BenchmarkResult:
+    """Mesure d'une opération à une échelle donnée.
+
+    Attributes:
+        name (str): L'opération mesurée.
+        players (int): Nombre de joueurs du tournoi.
+        rounds (int): Nombre de rondes du tournoi.
+        repeat (int): Nombre d'exécutions chronométrées.
+        best (float): Meilleur temps, en secondes.
+        mean (float): Temps moyen, en secondes.
+        peak_memory (int): Pic d'allocation Python (tracemalloc), en octets.
+    """
+
+    name: str
+    players: int
+    rounds: int
+    repeat: int
+    best: float
+    mean: float
+    peak_memory: int
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Redirige la sortie standard vers /dev/null (les vues affichent beaucoup)."""
+    with open(os.devnull, "w", encoding=DEFAULT_ENCODING) as sink, contextlib.redirect_stdout(sink):
+        yield
+
+
+@contextlib.contextmanager
+def workspace() -> Iterator[Path]:
+    """Place le processus dans un dossier temporaire contenant un dossier Data/ vide.
+
+    Les chemins de `constant` étant relatifs, le stockage et les vues utilisent
+    alors ce dossier sans toucher aux données réelles.
+    """
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="chessManager-bench-") as tmp:
+        (Path(tmp) / "Data").mkdir()
+        os.chdir(tmp)
+        try:
+            yield Path(tmp)
+        finally:
+            os.chdir(previous)
+
+
+def measure(
+    fn: Callable[..., Any], setup: Callable[[], Tuple] = None, repeat: int = 3
+) -> Tuple[List[float], int]:
+    """Chronomètre une fonction, puis mesure son pic mémoire lors d'une exécution à part.
+
+    tracemalloc ralentit fortement l'exécution : il n'est actif que pendant
+    l'exécution supplémentaire dédiée à la mémoire.
+
+    Args:
+        fn (Callable): La fonction mesurée.
+        setup (Callable, optional): Prépare les arguments de `fn` avant chaque
+            exécution (hors chronométrage).
+        repeat (int): Nombre d'exécutions chronométrées.
+
+    Returns:
+        Tuple[List[float], int]: Les temps (secondes) et le pic mémoire (octets).
+    """
+    times = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        with quiet():
+            start = time.perf_counter()
+            fn(*args)
+            times.append(time.perf_counter() - start)
+
+    args = setup() if setup else ()
+    tracemalloc.start()
+    try:
+        with quiet():
+            fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return times, peak
+
+
+def scripted_scores(seed: int) -> Callable[[str], str]:
+    """Remplace `input` pour les saisies de scores : renvoie 0, 0.5 ou 1 au hasard.
+
+    Args:
+        seed (int): Graine du générateur aléatoire.
+
+    Returns:
+        Callable[[str], str]: Une fonction compatible avec `input`.
+    """
+    rng = random.Random(seed)
+    return lambda prompt="": rng.choice(("0", "0.5", "1"))
+
+
+def benchmark_scale(players: int, rounds: int, repeat: int = 3, seed: int = 0) -> List[BenchmarkResult]:
+    """Mesure les chemins critiques sur un tournoi synthétique.
+
+    Le tournoi a toutes ses rondes clôturées sauf la dernière, qui reste à apparier :
+    `prepare_next_round` et `reset_last_round_and_rescore` travaillent donc sur un
+    historique complet.
+
+    Args:
+        players (int): Nombre de joueurs.
+        rounds (int): Nombre de rondes (au moins 2).
+        repeat (int): Nombre d'exécutions chronométrées par opération.
+        seed (int): Graine du générateur.
+
+    Returns:
+        List[BenchmarkResult]: Une mesure par opération.
+    """
+    rounds = max(rounds, 2)
+    tournament = generate_tournament(players, rounds, played_rounds=rounds - 1, seed=seed)
+    record = tournament.to_record()
+
+    def fresh() -> Tuple[Tournament]:
+        return (Tournament.from_record(record),)
+
+    def rescore(t: Tournament):
+        with mock.patch("builtins.input", scripted_scores(seed)):
+            reset_last_round_and_rescore(t)
+
+    with workspace():
+        store = JsonTournamentStore()
+        store.insert_tournament(tournament)
+        store.compact()
+        controller = TournamentController(store=store)
+
+        cases: Dict[str, Tuple[Callable, Optional[Callable]]] = {
+            "Tournament.from_record": (lambda: Tournament.from_record(record), None),
+            "load_tournaments": (lambda: TournamentController(store=JsonTournamentStore()), None),
+            "open_tournament": (
+                lambda c: c.open_tournament(tournament.tournament_id),
+                lambda: (TournamentController(store=JsonTournamentStore()),),
+            ),
+            "save_tournaments": (lambda: controller.save_tournaments(tournament), None),
+            "prepare_next_round": (prepare_next_round, fresh),
+            "reset_last_round_and_rescore": (rescore, fresh),
+            "display_tournament_list": (lambda: display_tournament_list(controller), None),
+            "display_tournament_players_list": (display_tournament_players_list, fresh),
+            "display_tournament_rounds_list": (display_tournament_rounds_list, fresh),
+            "display_round_detail": (display_round_detail, fresh),
+        }
+
+        results = []
+        for name, (fn, setup) in cases.items():
+            times, peak = measure(fn, setup, repeat)
+            results.append(
+                BenchmarkResult(
+                    name=name,
+                    players=players,
+                    rounds=rounds,
+                    repeat=repeat,
+                    best=min(times),
+                    mean=sum(times) / len(times),
+                    peak_memory=peak,
+                )
+            )
+        store.close()
+    return results
+
+
+def run_benchmarks(scales: List[Tuple[int, int]] = None, repeat: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """Exécute la suite complète à plusieurs échelles.
+
+    Args:
+        scales (List[Tuple[int, int]], optional): Couples (joueurs, rondes).
+        repeat (int): Nombre d'exécutions chronométrées par opération.
+        seed (int): Graine du générateur.
+
+    Returns:
+        Dict[str, Any]: Le rapport, sérialisable en JSON.
+    """
+    results = []
+    for players, rounds in scales or DEFAULT_SCALES:
+        results.extend(benchmark_scale(players, rounds, repeat, seed))
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": [asdict(r) for r in results],
+    }
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """Compare deux rapports et liste les opérations devenues plus lentes.
+
+    Les mesures sont appariées par (opération, joueurs, rondes) ; le meilleur
+    temps est comparé, moins sensible au bruit que la moyenne.
+
+    Args:
+        current (Dict[str, Any]): Le rapport à vérifier.
+        baseline (Dict[str, Any]): Le rapport de référence.
+        threshold (float): Ratio actuel / référence au-delà duquel signaler.
+
+    Returns:
+        List[Dict[str, Any]]: Les régressions, avec les deux temps et le ratio.
+    """
+    reference = {(r["name"], r["players"], r["rounds"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in current.get("results", []):
+        old = reference.get((r["name"], r["players"], r["rounds"]))
+        if old is None or old["best"] <= 0:
+            continue
+        ratio = r["best"] / old["best"]
+        if ratio > threshold:
+            regressions.append(
+                {
+                    "name": r["name"],
+                    "players": r["players"],
+                    "rounds": r["rounds"],
+                    "baseline": old["best"],
+                    "current": r["best"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
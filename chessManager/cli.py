@@ -0,0 +1,287 @@
+"""Commandes non interactives : python -m chessManager.cli [--json] <commande> ...
+
+Commandes :
+    list                                   en-têtes de tous les tournois
+    create NOM --start-date --end-date     créer un tournoi (dates AAAA-MM-JJ)
+    import ID FICHIER                      inscrire les joueurs d'un fichier JSON/NDJSON
+    start ID                               apparier la première ronde
+    pair [ID ...]                          apparier la ronde en cours (tous les tournois par défaut)
+    results ID FICHIER                     saisir les résultats de la ronde en cours (CSV/JSON/NDJSON)
+    standings ID                           classement et départages
+    export ID [--output FICHIER]           exporter le tournoi complet en JSON
+
+Les commandes passent par les mêmes contrôleurs que les menus. Avec --json, la
+sortie standard ne contient qu'un document JSON ; les messages des
+contrôleurs sont alors écrits sur la sortie d'erreur. Code de sortie : 0 en
+cas de succès, 1 si la commande a échoué (tournoi introuvable, fichier
+illisible, modification refusée), 2 pour une commande mal formée.
+
+Chaque commande importe ce dont elle a besoin : `list` ne lit que le
+catalogue des tournois, sans contrôleur, sans NumPy ni décodage de la base.
+"""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import nullcontext, redirect_stdout
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class CommandError(Exception):
+    """Échec d'une commande : le message est affiché et le code de sortie vaut 1."""
+
+
+def _date(value: str) -> str:
+    """Valide une date AAAA-MM-JJ (format des dates saisies dans les menus)."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Date invalide : {value} (attendu AAAA-MM-JJ)")
+
+
+def _controller():
+    """Instancie le contrôleur des tournois (import différé : NumPy, registre, appariement)."""
+    from chessManager.controllers.tournaments_control import TournamentController
+
+    return TournamentController()
+
+
+def _open(controller, tournament_id: int):
+    """Ouvre un tournoi par son identifiant.
+
+    Raises:
+        CommandError: Si le tournoi n'existe pas ou est illisible.
+    """
+    if all(h.tournament_id != tournament_id for h in controller.list_tournaments()):
+        raise CommandError(f"Tournoi introuvable : {tournament_id}")
+    try:
+        return controller.open_tournament(tournament_id)
+    except ValueError as e:
+        raise CommandError(f"Tournoi illisible : {e}")
+
+
+def _table(headers, rows):
+    """Affiche un tableau d'un bloc (sans navigation : la sortie peut être lue par un script)."""
+    from chessManager.views.pager import paginate
+
+    paginate(lambda: rows, headers, interactive=False)
+
+
+def list_command(args) -> Dict[str, Any]:
+    """En-têtes de tous les tournois, lus dans le catalogue."""
+    from dataclasses import asdict
+    from chessManager.storage import TournamentCatalog, open_store
+
+    store = open_store()
+    headers = TournamentCatalog(store.source_paths()).headers(store)
+    return {"tournaments": [asdict(h) for h in headers]}
+
+
+def print_list(payload: Dict[str, Any]):
+    rows = [
+        [t["tournament_id"], t["name"], t["location"], t["start_date"], t["end_date"],
+         f'{t["rounds_played"]}/{t["number_of_rounds"]}', t["player_count"], t["status"]]
+        for t in payload["tournaments"]
+    ]
+    if not rows:
+        print("⚠️ Aucun tournoi disponible.")
+        return
+    _table(["ID", "Nom", "Lieu", "Début", "Fin", "Rondes", "Joueurs", "Statut"], rows)
+
+
+def create_command(args) -> Dict[str, Any]:
+    """Crée un tournoi."""
+    from dataclasses import asdict
+
+    tournament = _controller().create_tournament(
+        args.name, args.location, args.start_date, args.end_date, args.rounds, args.description
+    )
+    return {"tournament": asdict(tournament.header())}
+
+
+def import_command(args) -> Dict[str, Any]:
+    """Inscrit les joueurs d'un fichier JSON/NDJSON (doublons ignorés)."""
+    controller = _controller()
+    tournament = _open(controller, args.tournament_id)
+    added = controller.add_players_from_json(tournament, filepath=args.file)
+    if added is None:
+        raise CommandError(f"Import des joueurs de {args.file} impossible.")
+    return {"tournament_id": tournament.tournament_id, "added": added, "players": len(tournament.players)}
+
+
+def start_command(args) -> Dict[str, Any]:
+    """Apparie la première ronde d'un tournoi."""
+    from chessManager.controllers.rounds_control import round_summary
+
+    controller = _controller()
+    tournament = _open(controller, args.tournament_id)
+    first_round = controller.start_tournament(tournament)
+    if first_round is None:
+        raise CommandError(f"Premier round du tournoi {tournament.tournament_id} non apparié.")
+    return {"tournament_id": tournament.tournament_id, "round": round_summary(first_round)}
+
+
+def pair_command(args) -> Dict[str, Any]:
+    """Apparie la ronde en cours des tournois qui l'attendent (voir `pair_active_tournaments`)."""
+    from dataclasses import asdict
+    from chessManager.views.display_round import display_pairing_report
+
+    report = _controller().pair_active_tournaments(args.workers, args.tournament_ids or None)
+    if not args.json:
+        display_pairing_report(report, interactive=False)
+    if args.tournament_ids and not report.sections:
+        raise CommandError("Aucun des tournois demandés n'a été apparié.")
+    return asdict(report)
+
+
+def results_command(args) -> Dict[str, Any]:
+    """Saisit les résultats de la ronde en cours depuis un fichier."""
+    from dataclasses import asdict
+
+    controller = _controller()
+    tournament = _open(controller, args.tournament_id)
+    report = controller.import_round_results(tournament, args.file)
+    if report is None:
+        raise CommandError(f"Résultats de {args.file} non enregistrés.")
+    return {"tournament_id": tournament.tournament_id, **asdict(report)}
+
+
+def standings_command(args) -> Dict[str, Any]:
+    """Classement et départages d'un tournoi."""
+    from chessManager.controllers.tie_breaks import standings_rows
+
+    tournament = _open(_controller(), args.tournament_id)
+    return {"tournament_id": tournament.tournament_id, "standings": standings_rows(tournament)}
+
+
+def print_standings(payload: Dict[str, Any]):
+    rows = [
+        [r["rank"], r["name"], r["national_chess_id"], r["score"], r["buchholz"], r["median_buchholz"],
+         r["sonneborn_berger"], r["progressive"]]
+        for r in payload["standings"]
+    ]
+    if not rows:
+        print("⚠️ Aucun joueur dans ce tournoi.")
+        return
+    _table(["Rang", "Nom", "Identifiant", "Points", "Buchholz", "Buchholz médian", "Sonneborn-Berger", "Progressif"],
+           rows)
+
+
+def export_command(args) -> Dict[str, Any]:
+    """Exporte un tournoi complet (format des fichiers de tournois) sur la sortie standard ou dans un fichier."""
+    from constant import DEFAULT_ENCODING
+
+    tournament = _open(_controller(), args.tournament_id)
+    record = tournament.to_record()
+    if args.output is None:
+        return record
+    with open(args.output, "w", encoding=DEFAULT_ENCODING) as f:
+        json.dump(record, f, ensure_ascii=False, indent=4)
+    print(f"✅ Tournoi « {tournament.name} » exporté dans {args.output}")
+    return {"tournament_id": tournament.tournament_id, "output": args.output}
+
+
+def print_json(payload: Any):
+    print(json.dumps(payload, ensure_ascii=False, indent=4))
+
+
+# Commande → (exécution, affichage texte du résultat ; None : les messages des contrôleurs suffisent)
+COMMANDS: Dict[str, Any] = {
+    "list": (list_command, print_list),
+    "create": (create_command, None),
+    "import": (import_command, None),
+    "start": (start_command, None),
+    "pair": (pair_command, None),
+    "results": (results_command, None),
+    "standings": (standings_command, print_standings),
+    "export": (export_command, None),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments (une sous-commande par opération)."""
+    # --json est accepté avant ou après la sous-commande
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", default=argparse.SUPPRESS, help="sortie JSON")
+
+    parser = argparse.ArgumentParser(
+        prog="python -m chessManager.cli", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--json", action="store_true", help="sortie JSON (messages sur la sortie d'erreur)")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="commande")
+
+    commands.add_parser("list", parents=[common], help="en-têtes de tous les tournois")
+
+    create = commands.add_parser("create", parents=[common], help="créer un tournoi")
+    create.add_argument("name", help="nom du tournoi")
+    create.add_argument("--location", default="", help="lieu")
+    create.add_argument("--start-date", type=_date, required=True, help="date de début (AAAA-MM-JJ)")
+    create.add_argument("--end-date", type=_date, required=True, help="date de fin (AAAA-MM-JJ)")
+    create.add_argument("--rounds", type=int, default=4, help="nombre de rondes (défaut : 4)")
+    create.add_argument("--description", help="description")
+
+    import_ = commands.add_parser("import", parents=[common], help="inscrire les joueurs d'un fichier JSON/NDJSON")
+    import_.add_argument("tournament_id", type=int, help="identifiant du tournoi")
+    import_.add_argument("file", help="fichier de joueurs")
+
+    start = commands.add_parser("start", parents=[common], help="apparier la première ronde")
+    start.add_argument("tournament_id", type=int, help="identifiant du tournoi")
+
+    pair = commands.add_parser("pair", parents=[common], help="apparier la ronde en cours")
+    pair.add_argument("tournament_ids", type=int, nargs="*", help="tournois à apparier (défaut : tous)")
+    pair.add_argument("--workers", type=int, help="processus d'appariement (défaut : constant.PAIRING_WORKERS)")
+
+    results = commands.add_parser("results", parents=[common], help="saisir les résultats de la ronde en cours")
+    results.add_argument("tournament_id", type=int, help="identifiant du tournoi")
+    results.add_argument("file", help="fichier de résultats CSV/JSON/NDJSON")
+
+    standings = commands.add_parser("standings", parents=[common], help="classement et départages")
+    standings.add_argument("tournament_id", type=int, help="identifiant du tournoi")
+
+    export = commands.add_parser("export", parents=[common], help="exporter un tournoi en JSON")
+    export.add_argument("tournament_id", type=int, help="identifiant du tournoi")
+    export.add_argument("--output", help="fichier écrit (défaut : sortie standard)")
+    return parser
+
+
+def run(args) -> int:
+    """Exécute une commande analysée et affiche son résultat.
+
+    Returns:
+        int: Le code de sortie.
+    """
+    execute, render = COMMANDS[args.command]
+    out = sys.stdout
+    payload: Optional[Any] = None
+    error = None
+    # En JSON, les messages des contrôleurs ne doivent pas se mêler au document
+    with redirect_stdout(sys.stderr) if args.json else nullcontext():
+        try:
+            payload = execute(args)
+        except CommandError as e:
+            error = str(e)
+    if error is not None:
+        if args.json:
+            print(json.dumps({"error": error}, ensure_ascii=False), file=out)
+        print(f"⚠️ {error}", file=sys.stderr)
+        return 1
+    if args.json or (args.command == "export" and args.output is None):
+        print_json(payload)
+    elif render is not None:
+        render(payload)
+    return 0
+
+
+def main(argv=None) -> int:
+    try:
+        return run(build_parser().parse_args(argv))
+    except BrokenPipeError:
+        # Lecteur fermé avant la fin (ex. `| head`) : la suite de la sortie est abandonnée
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+"""Appariement en parallèle de la ronde en cours de plusieurs tournois (sections).
+
+Un tournoi est à apparier si sa ronde en cours (`get_current_round`) n'a
+encore aucun match. Chaque section est envoyée, sous forme d'enregistrement
+brut, à un processus de `ProcessPoolExecutor` qui reconstruit le tournoi et
+l'apparie avec les fonctions habituelles (`pair_first_round` pour la
+première ronde, `prepare_next_round` ensuite). Le processus renvoie les
+appariements par identifiant de joueur (`SectionPairing`) ; ils sont
+appliqués aux tournois du processus principal, qui les sauvegarde ensuite en
+une seule validation (voir `TournamentController.pair_active_tournaments`).
+
+Les appariements ne dépendent que de l'état du tournoi envoyé : une section
+modifiée entre-temps (version différente, ronde déjà appariée) est ignorée.
+"""
+
+import io
+import os
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from chessManager.models import Tournament, Match
+from chessManager.controllers.rounds_control import pair_first_round, prepare_next_round
+
+
+@dataclass
+class SectionPairing:
+    """Appariements d'une section calculés par un processus du pool.
+
+    Attributes:
+        tournament_id (int): Le tournoi apparié.
+        name (str): Le nom du tournoi.
+        version (int): La version du tournoi sur laquelle reposent les appariements.
+        round_number (int): La ronde appariée.
+        pairs (List[Tuple[str, str]]): Identifiants nationaux (blancs, noirs) de chaque match.
+        bye (Optional[str]): Identifiant du joueur exempté, s'il y en a un.
+        messages (List[str]): Messages affichés pendant l'appariement.
+        load_time (float): Durée de reconstruction du tournoi, en secondes.
+        pairing_time (float): Durée de l'appariement, en secondes.
+    """
+
+    tournament_id: int
+    name: str
+    version: int
+    round_number: int
+    pairs: List[Tuple[str, str]] = field(default_factory=list)
+    bye: Optional[str] = None
+    messages: List[str] = field(default_factory=list)
+    load_time: float = 0.0
+    pairing_time: float = 0.0
+
+
+@dataclass
+class BatchPairingReport:
+    """Bilan d'un appariement groupé.
+
+    Attributes:
+        sections (List[SectionPairing]): Les sections appariées et sauvegardées.
+        skipped (List[str]): Noms des sections non appariées (modifiées entre-temps,
+            sauvegarde refusée, pas assez de joueurs).
+        workers (int): Nombre de processus utilisés (0 : appariement dans ce processus).
+        elapsed (float): Durée totale, sauvegarde comprise, en secondes.
+        save_time (float): Durée de la sauvegarde groupée, en secondes.
+    """
+
+    sections: List[SectionPairing] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    workers: int = 0
+    elapsed: float = 0.0
+    save_time: float = 0.0
+
+
+def needs_pairing(tournament: Tournament) -> bool:
+    """Indique si la ronde en cours d'un tournoi attend ses appariements.
+
+    Args:
+        tournament (Tournament): Le tournoi à examiner.
+
+    Returns:
+        bool: True si le tournoi n'est pas terminé et que sa ronde en cours n'a aucun match.
+    """
+    rnd = tournament.get_current_round()
+    return rnd is not None and not rnd.matches
+
+
+def pair_section(record: Dict[str, Any]) -> Optional[SectionPairing]:
+    """Reconstruit un tournoi et apparie sa ronde en cours (exécuté dans un processus du pool).
+
+    Args:
+        record (Dict[str, Any]): L'enregistrement du tournoi (`Tournament.to_record`).
+
+    Returns:
+        Optional[SectionPairing]: Les appariements, ou None si la ronde n'a pas pu
+        être appariée (pas assez de joueurs, ronde déjà appariée).
+    """
+    start = time.perf_counter()
+    tournament = Tournament.from_record(record)
+    loaded = time.perf_counter()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        rnd = tournament.get_current_round()
+        if rnd is None or rnd.matches:
+            return None
+        rnd = pair_first_round(tournament) if rnd.round_number == 1 else prepare_next_round(tournament)
+    paired = time.perf_counter()
+    if rnd is None or not rnd.matches:
+        return None
+    return SectionPairing(
+        tournament_id=tournament.tournament_id,
+        name=tournament.name,
+        version=tournament.version,
+        round_number=rnd.round_number,
+        pairs=[(m.white_player.national_chess_id, m.black_player.national_chess_id) for m in rnd.matches],
+        bye=rnd.bye,
+        messages=output.getvalue().splitlines(),
+        load_time=loaded - start,
+        pairing_time=paired - loaded,
+    )
+
+
+def pair_sections(
+    tournaments: List[Tournament], workers: int = None
+) -> Tuple[List[Optional[SectionPairing]], int]:
+    """Apparie la ronde en cours de plusieurs tournois en parallèle.
+
+    Une seule section est appariée dans ce processus : le démarrage du pool
+    coûterait plus que l'appariement.
+
+    Args:
+        tournaments (List[Tournament]): Les tournois à apparier (voir `needs_pairing`).
+        workers (int, optional): Nombre de processus (défaut : nombre de cœurs).
+
+    Returns:
+        Tuple[List[Optional[SectionPairing]], int]: Les appariements, dans l'ordre
+        des tournois, et le nombre de processus utilisés (0 : aucun pool).
+    """
+    records = [t.to_record() for t in tournaments]
+    workers = min(workers or os.cpu_count() or 1, len(records))
+    if workers <= 1:
+        return [pair_section(record) for record in records], 0
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(pair_section, records)), workers
+
+
+def apply_pairing(tournament: Tournament, pairing: SectionPairing) -> bool:
+    """Applique à un tournoi les appariements calculés par un processus du pool.
+
+    Reproduit les effets de `pair_first_round` (scores remis à zéro, ronde en
+    cours) et de `prepare_next_round` (exemption créditée, matchs ajoutés).
+
+    Args:
+        tournament (Tournament): Le tournoi du processus principal.
+        pairing (SectionPairing): Les appariements de sa ronde en cours.
+
+    Returns:
+        bool: False si le tournoi a changé depuis l'envoi (rien n'est appliqué).
+    """
+    rnd = tournament.get_round(pairing.round_number)
+    if tournament.version != pairing.version or rnd is None or rnd.matches:
+        return False
+    if pairing.round_number == 1:
+        tournament.reset_scores()
+        tournament.current_round = rnd
+    if pairing.bye is not None:
+        tournament.record_bye(rnd, tournament.get_player(pairing.bye))
+    for white, black in pairing.pairs:
+        rnd.add_match(
+            Match(
+                white_player=tournament.get_player(white),
+                white_player_score=0.0,
+                black_player=tournament.get_player(black),
+                black_player_score=0.0,
+            )
+        )
+    return True
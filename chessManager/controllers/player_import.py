@@ -0,0 +1,244 @@
+"""Import en flux de joueurs depuis un export fédéral (NDJSON ou JSON).
+
+Le fichier n'est jamais chargé en entier : les enregistrements sont lus un à un
+(ligne par ligne pour le NDJSON, par décodage incrémental du tableau pour le
+format `{"players": [...]}` ou une liste JSON), regroupés par lots, dédoublonnés
+contre l'index des joueurs du tournoi, puis sauvegardés lot par lot.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+from constant import DEFAULT_ENCODING, IMPORT_BATCH_SIZE
+from chessManager.models import Tournament, Player
+from chessManager.storage import TournamentStore
+from chessManager.storage.codec import get_codec
+
+# Taille des blocs lus pour le décodage incrémental
+READ_CHUNK_SIZE = 1 << 16
+
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+
+# Champs obligatoires d'un enregistrement de joueur (comme pour l'inscription via l'API)
+REQUIRED_PLAYER_FIELDS = ("name", "birthdate", "national_chess_id")
+
+
+@dataclass
+class PlayerImportReport:
+    """Bilan d'un import de joueurs.
+
+    Attributes:
+        read (int): Enregistrements lus.
+        added (int): Joueurs ajoutés au tournoi.
+        duplicates (int): Enregistrements ignorés (identifiant déjà inscrit).
+        invalid (int): Enregistrements ignorés (illisibles, ou sans nom, date de naissance ou identifiant).
+        batches (int): Lots sauvegardés.
+        elapsed (float): Durée totale, en secondes.
+    """
+
+    read: int = 0
+    added: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Enregistrements lus par seconde."""
+        return self.read / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _ChunkedReader:
+    """Tampon de lecture par blocs pour le décodage JSON incrémental."""
+
+    def __init__(self, f: TextIO, chunk_size: int = READ_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> bool:
+        """Ajoute un bloc au tampon ; retourne False en fin de fichier."""
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Retourne le prochain caractère non blanc (sans le consommer), "" en fin de fichier."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consomme le prochain caractère non blanc, qui doit appartenir à `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"JSON inattendu : {char or 'fin de fichier'} (attendu : {chars})")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Décode la prochaine valeur JSON, en lisant d'autres blocs si elle est incomplète."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # Un nombre en fin de tampon peut être tronqué : on s'assure qu'il est complet
+            if end == len(self.buffer) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self) -> Iterator[Any]:
+        """Décode un à un les éléments du tableau dont le `[` vient d'être consommé."""
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_json_players(f: TextIO, key: str = "players") -> Iterator[Any]:
+    """Décode en flux les joueurs d'un fichier `{"players": [...]}` ou d'une liste JSON.
+
+    Les autres clés de l'objet racine sont lues puis ignorées.
+
+    Args:
+        f (TextIO): Le fichier ouvert en lecture.
+        key (str): La clé du tableau de joueurs.
+
+    Yields:
+        Any: Chaque enregistrement du tableau.
+
+    Raises:
+        ValueError: Si le fichier n'a pas la structure attendue.
+    """
+    reader = _ChunkedReader(f)
+    if reader.expect("[{") == "[":
+        yield from reader.array_items()
+        return
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.pos += 1
+            yield from reader.array_items()
+        else:
+            reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+def iter_player_records(filepath: Path) -> Iterator[Any]:
+    """Lit en flux les enregistrements d'un fichier de joueurs selon son extension.
+
+    Une ligne NDJSON illisible est renvoyée telle quelle (chaîne) pour être
+    comptée comme invalide plutôt que d'interrompre l'import.
+
+    Args:
+        filepath (Path): Le fichier NDJSON (.ndjson, .jsonl) ou JSON.
+
+    Yields:
+        Any: Chaque enregistrement de joueur.
+    """
+    codec = get_codec()
+    with open(filepath, "r", encoding=DEFAULT_ENCODING) as f:
+        if filepath.suffix.lower() in NDJSON_SUFFIXES:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield codec.loads(line)
+                except json.JSONDecodeError:
+                    yield line
+        else:
+            yield from iter_json_players(f)
+
+
+def print_progress(report: PlayerImportReport):
+    """Affiche l'avancement d'un import (appelé après chaque lot)."""
+    print(
+        f"… {report.read} lus, {report.added} ajoutés, {report.duplicates} doublons "
+        f"({report.throughput:.0f} joueurs/s)"
+    )
+
+
+def stream_players(
+    tournament: Tournament,
+    store: TournamentStore,
+    filepath,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: Optional[Callable[[PlayerImportReport], None]] = print_progress,
+) -> PlayerImportReport:
+    """Importe en flux les joueurs d'un fichier dans un tournoi.
+
+    Chaque lot est dédoublonné contre l'index des joueurs du tournoi (en O(1)
+    par joueur), ajouté au tournoi puis sauvegardé dans sa propre transaction :
+    un import interrompu conserve les lots déjà traités.
+
+    Args:
+        tournament (Tournament): Le tournoi destinataire.
+        store (TournamentStore): Le backend de stockage.
+        filepath (str | Path): Le fichier NDJSON ou JSON.
+        batch_size (int): Nombre d'enregistrements par lot.
+        progress (Callable, optional): Appelé avec le bilan après chaque lot.
+
+    Returns:
+        PlayerImportReport: Le bilan de l'import.
+    """
+    report = PlayerImportReport()
+    start = time.perf_counter()
+
+    def commit(batch: List[Dict[str, Any]]):
+        added = []
+        for record in batch:
+            player = Player.from_record(record)
+            if tournament.get_player(player.national_chess_id) is not None:
+                report.duplicates += 1
+                continue
+            tournament.add_player(player)
+            added.append(player)
+        with store.transaction():
+            store.save_players(tournament, added)
+        report.added += len(added)
+        report.batches += 1
+        report.elapsed = time.perf_counter() - start
+        if progress is not None:
+            progress(report)
+
+    batch: List[Dict[str, Any]] = []
+    for record in iter_player_records(Path(filepath)):
+        report.read += 1
+        if not isinstance(record, dict) or not all(record.get(key) for key in REQUIRED_PLAYER_FIELDS):
+            report.invalid += 1
+            continue
+        batch.append(record)
+        if len(batch) >= batch_size:
+            commit(batch)
+            batch = []
+    if batch:
+        commit(batch)
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,327 @@
+"""Saisie groupée des résultats d'une ronde depuis un fichier CSV, JSON ou NDJSON.
+
+Chaque ligne désigne un match soit par son numéro d'échiquier (`board`,
+1-indexé dans l'ordre de la ronde), soit par l'identifiant national d'un des
+joueurs (`white` et/ou `black`), et donne le score des blancs (`result`).
+Le score des noirs (`black_result`) est facultatif : il vaut 1 - `result`
+pour une partie décisive et 0.5 pour une nulle, comme en saisie interactive.
+
+Exemple CSV :
+    board,white,black,result
+    1,AB12345,CD67890,1
+    2,,,0.5
+
+Formats JSON acceptés : une liste de lignes ou `{"results": [...]}` ; NDJSON :
+une ligne JSON par résultat.
+
+Toutes les lignes sont validées en une passe contre `VALID_RESULTS` ; les
+lignes rejetées sont rapportées sans empêcher l'application des autres. Un
+résultat vide (None) laisse l'échiquier en attente. La ronde n'est clôturée
+que si chaque échiquier a un résultat, reçu dans ce fichier ou lors d'une
+saisie précédente.
+"""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from constant import DEFAULT_ENCODING, VALID_RESULTS
+from chessManager.models import Tournament, Match, Round
+from chessManager.controllers.rounds_control import prepare_next_round
+
+# Extensions reconnues par format
+CSV_SUFFIXES = {".csv"}
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+JSON_SUFFIXES = {".json"}
+
+
+@dataclass
+class RejectedRow:
+    """Ligne du fichier de résultats refusée à la validation.
+
+    Attributes:
+        line (int): Numéro de ligne (CSV/NDJSON) ou position (JSON, 1-indexée).
+        reason (str): Motif du refus.
+        data (Dict[str, Any]): Contenu brut de la ligne.
+    """
+
+    line: int
+    reason: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ResultImportReport:
+    """Bilan d'une saisie groupée.
+
+    Attributes:
+        round_number (Optional[int]): La ronde concernée.
+        applied (int): Nombre de matchs mis à jour.
+        pending (List[int]): Échiquiers sans résultat (ronde non clôturée).
+        rejected (List[RejectedRow]): Lignes refusées.
+        closed (bool): True si la ronde a été clôturée.
+    """
+
+    round_number: Optional[int] = None
+    applied: int = 0
+    pending: List[int] = field(default_factory=list)
+    rejected: List[RejectedRow] = field(default_factory=list)
+    closed: bool = False
+
+
+def read_rows(filepath: Path) -> Iterator[Tuple[int, Any]]:
+    """Lit les lignes d'un fichier de résultats selon son extension.
+
+    Une ligne NDJSON illisible est renvoyée telle quelle (chaîne) pour être
+    rejetée par la validation plutôt que d'interrompre la lecture.
+
+    Args:
+        filepath (Path): Le fichier CSV, JSON ou NDJSON.
+
+    Yields:
+        Tuple[int, Any]: (numéro de ligne, contenu de la ligne).
+
+    Raises:
+        ValueError: Si l'extension n'est pas reconnue, ou si un fichier JSON
+            ne contient ni liste ni {"results": [...]}.
+    """
+    suffix = filepath.suffix.lower()
+    with open(filepath, "r", encoding=DEFAULT_ENCODING, newline="") as f:
+        if suffix in CSV_SUFFIXES:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {k: (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
+        elif suffix in NDJSON_SUFFIXES:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError:
+                    yield number, line.rstrip("\n")
+        elif suffix in JSON_SUFFIXES:
+            data = json.load(f)
+            rows = data.get("results", []) if isinstance(data, dict) else data
+            if not isinstance(rows, list):
+                raise ValueError('Résultats attendus : liste ou {"results": [...]}')
+            yield from enumerate(rows, start=1)
+        else:
+            raise ValueError(f"Format de résultats non reconnu : {filepath.suffix} (csv, json, ndjson)")
+
+
+def normalize_result(value: Any) -> Optional[str]:
+    """Ramène un score lu dans un fichier à la forme de `VALID_RESULTS`.
+
+    Args:
+        value (Any): Le score brut (nombre, chaîne, vide).
+
+    Returns:
+        Optional[str]: "0", "0.5", "1", None (vide) ou la valeur brute si elle
+        n'est pas numérique (elle sera refusée par la validation).
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    try:
+        return f"{float(value):g}"
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def has_result(match: Match) -> bool:
+    """Indique si un match a déjà un résultat saisi.
+
+    Un match fraîchement apparié porte 0-0 (ou aucun score) ; un résultat saisi
+    totalise toujours 1 point.
+
+    Args:
+        match (Match): Le match concerné.
+
+    Returns:
+        bool: True si un résultat a été enregistré.
+    """
+    return (match.white_player_score or 0.0) + (match.black_player_score or 0.0) == 1
+
+
+def _locate(row: Dict[str, Any], rnd: Round, seats: Dict[str, Tuple[int, str]]) -> int:
+    """Retrouve l'index du match désigné par une ligne.
+
+    Args:
+        row (Dict[str, Any]): La ligne de résultats.
+        rnd (Round): La ronde en cours.
+        seats (Dict[str, Tuple[int, str]]): identifiant → (index du match, couleur).
+
+    Returns:
+        int: L'index du match dans la ronde.
+
+    Raises:
+        ValueError: Si le match est introuvable ou si les références se contredisent.
+    """
+    board = row.get("board")
+    white = row.get("white") or None
+    black = row.get("black") or None
+    index = None
+
+    if board not in (None, ""):
+        try:
+            index = int(board) - 1
+        except (TypeError, ValueError):
+            raise ValueError(f"numéro d'échiquier invalide : {board}")
+        if not 0 <= index < len(rnd.matches):
+            raise ValueError(f"échiquier {board} inexistant (1 à {len(rnd.matches)})")
+
+    for player_id, color in ((white, "W"), (black, "B")):
+        if player_id is None:
+            continue
+        seat = seats.get(str(player_id))
+        if seat is None:
+            raise ValueError(f"joueur {player_id} absent des appariements de la ronde")
+        if seat[1] != color:
+            raise ValueError(f"joueur {player_id} n'a pas les {'blancs' if color == 'W' else 'noirs'}")
+        if index is not None and seat[0] != index:
+            raise ValueError(f"joueur {player_id} ne joue pas sur l'échiquier {index + 1}")
+        index = seat[0]
+
+    if index is None:
+        raise ValueError("ni échiquier (board) ni joueur (white/black) indiqué")
+    return index
+
+
+def _scores(row: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """Valide les scores d'une ligne contre `VALID_RESULTS`.
+
+    Args:
+        row (Dict[str, Any]): La ligne de résultats.
+
+    Returns:
+        Optional[Tuple[float, float]]: (blancs, noirs), ou None si le résultat est vide.
+
+    Raises:
+        ValueError: Si un score n'est pas autorisé ou si le total n'est pas 1.
+    """
+    white = normalize_result(row.get("result"))
+    black = normalize_result(row.get("black_result"))
+    for value in (white, black):
+        if value not in VALID_RESULTS:
+            raise ValueError(f"résultat invalide : {value} (autorisés : 0, 0.5, 1)")
+    if white is None:
+        if black is not None:
+            raise ValueError("score des noirs sans score des blancs")
+        return None
+    white_score = float(white)
+    black_score = float(black) if black is not None else (1 - white_score if white_score in (0, 1) else white_score)
+    if white_score + black_score != 1:
+        raise ValueError(f"scores incohérents : {white}-{black}")
+    return white_score, black_score
+
+
+def validate_results(
+    tournament: Tournament, rows
+) -> Tuple[Optional[Round], List[Tuple[Match, float, float]], List[int], List[RejectedRow]]:
+    """Valide en une passe les lignes de résultats de la ronde en cours.
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+        rows (Iterable[Tuple[int, Any]]): (numéro de ligne, contenu) à valider.
+
+    Returns:
+        Tuple: la ronde en cours, les résultats acceptés (match, blancs, noirs),
+        les échiquiers restés sans résultat et les lignes rejetées.
+    """
+    rnd = tournament.get_current_round()
+    if rnd is None or not rnd.matches:
+        return rnd, [], [], [RejectedRow(0, "aucun match à saisir dans la ronde en cours")]
+
+    seats: Dict[str, Tuple[int, str]] = {}
+    for idx, match in enumerate(rnd.matches):
+        seats[match.white_player.national_chess_id] = (idx, "W")
+        seats[match.black_player.national_chess_id] = (idx, "B")
+
+    accepted: Dict[int, Tuple[Match, float, float]] = {}
+    seen = set()
+    rejected = []
+    for line, row in rows:
+        if not isinstance(row, dict):
+            rejected.append(RejectedRow(line, "ligne illisible", {"raw": row}))
+            continue
+        try:
+            index = _locate(row, rnd, seats)
+            if index in seen:
+                raise ValueError(f"échiquier {index + 1} déjà renseigné")
+            scores = _scores(row)
+        except ValueError as e:
+            rejected.append(RejectedRow(line, str(e), row))
+            continue
+        seen.add(index)
+        if scores is not None:
+            accepted[index] = (rnd.matches[index], *scores)
+
+    pending = [
+        idx + 1 for idx, match in enumerate(rnd.matches) if idx not in accepted and not has_result(match)
+    ]
+    return rnd, list(accepted.values()), pending, rejected
+
+
+def ingest_round_results(tournament: Tournament, filepath) -> ResultImportReport:
+    """Applique les résultats d'un fichier à la ronde en cours (voir `apply_round_results`).
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+        filepath (str | Path): Le fichier de résultats.
+
+    Returns:
+        ResultImportReport: Le bilan de la saisie.
+    """
+    return apply_round_results(tournament, read_rows(Path(filepath)))
+
+
+def apply_round_results(tournament: Tournament, rows) -> ResultImportReport:
+    """Applique des lignes de résultats à la ronde en cours.
+
+    Les résultats valides sont appliqués en une seule mise à jour du registre
+    des points. Si tous les échiquiers sont renseignés, la ronde est clôturée et
+    la suivante appariée. Rien n'est sauvegardé ici (voir le contrôleur).
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+        rows (Iterable[Tuple[int, Any]]): (numéro de ligne, contenu), au format
+            des fichiers de résultats.
+
+    Returns:
+        ResultImportReport: Le bilan de la saisie.
+    """
+    rnd, accepted, pending, rejected = validate_results(tournament, rows)
+    report = ResultImportReport(
+        round_number=rnd.round_number if rnd else None, applied=len(accepted), pending=pending, rejected=rejected
+    )
+    if rnd is None or not rnd.matches:
+        return report
+
+    tournament.record_results(rnd, accepted)
+    if not pending:
+        rnd.end_round()
+        report.closed = True
+        prepare_next_round(tournament)
+    return report
+
+
+def write_error_report(rejected: List[RejectedRow], filepath) -> Path:
+    """Écrit les lignes rejetées dans un fichier CSV (ligne, motif, contenu).
+
+    Args:
+        rejected (List[RejectedRow]): Les lignes rejetées.
+        filepath (str | Path): Le fichier de résultats d'origine ; le rapport est
+            écrit à côté, suffixé de `.rejected.csv`.
+
+    Returns:
+        Path: Le chemin du rapport.
+    """
+    path = Path(filepath)
+    report_path = path.with_name(f"{path.stem}.rejected.csv")
+    with open(report_path, "w", encoding=DEFAULT_ENCODING, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["line", "reason", "data"])
+        for row in rejected:
+            writer.writerow([row.line, row.reason, json.dumps(row.data, ensure_ascii=False)])
+    return report_path
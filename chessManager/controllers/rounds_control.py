@@ -1,21 +1,23 @@
-from typing import List, Optional
-from chessManager.models import Tournament, Player, Match
+import random
+from typing import Any, Dict, List, Optional
+from chessManager.models import Tournament, Player, Match, Round
+from chessManager.controllers.swiss_pairing import PairingCandidate, pair_candidates
 
 
-def update_player_scores(tournament: Tournament, match: Match, score_white: float, score_black: float):
+def update_player_scores(tournament: Tournament, rnd: Round, match: Match, score_white: float, score_black: float):
     """Met à jour les scores cumulés des joueurs dans le tournoi.
 
+    Passe par le registre des points du tournoi : le coût est constant, quel que
+    soit le nombre de joueurs.
+
     Args:
         tournament (Tournament): Le tournoi en cours.
+        rnd (Round): La ronde du match.
         match (Match): Le match dont les scores doivent être appliqués.
         score_white (float): Score du joueur blanc.
         score_black (float): Score du joueur noir.
     """
-    for p in tournament.players:
-        if p.national_chess_id == match.white_player.national_chess_id:
-            p.tournament_score_value += score_white
-        if p.national_chess_id == match.black_player.national_chess_id:
-            p.tournament_score_value += score_black
+    tournament.record_result(rnd, match, score_white, score_black)
 
 
 def record_current_round_results(tournament: Tournament):
@@ -45,11 +47,8 @@ def record_current_round_results(tournament: Tournament):
         score_white = ask_score(f"Score {match.white_player} (0, 0.5, 1): ")
         score_black = 1 - score_white if score_white in (0, 1) else score_white
 
-        # Mise à jour du match
-        match.white_player_score = score_white
-        match.black_player_score = score_black
-
-        update_player_scores(tournament, match, score_white, score_black)
+        # Mise à jour du match et des scores cumulés
+        update_player_scores(tournament, current_round, match, score_white, score_black)
 
     # ✅ Clôture du round uniquement si tous les scores sont valides
     all_matches_valid = all(
@@ -91,6 +90,8 @@ def ask_score(prompt: str) -> float:
 def _already_played(tournament: Tournament, player1: Player, player2: Player) -> bool:
     """Vérifie si deux joueurs se sont déjà affrontés dans ce tournoi.
 
+    S'appuie sur l'historique des adversaires tenu par le tournoi (O(1)).
+
     Args:
         tournament (Tournament): Le tournoi à vérifier.
         player1 (Player): Le premier joueur.
@@ -99,22 +100,87 @@ def _already_played(tournament: Tournament, player1: Player, player2: Player) ->
     Returns:
         bool: True si un match (dans n'importe quel sens) a déjà eu lieu, False sinon.
     """
-    for rnd in tournament.rounds:  # rounds existants
-        for m in rnd.matches:  # chaque match
-            if (m.white_player is player1 and m.black_player is player2) or (
-                m.white_player is player2 and m.black_player is player1
-            ):
-                return True
-    return False
+    return tournament.have_played(player1, player2)
+
+
+def build_pairing_candidates(tournament: Tournament) -> List[PairingCandidate]:
+    """Prépare les données d'appariement des joueurs d'un tournoi.
+
+    Les joueurs sont classés par score puis départages (voir `tie_breaks`) ;
+    les adversaires, couleurs et exemptions proviennent de l'historique du tournoi.
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+
+    Returns:
+        List[PairingCandidate]: Les candidats, dans l'ordre du classement.
+    """
+    # Import différé : NumPy n'est chargé qu'au premier appariement, pas au démarrage
+    from chessManager.controllers.tie_breaks import standings
+
+    byes = {rnd.bye for rnd in tournament.rounds if rnd.bye is not None}
+    players = standings(tournament)
+    return [
+        PairingCandidate(
+            player_id=p.national_chess_id,
+            score=p.tournament_score_value,
+            opponents=tournament.opponents_of(p),
+            colors=tournament.color_history(p),
+            had_bye=p.national_chess_id in byes,
+        )
+        for p in players
+    ]
+
+
+def pair_first_round(tournament: Tournament) -> Optional[Round]:
+    """Apparie aléatoirement le premier round et remet les scores à zéro.
+
+    Avec un nombre impair de joueurs, le dernier joueur tiré est exempté (bye, +1 point).
+    Rien n'est sauvegardé ici (voir le contrôleur).
+
+    Args:
+        tournament (Tournament): Le tournoi à lancer.
+
+    Returns:
+        Optional[Round]: Le premier round, ou None s'il contient déjà des matchs
+        ou s'il y a moins de deux joueurs.
+    """
+    first_round = tournament.get_round(1)
+    if first_round.matches:
+        print("Le premier round contient déjà des matchs.")
+        return None
+
+    players = tournament.players[:]
+    if len(players) < 2:
+        print("Pas assez de joueurs.")
+        return None
+
+    tournament.reset_scores()
+    random.shuffle(players)
+    for i in range(0, len(players) - 1, 2):
+        first_round.add_match(
+            Match(
+                white_player=players[i],
+                white_player_score=0.0,
+                black_player=players[i + 1],
+                black_player_score=0.0,
+            )
+        )
+    if len(players) % 2 == 1:
+        # Exemption enregistrée comme aux rondes suivantes : le joueur ne peut plus être exempté
+        tournament.record_bye(first_round, players[-1])
+        print(f"Bye pour {players[-1].name} (+1.0)")
+
+    tournament.current_round = first_round
+    return first_round
 
 
 def prepare_next_round(tournament: Tournament) -> Optional[object]:
     """Prépare et génère les appariements pour le prochain round.
 
-    Utilise le système suisse simplifié :
-    1. Trie les joueurs par score (puis ordre alphabetique).
-    2. Apparie les joueurs proches au classement qui n'ont pas encore joué ensemble (si possible).
-    3. Gère le "bye" (joueur exempté) si nombre impair, lui donnant +1 point.
+    Utilise le moteur suisse de `swiss_pairing` : groupes de score, flotteurs,
+    préférences de couleur et absence de revanche. Le joueur exempté (bye) si le
+    nombre de joueurs est impair reçoit +1 point.
 
     Args:
         tournament (Tournament): Le tournoi concerné.
@@ -130,69 +196,89 @@ def prepare_next_round(tournament: Tournament) -> Optional[object]:
         print(f"Round {nxt.round_number} déjà initialisé.")
         return nxt
 
-    players: List[Player] = sorted(
-        tournament.players, key=lambda p: (-p.tournament_score_value, p.name)
-    )
+    candidates = build_pairing_candidates(tournament)
+    result = pair_candidates(candidates)
+    players = [tournament.get_player(c.player_id) for c in candidates]
 
-    # Bye si impair
-    if len(players) % 2 == 1:
-        bye = players.pop()
-        bye.tournament_score_value += 1.0
+    if result.bye is not None:
+        bye = players[result.bye]
+        tournament.record_bye(nxt, bye)
         print(f"Bye pour {bye.name} (+1.0)")
+    if result.rematches:
+        print(f"⚠️ {result.rematches} revanche(s) inévitable(s) dans ce round.")
 
-    i = 0
-    while i < len(players):
-        a, b = players[i], players[i + 1]
-        # micro-swap si déjà joués
-        if _already_played(tournament, a, b) and i + 2 < len(players):
-            c = players[i + 2]
-            if not _already_played(tournament, a, c):
-                players[i + 1], players[i + 2] = players[i + 2], players[i + 1]
-                b = players[i + 1]
-            elif not _already_played(tournament, b, c):
-                players[i], players[i + 2] = players[i + 2], players[i]
-                a = players[i]
+    for white, black in result.pairs:
         nxt.add_match(
             Match(
-                white_player=a,
+                white_player=players[white],
                 white_player_score=0.0,
-                black_player=b,
+                black_player=players[black],
                 black_player_score=0.0,
             )
         )
-        i += 2
 
     print(f"Round {nxt.round_number} initialisé avec {len(nxt.matches)} matchs.")
     return nxt
 
 
+def round_summary(rnd: Round) -> Dict[str, Any]:
+    """Représentation JSON d'une ronde : échiquiers numérotés à partir de 1, scores et exemption.
+
+    Args:
+        rnd (Round): La ronde à décrire.
+
+    Returns:
+        Dict[str, Any]: Numéro de ronde, matchs et joueur exempté.
+    """
+    return {
+        "round_number": rnd.round_number,
+        "matches": [
+            {
+                "board": board,
+                "white": m.white_player.national_chess_id,
+                "black": m.black_player.national_chess_id,
+                "white_score": m.white_player_score,
+                "black_score": m.black_player_score,
+            }
+            for board, m in enumerate(rnd.matches, start=1)
+        ],
+        "bye": rnd.bye,
+    }
+
+
 def reset_last_round_and_rescore(tournament: "Tournament"):
-    """Réinitialise le dernier round et redemande la saisie des scores si le tournoi n'est pas fini."""
+    """Réouvre le dernier round clôturé et redemande la saisie de ses scores.
+
+    Seuls les points de ce round sont retirés des scores cumulés. Les
+    appariements du round suivant, calculés à partir de ces résultats, sont
+    annulés (exemption comprise) et seront refaits à la clôture.
+    """
     if tournament.is_finished():
         print("⚠️ Le tournoi est déjà terminé, impossible de modifier les résultats.")
         return
 
-    if not tournament.rounds:
+    closed = [rnd for rnd in tournament.rounds if rnd.end_datetime is not None]
+    if not closed:
         print("⚠️ Aucun round à réinitialiser.")
         return
 
-    last_round = tournament.rounds[-1]
+    last_round = closed[-1]
     print(f"\n=== Réinitialisation du Round {last_round.round_number} ===")
 
-    # Remettre tous les scores à zéro
+    following = tournament.get_current_round()
+    if following is not None and following.round_number > last_round.round_number:
+        tournament.undo_round_scores(following)
+        following.matches = []
+        following.bye = None
+
+    tournament.undo_round_scores(last_round)
     for match in last_round.matches:
         match.white_player_score = 0.0
         match.black_player_score = 0.0
-
-    for p in tournament.players:
-        p.tournament_score_value = 0.0
-        # recalcul des scores à partir des rounds précédents (sauf le dernier réinitialisé)
-        for rnd in tournament.rounds[:-1]:
-            for m in rnd.matches:
-                if p.name == m.white_player.name:
-                    p.tournament_score_value += m.white_player_score
-                if p.name == m.black_player.name:
-                    p.tournament_score_value += m.black_player_score
+    if last_round.bye is not None:
+        tournament.record_bye(last_round, tournament.get_player(last_round.bye))
+    last_round.end_datetime = None
+    tournament.rebuild_history()
 
     print("♻️ Round réinitialisé. Vous pouvez ressaisir les résultats.")
     record_current_round_results(tournament)
@@ -0,0 +1,346 @@
+"""Moteur d'appariement suisse.
+
+Déroulement d'une ronde :
+    1. Les joueurs sont classés par score décroissant (l'ordre reçu départage
+       les égalités).
+    2. Si le nombre de joueurs est impair, l'exempt (bye) est le joueur le moins
+       bien classé qui n'en a pas encore reçu.
+    3. Les joueurs sont répartis en groupes de score, traités du plus haut au plus
+       bas. Dans chaque groupe (complété par les flotteurs descendus du groupe
+       précédent), la moitié haute est opposée à la moitié basse (système
+       hollandais) ; un joueur sans adversaire compatible descend dans le groupe
+       suivant.
+    4. S'il reste des joueurs non appariés en bas de tableau, une fenêtre des
+       derniers échiquiers est ré-appariée par couplage maximum (algorithme
+       d'Edmonds), en doublant la fenêtre jusqu'à trouver un couplage parfait.
+
+Contraintes :
+    - aucune revanche tant qu'un appariement sans revanche existe (la dernière
+      fenêtre couvre tout le tableau, exempt compris) ;
+    - deux joueurs ayant la même préférence de couleur absolue (écart de 2 ou
+      deux fois la même couleur de suite) ne sont pas opposés dans l'étape 3 ;
+      la réparation de l'étape 4 ne garantit que l'absence de revanche ;
+    - les couleurs respectent les préférences (absolue > forte > légère), le
+      mieux classé l'emportant à préférence égale.
+
+Budgets de temps (un cœur, CPython 3.11, résultats aléatoires) :
+    - 5 000 joueurs : moins de 2 s par ronde (≈ 0,1 s mesuré jusqu'à la ronde 9) ;
+    - 500 joueurs : moins de 100 ms par ronde.
+La réparation est en O(w³) pour une fenêtre de w joueurs ; elle ne couvre tout
+le tableau que si aucun appariement sans revanche n'existe dans les fenêtres
+plus petites, ce qui n'arrive en pratique que dans de très petits tournois.
+"""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import chain, groupby
+from typing import Callable, List, Optional, Set, Tuple
+
+BYE = -1
+
+
+@dataclass
+class PairingCandidate:
+    """Données d'un joueur nécessaires à l'appariement.
+
+    Attributes:
+        player_id (str): L'identifiant national du joueur.
+        score (float): Son score actuel.
+        opponents (Set[str]): Les identifiants des adversaires déjà rencontrés.
+        colors (List[str]): Les couleurs jouées ("W" ou "B"), dans l'ordre.
+        had_bye (bool): True si le joueur a déjà été exempté.
+    """
+
+    player_id: str
+    score: float
+    opponents: Set[str] = field(default_factory=set)
+    colors: List[str] = field(default_factory=list)
+    had_bye: bool = False
+
+
+@dataclass
+class PairingResult:
+    """Résultat d'un appariement, en indices dans la liste des candidats.
+
+    Attributes:
+        pairs (List[Tuple[int, int]]): Les couples (blancs, noirs), par échiquier.
+        bye (Optional[int]): Le joueur exempté, s'il y en a un.
+        rematches (int): Nombre de revanches imposées faute d'alternative.
+    """
+
+    pairs: List[Tuple[int, int]] = field(default_factory=list)
+    bye: Optional[int] = None
+    rematches: int = 0
+
+
+def _color_preference(colors: List[str]) -> Tuple[Optional[str], int]:
+    """Calcule la couleur souhaitée par un joueur et la force de ce souhait.
+
+    Args:
+        colors (List[str]): Les couleurs déjà jouées.
+
+    Returns:
+        Tuple[Optional[str], int]: La couleur souhaitée et sa force
+        (3 absolue, 2 forte, 1 légère, 0 aucune).
+    """
+    if not colors:
+        return None, 0
+    diff = colors.count("W") - colors.count("B")
+    if diff >= 2 or colors[-2:] == ["W", "W"]:
+        return "B", 3
+    if diff <= -2 or colors[-2:] == ["B", "B"]:
+        return "W", 3
+    if diff == 1:
+        return "B", 2
+    if diff == -1:
+        return "W", 2
+    return ("B" if colors[-1] == "W" else "W"), 1
+
+
+def _orient(a: int, b: int, prefs: List[Tuple[Optional[str], int]], board: int) -> Tuple[int, int]:
+    """Attribue les couleurs d'un couple, `a` étant le mieux classé.
+
+    Args:
+        a (int): Le joueur le mieux classé.
+        b (int): Son adversaire.
+        prefs (List[Tuple[Optional[str], int]]): Préférences de couleur par joueur.
+        board (int): Numéro d'échiquier (alternance lorsque personne n'a de préférence).
+
+    Returns:
+        Tuple[int, int]: Le couple (blancs, noirs).
+    """
+    color_a, strength_a = prefs[a]
+    color_b, strength_b = prefs[b]
+    if color_a is None and color_b is None:
+        white = a if board % 2 == 1 else b
+    elif color_b is None or (color_a is not None and color_a != color_b):
+        white = a if color_a == "W" else b
+    elif color_a is None:
+        white = b if color_b == "W" else a
+    else:
+        winner, loser = (a, b) if strength_a >= strength_b else (b, a)
+        white = winner if color_a == "W" else loser
+    return (white, b) if white == a else (white, a)
+
+
+def _pair_bracket(
+    members: List[int], compatible: Callable[[int, int], bool]
+) -> Tuple[List[Tuple[int, int]], List[int]]:
+    """Apparie un groupe de score selon le système hollandais.
+
+    Le joueur i de la moitié haute affronte de préférence le joueur i de la
+    moitié basse ; à défaut, le premier joueur compatible suivant.
+
+    Args:
+        members (List[int]): Les joueurs du groupe, du mieux au moins bien classé.
+        compatible (Callable[[int, int], bool]): Prédicat d'appariement autorisé.
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[int]]: Les couples formés et les
+        joueurs restants, qui descendent dans le groupe suivant.
+    """
+    half = len(members) // 2
+    top, bottom = members[:half], members[half:]
+    paired: Set[int] = set()
+    pairs = []
+    for i, a in enumerate(top):
+        if a in paired:
+            continue
+        for j in chain(range(i, len(bottom)), range(i), range(len(bottom), len(bottom) + len(top) - i - 1)):
+            b = bottom[j] if j < len(bottom) else top[i + 1 + j - len(bottom)]
+            if b not in paired and compatible(a, b):
+                paired.update((a, b))
+                pairs.append((a, b))
+                break
+
+    rest = [m for m in members if m not in paired]
+    leftovers = []
+    while rest:
+        a = rest.pop(0)
+        partner = next((b for b in rest if compatible(a, b)), None)
+        if partner is None:
+            leftovers.append(a)
+        else:
+            rest.remove(partner)
+            pairs.append((a, partner))
+    return pairs, leftovers
+
+
+def _maximum_matching(adjacency: List[List[int]], mate: List[int]):
+    """Complète un couplage jusqu'à un couplage de cardinal maximum (Edmonds).
+
+    Les chemins augmentants préservent les sommets déjà couplés : un couplage
+    initial proche du résultat attendu est donc modifié au minimum.
+
+    Args:
+        adjacency (List[List[int]]): Listes d'adjacence du graphe de compatibilité.
+        mate (List[int]): Couplage initial (-1 si libre), modifié sur place.
+    """
+    n = len(adjacency)
+
+    def find_augmenting_path(root: int) -> bool:
+        used = [False] * n
+        parent = [-1] * n
+        base = list(range(n))
+
+        def lowest_common_ancestor(a: int, b: int) -> int:
+            seen = [False] * n
+            while True:
+                a = base[a]
+                seen[a] = True
+                if mate[a] == -1:
+                    break
+                a = parent[mate[a]]
+            while True:
+                b = base[b]
+                if seen[b]:
+                    return b
+                b = parent[mate[b]]
+
+        def mark_path(v: int, b: int, child: int, blossom: List[bool]):
+            while base[v] != b:
+                blossom[base[v]] = blossom[base[mate[v]]] = True
+                parent[v] = child
+                child = mate[v]
+                v = parent[mate[v]]
+
+        used[root] = True
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            for to in adjacency[v]:
+                if base[v] == base[to] or mate[v] == to:
+                    continue
+                if to == root or (mate[to] != -1 and parent[mate[to]] != -1):
+                    current_base = lowest_common_ancestor(v, to)
+                    blossom = [False] * n
+                    mark_path(v, current_base, to, blossom)
+                    mark_path(to, current_base, v, blossom)
+                    for i in range(n):
+                        if blossom[base[i]]:
+                            base[i] = current_base
+                            if not used[i]:
+                                used[i] = True
+                                queue.append(i)
+                elif parent[to] == -1:
+                    parent[to] = v
+                    if mate[to] == -1:
+                        # Inversion du chemin augmentant
+                        while to != -1:
+                            previous = parent[to]
+                            following = mate[previous]
+                            mate[to] = previous
+                            mate[previous] = to
+                            to = following
+                        return True
+                    used[mate[to]] = True
+                    queue.append(mate[to])
+        return False
+
+    for v in range(n):
+        if mate[v] == -1:
+            find_augmenting_path(v)
+
+
+def _repair(pairs: List[Tuple[int, int]], unpaired: List[int], allowed: Callable[[int, int], bool]):
+    """Ré-apparie les derniers échiquiers pour placer les joueurs restés seuls.
+
+    La fenêtre (derniers couples + joueurs non appariés) double jusqu'à admettre
+    un couplage parfait sans revanche ou couvrir tout le tableau.
+
+    Args:
+        pairs (List[Tuple[int, int]]): Couples formés, du haut vers le bas du tableau.
+        unpaired (List[int]): Joueurs restés sans adversaire.
+        allowed (Callable[[int, int], bool]): Prédicat d'appariement sans revanche.
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[int]]: Les couples et les joueurs
+        toujours sans adversaire compatible.
+    """
+    size = 1
+    while True:
+        size = min(size, len(pairs))
+        window = pairs[len(pairs) - size:]
+        nodes = unpaired + [p for pair in window for p in pair]
+        position = {node: i for i, node in enumerate(nodes)}
+        adjacency = [
+            [j for j, other in enumerate(nodes) if j != i and allowed(node, other)]
+            for i, node in enumerate(nodes)
+        ]
+        mate = [-1] * len(nodes)
+        for a, b in window:
+            mate[position[a]], mate[position[b]] = position[b], position[a]
+        _maximum_matching(adjacency, mate)
+
+        matched = [(nodes[i], nodes[j]) for i, j in enumerate(mate) if i < j]
+        alone = [nodes[i] for i, j in enumerate(mate) if j == -1]
+        if not alone or size == len(pairs):
+            return pairs[: len(pairs) - size] + matched, alone
+        size *= 2
+
+
+def pair_candidates(candidates: List[PairingCandidate]) -> PairingResult:
+    """Calcule les appariements suisses d'une ronde.
+
+    Args:
+        candidates (List[PairingCandidate]): Les joueurs, dans l'ordre du
+            classement initial (utilisé pour départager les égalités de score).
+
+    Returns:
+        PairingResult: Les couples par échiquier et l'éventuel exempt.
+    """
+    n = len(candidates)
+    result = PairingResult()
+    if n < 2:
+        return result
+
+    ids = [c.player_id for c in candidates]
+    prefs = [_color_preference(c.colors) for c in candidates]
+    order = sorted(range(n), key=lambda i: (-candidates[i].score, i))
+    rank = {player: r for r, player in enumerate(order)}
+
+    # Si tout le monde a déjà été exempté, n'importe qui peut l'être à nouveau
+    bye_open = all(c.had_bye for c in candidates)
+    if n % 2 == 1:
+        result.bye = next((i for i in reversed(order) if not candidates[i].had_bye), order[-1])
+        order.remove(result.bye)
+
+    def allowed(a: int, b: int) -> bool:
+        if a == BYE or b == BYE:
+            player = b if a == BYE else a
+            return bye_open or player == result.bye or not candidates[player].had_bye
+        return ids[b] not in candidates[a].opponents
+
+    def compatible(a: int, b: int) -> bool:
+        if not allowed(a, b):
+            return False
+        (color_a, strength_a), (color_b, strength_b) = prefs[a], prefs[b]
+        return not (strength_a == strength_b == 3 and color_a == color_b)
+
+    pairs: List[Tuple[int, int]] = []
+    floaters: List[int] = []
+    for _, group in groupby(order, key=lambda i: candidates[i].score):
+        bracket_pairs, floaters = _pair_bracket(floaters + list(group), compatible)
+        pairs.extend(bracket_pairs)
+
+    if floaters:
+        if result.bye is not None:
+            pairs.append((result.bye, BYE))
+        pairs, floaters = _repair(pairs, floaters, allowed)
+        if BYE in floaters:
+            floaters.remove(BYE)
+            pairs.append((floaters.pop(), BYE))
+        # Aucun appariement sans revanche : on complète quand même le tableau
+        while len(floaters) >= 2:
+            pairs.append((floaters.pop(0), floaters.pop(0)))
+            result.rematches += 1
+        if result.bye is not None:
+            bye_pair = next(pair for pair in pairs if BYE in pair)
+            pairs.remove(bye_pair)
+            result.bye = bye_pair[0] if bye_pair[1] == BYE else bye_pair[1]
+
+    pairs = [(a, b) if rank[a] <= rank[b] else (b, a) for a, b in pairs]
+    pairs.sort(key=lambda pair: rank[pair[0]])
+    result.pairs = [_orient(a, b, prefs, board) for board, (a, b) in enumerate(pairs, start=1)]
+    return result
@@ -0,0 +1,199 @@
+"""Départages vectorisés (Buchholz, Buchholz médian, Sonneborn-Berger, progressif).
+
+Les rondes clôturées d'un tournoi sont converties en deux matrices joueurs × rondes :
+    - `results` : points marqués (NaN si le joueur n'a pas joué la ronde) ;
+    - `opponents` : indice de l'adversaire (-1 pour un exempt ou une absence).
+Chaque départage est ensuite calculé en une passe NumPy sur ces matrices. Le
+résultat est mis en cache sur le tournoi et n'est recalculé qu'à la clôture
+(ou la réouverture) d'une ronde.
+
+Conventions :
+    - une exemption compte pour ses points dans le score et le progressif, mais
+      n'apporte aucun adversaire au Buchholz ni au Sonneborn-Berger ;
+    - le Buchholz médian retire le meilleur et le moins bon adversaire dès que
+      le joueur en a rencontré au moins trois.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+
+from chessManager.models import Tournament, Player
+
+
+@dataclass
+class TieBreakTable:
+    """Scores et départages de tous les joueurs d'un tournoi.
+
+    Les tableaux sont alignés sur `player_ids` (ordre de `tournament.players`).
+
+    Attributes:
+        player_ids (List[str]): Identifiants nationaux des joueurs.
+        scores (np.ndarray): Points marqués dans les rondes clôturées.
+        buchholz (np.ndarray): Somme des scores des adversaires.
+        median_buchholz (np.ndarray): Buchholz sans le meilleur ni le moins bon adversaire.
+        sonneborn_berger (np.ndarray): Somme des scores des adversaires pondérés par le résultat.
+        progressive (np.ndarray): Somme des scores cumulés après chaque ronde.
+    """
+
+    player_ids: List[str]
+    scores: np.ndarray
+    buchholz: np.ndarray
+    median_buchholz: np.ndarray
+    sonneborn_berger: np.ndarray
+    progressive: np.ndarray
+
+
+def build_matrices(tournament: Tournament):
+    """Construit les matrices résultats / adversaires des rondes clôturées.
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: `results` (float, NaN si absent) et
+        `opponents` (int, -1 si pas d'adversaire), de forme joueurs × rondes.
+    """
+    closed = [rnd for rnd in tournament.rounds if rnd.end_datetime is not None]
+    index = {p.national_chess_id: i for i, p in enumerate(tournament.players)}
+    results = np.full((len(tournament.players), len(closed)), np.nan)
+    opponents = np.full((len(tournament.players), len(closed)), -1, dtype=np.int64)
+
+    columns, whites, blacks, white_scores, black_scores = [], [], [], [], []
+    for col, rnd in enumerate(closed):
+        for match in rnd.matches:
+            columns.append(col)
+            whites.append(index[match.white_player.national_chess_id])
+            blacks.append(index[match.black_player.national_chess_id])
+            white_scores.append(match.white_player_score or 0.0)
+            black_scores.append(match.black_player_score or 0.0)
+        if rnd.bye is not None and rnd.bye in index:
+            results[index[rnd.bye], col] = 1.0
+
+    if columns:
+        columns, whites, blacks = np.array(columns), np.array(whites), np.array(blacks)
+        results[whites, columns] = white_scores
+        results[blacks, columns] = black_scores
+        opponents[whites, columns] = blacks
+        opponents[blacks, columns] = whites
+    return results, opponents
+
+
+def compute_tie_breaks(tournament: Tournament) -> TieBreakTable:
+    """Calcule (ou relit en cache) les départages d'un tournoi.
+
+    Le cache est indexé par les dates de clôture des rondes et le nombre de
+    joueurs : il est invalidé par toute clôture, réouverture ou inscription.
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+
+    Returns:
+        TieBreakTable: Les départages de tous les joueurs.
+    """
+    key = (len(tournament.players), tuple(r.end_datetime for r in tournament.rounds if r.end_datetime))
+    cached = tournament.tie_break_cache.get(key)
+    if cached is not None:
+        return cached
+
+    results, opponents = build_matrices(tournament)
+    points = np.nan_to_num(results)
+    scores = points.sum(axis=1)
+
+    played = opponents >= 0
+    opponent_scores = np.where(played, scores[np.where(played, opponents, 0)], 0.0)
+    buchholz = opponent_scores.sum(axis=1)
+
+    median_buchholz = buchholz.copy()
+    trimmed = played.sum(axis=1) >= 3
+    if trimmed.any():
+        best = np.where(played[trimmed], opponent_scores[trimmed], -np.inf).max(axis=1)
+        worst = np.where(played[trimmed], opponent_scores[trimmed], np.inf).min(axis=1)
+        median_buchholz[trimmed] -= best + worst
+
+    sonneborn_berger = np.where(played, points * opponent_scores, 0.0).sum(axis=1)
+    progressive = np.cumsum(points, axis=1).sum(axis=1)
+
+    table = TieBreakTable(
+        player_ids=[p.national_chess_id for p in tournament.players],
+        scores=scores,
+        buchholz=buchholz,
+        median_buchholz=median_buchholz,
+        sonneborn_berger=sonneborn_berger,
+        progressive=progressive,
+    )
+    tournament.tie_break_cache.clear()
+    tournament.tie_break_cache[key] = table
+    return table
+
+
+def standings_order(tournament: Tournament) -> np.ndarray:
+    """Calcule l'ordre du classement : score, départages, puis nom.
+
+    Le score utilisé est le score cumulé du joueur (exemption de la ronde en
+    cours comprise) ; les départages portent sur les rondes clôturées.
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+
+    Returns:
+        np.ndarray: Indices dans `tournament.players`, du premier au dernier.
+    """
+    players = tournament.players
+    if not players:
+        return np.empty(0, dtype=np.int64)
+    table = compute_tie_breaks(tournament)
+    names = np.argsort(np.argsort([p.name for p in players], kind="stable"), kind="stable")
+    official = np.array([p.tournament_score_value for p in players])
+    return np.lexsort(
+        (
+            names,
+            -table.progressive,
+            -table.sonneborn_berger,
+            -table.median_buchholz,
+            -table.buchholz,
+            -official,
+        )
+    )
+
+
+def standings(tournament: Tournament) -> List[Player]:
+    """Classe les joueurs d'un tournoi (voir `standings_order`).
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+
+    Returns:
+        List[Player]: Les joueurs, du premier au dernier.
+    """
+    return [tournament.players[i] for i in standings_order(tournament)]
+
+
+def standings_rows(tournament: Tournament) -> List[Dict[str, Any]]:
+    """Construit le classement sérialisable d'un tournoi : rang, joueur, score et départages.
+
+    Args:
+        tournament (Tournament): Le tournoi concerné.
+
+    Returns:
+        List[Dict[str, Any]]: Une ligne par joueur, du premier au dernier.
+    """
+    table = compute_tie_breaks(tournament)
+    rows = []
+    for rank, i in enumerate(standings_order(tournament), start=1):
+        player = tournament.players[i]
+        rows.append(
+            {
+                "rank": rank,
+                "national_chess_id": player.national_chess_id,
+                "name": player.name,
+                "score": player.tournament_score_value,
+                "buchholz": float(table.buchholz[i]),
+                "median_buchholz": float(table.median_buchholz[i]),
+                "sonneborn_berger": float(table.sonneborn_berger[i]),
+                "progressive": float(table.progressive[i]),
+            }
+        )
+    return rows
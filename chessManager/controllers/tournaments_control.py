@@ -1,10 +1,16 @@
-import json
-import random
+import time
+from collections import OrderedDict
 
-from constant import DB_LICENSED_PLAYERS, DB_TOURNAMENTS, DEFAULT_ENCODING
-from chessManager.models import Tournament, Player, Match
+from constant import DB_LICENSED_PLAYERS, PAIRING_WORKERS, TOURNAMENT_CACHE_SIZE
+from chessManager.models import Tournament, TournamentHeader, Player
+from chessManager.models.tournament import STATUS_FINISHED
+from chessManager.storage import ConflictError, TournamentCatalog, TournamentStore, open_store
 from chessManager.controllers import save_player
-from chessManager.controllers import record_current_round_results
+from chessManager.controllers import record_current_round_results, reset_last_round_and_rescore
+from chessManager.controllers.rounds_control import pair_first_round
+from chessManager.controllers.batch_pairing import BatchPairingReport, apply_pairing, needs_pairing, pair_sections
+from chessManager.controllers.player_import import stream_players
+from chessManager.controllers.results_import import ingest_round_results, write_error_report
 
 
 class TournamentController:
@@ -12,48 +18,195 @@ class TournamentController:
 
     Cette classe est responsable de la création, du chargement, de la sauvegarde
     et de la gestion des tournois.
+
+    Plusieurs programmes peuvent ouvrir le même dossier Data/ : un tournoi
+    modifié par un autre processus est rechargé à son ouverture, et une
+    sauvegarde en conflit est fusionnée ou refusée par le stockage (voir
+    `save_changes`).
     """
 
-    def __init__(self):
-        """Initialise le contrôleur et charge les tournois existants."""
-        self.tournaments: list[Tournament] = []
+    def __init__(self, store: TournamentStore = None, cache_size: int = TOURNAMENT_CACHE_SIZE):
+        """Initialise le contrôleur et charge les en-têtes des tournois existants.
+
+        Seuls les en-têtes (nom, dates...) sont chargés au démarrage, depuis le
+        catalogue des tournois s'il est à jour ; joueurs et rondes sont
+        reconstruits à l'ouverture d'un tournoi puis gardés dans un cache LRU de
+        `cache_size` tournois.
+
+        Args:
+            store (TournamentStore, optional): Backend de stockage à utiliser
+                (par défaut, celui défini par constant.STORAGE_BACKEND).
+            cache_size (int, optional): Nombre de tournois complets gardés en mémoire.
+        """
+        self.store = store or open_store()
+        self.catalog = TournamentCatalog(self.store.source_paths())
+        self.cache_size = cache_size
+        self.headers: list[TournamentHeader] = []
+        self._cache: OrderedDict[int, Tournament] = OrderedDict()
         self.load_tournaments()
 
-    def save_tournaments(self):
-        """Sauvegarde tous les tournois en JSON, avec création d'une copie de sauvegarde (.bak).
+    def save_tournaments(self, tournament: Tournament = None):
+        """Réécrit intégralement un tournoi, ou tous les tournois ouverts modifiés si aucun n'est précisé.
+
+        Les mutations courantes passent plutôt par `save_changes`, qui ne
+        persiste que les parties modifiées d'un tournoi.
 
-        Si aucun tournoi n'est présent, annule l'opération.
+        Si aucun tournoi n'est à sauvegarder, annule l'opération.
+
+        Args:
+            tournament (Tournament, optional): Le tournoi modifié.
         """
-        if not self.tournaments:
+        if tournament is not None:
+            targets = [tournament]
+        else:
+            targets = [t for t in self._cache.values() if t.has_changes()]
+        if not targets:
             print("⚠️ Aucun tournoi à sauvegarder.")
             return
 
-        # Sauvegarde backup
-        import shutil
-
-        backup_file = f"{DB_TOURNAMENTS}.bak"
         try:
-            shutil.copy(DB_TOURNAMENTS, backup_file)
-        except OSError:
-            pass  # Ignore if file doesn't exist yet
-
-        # Sauvegarde principale
-        with open(DB_TOURNAMENTS, "w", encoding=DEFAULT_ENCODING) as f:
-            json.dump([t.to_record() for t in self.tournaments], f, indent=4)
+            with self.store.transaction():
+                for t in targets:
+                    self.store.save_tournament(t)
+        except ConflictError as e:
+            rejected = next(t for t in targets if t.tournament_id == e.tournament_id)
+            self._reject(rejected, e)
+            self._refresh_header(rejected)
+            return
+        for t in targets:
+            t.mark_clean()
+        self._refresh_header(*targets)
         print("✅ État sauvegardé")
 
+    def save_changes(self, *tournaments: Tournament) -> list[Tournament]:
+        """Persiste les parties modifiées d'un ou plusieurs tournois en une validation groupée.
+
+        Les joueurs sont sauvegardés si eux ou leurs scores ont changé, puis
+        chaque ronde marquée modifiée (voir `Tournament.has_changes`).
+
+        Si un autre processus a modifié un tournoi depuis son chargement, le
+        stockage fusionne les modifications lorsqu'elles portent sur d'autres
+        parties du tournoi ; sinon celles de ce processus sont refusées, le
+        tournoi est rechargé et les autres tournois sont sauvegardés sans lui.
+        Dans les deux cas, le tournoi en mémoire reflète ensuite l'état enregistré.
+
+        Args:
+            *tournaments (Tournament): Les tournois modifiés.
+
+        Returns:
+            list[Tournament]: Les tournois sauvegardés (sans ceux dont les modifications ont été refusées).
+        """
+        saved = list(tournaments)
+        while saved:
+            try:
+                with self.store.transaction():
+                    for tournament in saved:
+                        if tournament.dirty:
+                            self.store.save_players(tournament, tournament.players)
+                        for rnd in tournament.rounds:
+                            if rnd.dirty:
+                                self.store.save_round(tournament, rnd)
+                break
+            except ConflictError as e:
+                rejected = next(t for t in saved if t.tournament_id == e.tournament_id)
+                saved.remove(rejected)
+                self._reject(rejected, e)
+        for tournament in saved:
+            tournament.mark_clean()
+            self._reload_if_merged(tournament)
+        self._refresh_header(*tournaments)
+        return saved
+
+    def _reload(self, tournament: Tournament):
+        """Remplace un tournoi en mémoire par son état enregistré (l'objet reste le même).
+
+        Args:
+            tournament (Tournament): Le tournoi périmé.
+        """
+        tournament.replace_with(self.store.load_tournament(tournament.tournament_id))
+
+    def _reload_if_merged(self, tournament: Tournament):
+        """Recharge un tournoi sauvegardé si sa sauvegarde a été fusionnée avec celles d'un autre processus.
+
+        Args:
+            tournament (Tournament): Le tournoi sauvegardé.
+        """
+        if self.store.version_of(tournament.tournament_id) not in (None, tournament.version):
+            print(f"🔄 Tournoi « {tournament.name} » fusionné avec les modifications d'un autre processus.")
+            self._reload(tournament)
+
+    def _reject(self, tournament: Tournament, error: ConflictError):
+        """Signale des modifications refusées et recharge le tournoi.
+
+        Args:
+            tournament (Tournament): Le tournoi en conflit.
+            error (ConflictError): L'erreur levée par le stockage.
+        """
+        print(f"⚠️ {error} Modifications refusées, tournoi « {tournament.name} » rechargé.")
+        self._reload(tournament)
+
     def load_tournaments(self):
-        """Charge la liste des tournois depuis le fichier JSON de base de données.
+        """Charge les en-têtes des tournois depuis le catalogue (ou le backend s'il est périmé)."""
+        self.headers = self.catalog.headers(self.store)
+        self._cache.clear()
+
+    def open_tournament(self, header) -> Tournament:
+        """Retourne le tournoi complet correspondant à un en-tête ou un identifiant.
+
+        Le tournoi est reconstruit depuis le stockage s'il n'est pas en cache,
+        ou rechargé s'il a été modifié par un autre processus ; le moins
+        récemment ouvert est évincé lorsque le cache est plein.
+
+        Args:
+            header (TournamentHeader | int): L'en-tête ou l'identifiant du tournoi.
 
-        Gère les erreurs de fichier non trouvé ou de JSON invalide en initialisant
-        une liste vide.
+        Returns:
+            Tournament: Le tournoi complet.
         """
-        try:
-            with open(DB_TOURNAMENTS, "r", encoding=DEFAULT_ENCODING) as f:
-                data = json.load(f)
-                self.tournaments = [Tournament.from_record(d) for d in data]
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.tournaments = []
+        tournament_id = getattr(header, "tournament_id", header)
+        tournament = self._cache.get(tournament_id)
+        if tournament is None:
+            tournament = self.store.load_tournament(tournament_id)
+        elif self.store.version_of(tournament_id) not in (None, tournament.version):
+            self._reload(tournament)
+        self._remember(tournament)
+        return tournament
+
+    def _remember(self, tournament: Tournament):
+        """Place un tournoi en tête du cache LRU.
+
+        Args:
+            tournament (Tournament): Le tournoi ouvert ou modifié.
+        """
+        self._cache[tournament.tournament_id] = tournament
+        self._cache.move_to_end(tournament.tournament_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _refresh_header(self, *tournaments: Tournament):
+        """Met à jour l'en-tête de tournois modifiés, puis le catalogue (une seule écriture).
+
+        À appeler une fois la sauvegarde terminée : le catalogue enregistre
+        l'état des fichiers de données qu'il décrit. Si d'autres processus ont
+        écrit entre-temps, tous les en-têtes sont relus depuis le stockage ; le
+        catalogue est écrit sous le verrou du stockage.
+
+        Args:
+            *tournaments (Tournament): Les tournois modifiés.
+        """
+        with self.store.transaction():
+            if self.store.external_changes():
+                self.headers = self.store.list_headers()
+            else:
+                positions = {header.tournament_id: idx for idx, header in enumerate(self.headers)}
+                for tournament in tournaments:
+                    idx = positions.get(tournament.tournament_id)
+                    if idx is None:
+                        positions[tournament.tournament_id] = len(self.headers)
+                        self.headers.append(tournament.header())
+                    else:
+                        self.headers[idx] = tournament.header()
+            self.catalog.write(self.headers)
 
     def create_tournament(
         self, name: str, location: str, start_date: str, end_date: str, number_of_rounds: int, description: str = None
@@ -74,85 +227,206 @@ class TournamentController:
         tournament = Tournament(
             name, location, start_date, end_date, number_of_rounds, description
         )
-        self.tournaments.append(tournament)
-        self.save_tournaments()
+        self.store.insert_tournament(tournament)
+        self._refresh_header(tournament)
+        self._remember(tournament)
+        print("✅ État sauvegardé")
         return tournament
 
-    def list_tournaments(self):
-        return self.tournaments
+    def list_tournaments(self) -> list[TournamentHeader]:
+        """Retourne les en-têtes de tous les tournois, relus si un autre processus a écrit entre-temps.
+
+        Returns:
+            list[TournamentHeader]: Les en-têtes, dans l'ordre de création.
+        """
+        if self.store.external_changes():
+            self.headers = self.catalog.headers(self.store)
+        return self.headers
 
     @save_player(DB_LICENSED_PLAYERS)
     def add_player_to_tournament(self, tournament, player_data: dict):
+        """Inscrit un joueur (saisi ou retrouvé parmi les licenciés) et le sauvegarde.
+
+        Args:
+            tournament (Tournament): Le tournoi destinataire.
+            player_data (dict): L'enregistrement du joueur.
+
+        Returns:
+            Player | None: Le joueur inscrit, ou None s'il l'était déjà ou si la
+            sauvegarde a été refusée.
+        """
         player = Player.from_record(player_data)
+        if tournament.get_player(player.national_chess_id) is not None:
+            print(f"⚠️ {player.name} ({player.national_chess_id}) est déjà inscrit à ce tournoi.")
+            return None
         tournament.add_player(player)
-        self.save_tournaments()
+        try:
+            self.store.save_players(tournament, [player])
+        except ConflictError as e:
+            self._reject(tournament, e)
+            self._refresh_header(tournament)
+            return None
+        tournament.mark_clean()
+        self._reload_if_merged(tournament)
+        self._refresh_header(tournament)
+        print("✅ État sauvegardé")
         return player
 
     @save_player(DB_LICENSED_PLAYERS)
-    def add_players_from_json(
-        self, tournament, filepath: str
-    ):  # Ajout de la vérification de doublons
+    def add_players_from_json(self, tournament, filepath: str):
+        """Importe en flux les joueurs d'un fichier NDJSON ou JSON (`{"players": [...]}`).
+
+        Les doublons (même identifiant national) sont ignorés ; les joueurs sont
+        sauvegardés par lots (voir `player_import.stream_players`).
+
+        Args:
+            tournament (Tournament): Le tournoi destinataire.
+            filepath (str): Le fichier de joueurs.
+
+        Returns:
+            int | None: Le nombre de joueurs ajoutés, ou None si l'import a échoué
+            (fichier illisible, sauvegarde refusée).
+        """
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            players_list = data.get("players", data)
-            added_count = 0
-            existing_ids = {p.national_chess_id for p in tournament.players}
-            for p in players_list:
-                player = Player.from_record(p)
-                if player.national_chess_id not in existing_ids:
-                    tournament.add_player(player)
-                    existing_ids.add(player.national_chess_id)
-                    added_count += 1
-            self.save_tournaments()
-            print(f"✅ {added_count} joueurs importés depuis {filepath}.")
-            return added_count
+            report = stream_players(tournament, self.store, filepath)
+        except ConflictError as e:
+            self._reject(tournament, e)
+            return None
         except Exception as e:
             print(f"⚠️ Erreur import JSON : {e}")
-            return 0
+            return None
+        finally:
+            self._refresh_header(tournament)
+        tournament.mark_clean()
+        print(
+            f"✅ {report.added} joueurs importés depuis {filepath} "
+            f"({report.duplicates} doublons, {report.invalid} invalides, {report.elapsed:.1f} s)."
+        )
+        return report.added
 
     def start_tournament(self, tournament):
-        """Initialise le 1er round en appariant aléatoirement les joueurs (si vide)."""
+        """Initialise le 1er round en appariant aléatoirement les joueurs (si vide).
+
+        Returns:
+            Round | None: Le premier round, ou None s'il n'a pas été apparié ni sauvegardé.
+        """
+        first_round = pair_first_round(tournament)
+        if first_round is None:
+            return None
+        if not self.save_changes(tournament):
+            return None
+        print("✅ État sauvegardé")
+        print(f"✅ Premier round initialisé avec {len(first_round.matches)} matchs.")
+        return first_round
 
-        for player in tournament.players:
-            player.tournament_score_value = 0.0
+    def pair_active_tournaments(self, workers: int = PAIRING_WORKERS, tournament_ids=None) -> BatchPairingReport:
+        """Apparie en parallèle la ronde en cours de chaque tournoi qui l'attend, puis sauvegarde une fois.
 
-        first_round = tournament.get_round(1)
+        Sont concernés les tournois non terminés d'au moins deux joueurs dont
+        la ronde en cours n'a aucun match (première ronde comprise). Les
+        appariements sont calculés dans un pool de processus (voir
+        `batch_pairing`), appliqués aux tournois de ce processus puis
+        sauvegardés en une seule validation groupée.
 
-        if first_round.matches:
-            print("Le premier round contient déjà des matchs.")
-            return
+        Args:
+            workers (int, optional): Nombre de processus (défaut : constant.PAIRING_WORKERS,
+                None pour le nombre de cœurs).
+            tournament_ids (Iterable[int], optional): Ne considérer que ces tournois.
 
-        players = tournament.players[:]
-        if len(players) < 2:
-            print("Pas assez de joueurs.")
-            return
+        Returns:
+            BatchPairingReport: Les sections appariées, avec leurs durées.
+        """
+        start = time.perf_counter()
+        report = BatchPairingReport()
+        tournaments = []
+        selected = None if tournament_ids is None else set(tournament_ids)
+        for header in self.list_tournaments():
+            if selected is not None and header.tournament_id not in selected:
+                continue
+            if header.status == STATUS_FINISHED or header.player_count < 2:
+                continue
+            try:
+                tournament = self.open_tournament(header)
+            except ValueError as e:
+                print(f"⚠️ Tournoi « {header.name} » illisible : {e}")
+                report.skipped.append(header.name)
+                continue
+            if needs_pairing(tournament):
+                tournaments.append(tournament)
+        if not tournaments:
+            print("⚠️ Aucun tournoi à apparier.")
+            return report
 
-        random.shuffle(players)
-        matches = []
-        for i in range(0, len(players) - 1, 2):
-            p1, p2 = players[i], players[i + 1]
-            match = Match(
-                white_player=p1,
-                white_player_score=0.0,
-                black_player=p2,
-                black_player_score=0.0,
-            )
-            matches.append(match)
-
-        if len(players) % 2 == 1:
-            print(f"{players[-1].name} n’a pas d’adversaire ce round.")
-        # Ajouter dans le Round
-        for m in matches:
-            first_round.add_match(m)
-
-        tournament.current_round = first_round
-        self.save_tournaments()
-        print(f"✅ Premier round initialisé avec {len(matches)} matchs.")
+        pairings, report.workers = pair_sections(tournaments, workers)
+        paired = []
+        for tournament, pairing in zip(tournaments, pairings):
+            if pairing is not None and apply_pairing(tournament, pairing):
+                paired.append((tournament, pairing))
+            else:
+                report.skipped.append(tournament.name)
+        saving = time.perf_counter()
+        saved = {t.tournament_id for t in self.save_changes(*(t for t, _ in paired))} if paired else set()
+        report.save_time = time.perf_counter() - saving
+        for tournament, pairing in paired:
+            if tournament.tournament_id not in saved:
+                report.skipped.append(tournament.name)
+                continue
+            report.sections.append(pairing)
+            for message in pairing.messages:
+                print(f"[{tournament.name}] {message}")
+        if saved:
+            print("✅ État sauvegardé")
+        report.elapsed = time.perf_counter() - start
+        return report
 
     def save_current_round_results(self, tournament):
         """Saisie des résultats du round en cours et sauvegarde."""
         if not isinstance(tournament, Tournament):
             raise TypeError(f"Expected Tournament, got {type(tournament)}")
         record_current_round_results(tournament)
-        self.save_tournaments()
+        if self.save_changes(tournament):
+            print("✅ État sauvegardé")
+
+    def import_round_results(self, tournament, filepath: str):
+        """Charge les résultats du round en cours depuis un fichier CSV/JSON/NDJSON et sauvegarde une fois.
+
+        Les lignes rejetées sont écrites dans un rapport `<fichier>.rejected.csv`.
+
+        Args:
+            tournament (Tournament): Le tournoi concerné.
+            filepath (str): Le fichier de résultats.
+
+        Returns:
+            ResultImportReport | None: Le bilan, ou None si le fichier est
+            illisible ou si la sauvegarde a été refusée (conflit).
+        """
+        if not isinstance(tournament, Tournament):
+            raise TypeError(f"Expected Tournament, got {type(tournament)}")
+        try:
+            report = ingest_round_results(tournament, filepath)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Erreur import résultats : {e}")
+            return None
+
+        if report.applied and not self.save_changes(tournament):
+            return None
+        if report.applied:
+            print("✅ État sauvegardé")
+
+        print(f"✅ {report.applied} résultat(s) enregistré(s) pour le round {report.round_number}.")
+        if report.rejected:
+            path = write_error_report(report.rejected, filepath)
+            print(f"⚠️ {len(report.rejected)} ligne(s) rejetée(s) : voir {path}")
+        if report.closed:
+            print("✅ Round clôturé.")
+        elif report.pending:
+            print(f"⚠️ Round non clôturé, échiquiers sans résultat : {', '.join(map(str, report.pending))}")
+        return report
+
+    def reset_last_round_results(self, tournament):
+        """Réouvre le dernier round clôturé, ressaisit ses résultats et sauvegarde."""
+        if not isinstance(tournament, Tournament):
+            raise TypeError(f"Expected Tournament, got {type(tournament)}")
+        reset_last_round_and_rescore(tournament)
+        if self.save_changes(tournament):
+            print("✅ État sauvegardé")
@@ -1,6 +1,8 @@
 from .player import Player
 from .match import Match
+from .match_columns import MatchColumns, MatchView
 from .chessRound import Round
-from .tournament import Tournament
+from .score_ledger import ScoreLedger
+from .tournament import Tournament, TournamentHeader
 
-__all__ = ["Player", "Match", "Round", "Tournament"]
+__all__ = ["Player", "Match", "MatchColumns", "MatchView", "Round", "ScoreLedger", "Tournament", "TournamentHeader"]
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Dict, Callable
 from datetime import datetime
 from chessManager.models import Match, Player
+from chessManager.models.match_columns import MatchColumns
 
 
-@dataclass
+@dataclass(slots=True)
 class Round:
     """Modèle représentant une ronde dans un tournoi d'échecs.
 
@@ -13,27 +14,40 @@ class Round:
 
     Attributes:
         round_number (int): Le numéro de la ronde.
-        matches (List[Match]): Liste des matchs prévus ou joués.
+        matches (List[Match]): Liste des matchs prévus ou joués (ou `MatchColumns`
+            pour une ronde stockée en colonnes, voir `to_columnar`).
         start_datetime (datetime): Date et heure de début (défaut: maintenant).
         end_datetime (Optional[datetime]): Date et heure de fin (None tant que non terminé).
+        bye (Optional[str]): Identifiant national du joueur exempté lors de cette ronde.
+        dirty (bool): True si la ronde a changé depuis sa dernière sauvegarde
+            (match ajouté, résultat, exemption, clôture).
     """
 
     round_number: int
     matches: List[Match] = field(default_factory=list)
     start_datetime: datetime = field(default_factory=datetime.now)
     end_datetime: Optional[datetime] = None
+    bye: Optional[str] = None
+    on_match_added: Optional[Callable[[Match], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    dirty: bool = field(default=False, init=False, repr=False, compare=False)
 
     def add_match(self, match: Match):
-        """Ajoute un match à la ronde.
+        """Ajoute un match à la ronde et notifie le tournoi propriétaire.
 
         Args:
             match (Match): Le match à ajouter.
         """
         self.matches.append(match)
+        self.dirty = True
+        if self.on_match_added is not None:
+            self.on_match_added(match)
 
     def end_round(self):
         """Clôture la ronde en enregistrant la date et l'heure actuelles."""
         self.end_datetime = datetime.now()
+        self.dirty = True
 
     def to_record(self) -> dict:
         """Convertit la ronde et ses matchs en dictionnaire sérialisable.
@@ -48,20 +62,43 @@ class Round:
                 self.end_datetime.isoformat() if self.end_datetime else None
             ),
             "matches": [m.to_tuple() for m in self.matches],
+            "bye": self.bye,
         }
 
+    def to_columnar(self, players: List[Player]):
+        """Convertit les matchs de la ronde en stockage par colonnes (`MatchColumns`).
+
+        Args:
+            players (List[Player]): Les joueurs du tournoi, référencés par position.
+        """
+        if not isinstance(self.matches, MatchColumns):
+            self.matches = MatchColumns(players, self.matches)
+
     @staticmethod
-    def from_record(data: dict, players: list[Player]) -> "Round":
+    def from_record(
+        data: dict, players_by_id: Dict[str, Player], players: Optional[List[Player]] = None
+    ) -> "Round":
         """Reconstruit une instance de Round depuis un dictionnaire.
 
         Args:
             data (dict): Données de la ronde.
-            players (list[Player]): Liste des joueurs du tournoi (pour lier les matchs).
+            players_by_id (Dict[str, Player]): Joueurs du tournoi indexés par
+                identifiant national (pour lier les matchs).
+            players (List[Player], optional): Les joueurs du tournoi ; s'ils sont
+                fournis, les matchs sont stockés en colonnes sans créer d'objets Match.
 
         Returns:
             Round: L'instance de Round reconstruite.
+
+        Raises:
+            ValueError: Si un match référence un joueur absent du tournoi.
         """
-        matches = [Match.from_tuple(tuple(t), players) for t in data["matches"]]
+        if players is not None:
+            matches = MatchColumns(players)
+            for t in data["matches"]:
+                matches.append_tuple(t)
+        else:
+            matches = [Match.from_tuple(t, players_by_id) for t in data["matches"]]
         start_dt = datetime.fromisoformat(data["start_datetime"])
         end_dt = (
             datetime.fromisoformat(data["end_datetime"])
@@ -73,4 +110,5 @@ class Round:
             matches=matches,
             start_datetime=start_dt,
             end_datetime=end_dt,
+            bye=data.get("bye"),
         )
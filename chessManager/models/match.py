@@ -1,9 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Dict
 from chessManager.models import Player
 
+# Scores usuels partagés : un match chargé ne garde pas son propre objet float
+_SCORES = {0.0: 0.0, 0.5: 0.5, 1.0: 1.0}
 
-@dataclass
+
+@dataclass(slots=True)
 class Match:
     """Modèle représentant un match unique entre deux joueurs.
 
@@ -22,45 +26,62 @@ class Match:
     def to_tuple(self) -> tuple[list, list]:
         """Convertit le match en un tuple de listes pour la sérialisation.
 
-        Format: ([player1_dict, score1], [player2_dict, score2])
+        Format v2 : ([white_national_chess_id, score1], [black_national_chess_id, score2]).
+        Les joueurs sont référencés par leur identifiant national ; leurs fiches
+        complètes ne sont stockées qu'une fois, dans la liste des joueurs du tournoi.
 
         Returns:
             tuple[list, list]: Le match sérialisé.
         """
         return (
-            [self.white_player.to_record(), self.white_player_score],
-            [self.black_player.to_record(), self.black_player_score],
+            [self.white_player.national_chess_id, self.white_player_score],
+            [self.black_player.national_chess_id, self.black_player_score],
         )
 
     @staticmethod
-    def from_tuple(data: tuple[list, list], players: list[Player]) -> "Match":
-        """Reconstruit un Match depuis un tuple et la liste des joueurs du tournoi.
+    def from_tuple(data: tuple[list, list], players_by_id: Dict[str, Player]) -> "Match":
+        """Reconstruit un Match depuis un tuple et l'index des joueurs du tournoi.
 
-        Tente de lier les joueurs du match aux instances existantes dans la liste `players`
-        via leur nom. Si non trouvé, crée une nouvelle instance de Player (ce qui ne devrait
-        idéalement pas arriver si la liste players est complète).
+        Accepte les deux formats :
+            - v2 : chaque côté référence le joueur par son national_chess_id ;
+            - v1 : chaque côté embarque la fiche complète du joueur (dict), dont
+              seul l'identifiant national est utilisé.
 
         Args:
             data (tuple[list, list]): Données du match (format exporté par to_tuple).
-            players (list[Player]): Liste des objets Player du tournoi en cours.
+            players_by_id (Dict[str, Player]): Joueurs du tournoi indexés par identifiant national.
 
         Returns:
             Match: L'instance de Match reconstituée.
+
+        Raises:
+            ValueError: Si un joueur référencé n'est pas inscrit au tournoi.
         """
-        data = tuple(data)
         p1, p2 = data
 
-        # Retrouver l'objet Player existant ou le recréer
-        white = next(
-            (p for p in players if p.name == p1[0]["name"]), Player.from_record(p1[0])
-        )
-        black = next(
-            (p for p in players if p.name == p2[0]["name"]), Player.from_record(p2[0])
-        )
-
         return Match(
-            white_player=white,
-            white_player_score=p1[1],
-            black_player=black,
-            black_player_score=p2[1],
+            white_player=Match._resolve_player(p1[0], players_by_id),
+            white_player_score=_SCORES.get(p1[1], p1[1]),
+            black_player=Match._resolve_player(p2[0], players_by_id),
+            black_player_score=_SCORES.get(p2[1], p2[1]),
         )
+
+    @staticmethod
+    def _resolve_player(ref, players_by_id: Dict[str, Player]) -> Player:
+        """Retrouve le joueur désigné par une référence v2 (identifiant) ou v1 (dict).
+
+        Args:
+            ref (str | dict): L'identifiant national ou la fiche embarquée du joueur.
+            players_by_id (Dict[str, Player]): Joueurs du tournoi indexés par identifiant national.
+
+        Returns:
+            Player: L'instance existante.
+
+        Raises:
+            ValueError: Si le joueur n'est pas inscrit au tournoi.
+        """
+        national_chess_id = ref.get("national_chess_id", "") if isinstance(ref, dict) else ref
+        player = players_by_id.get(national_chess_id)
+        if player is None:
+            raise ValueError(f"match référençant un joueur non inscrit ({national_chess_id!r})")
+        return player
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from array import array
+from math import isnan
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from chessManager.models import Player, Match
+
+_NAN = float("nan")
+
+
+def _score(value: float) -> Optional[float]:
+    """Convertit un score stocké en colonne (nan = pas de score) en score de Match."""
+    return None if isnan(value) else value
+
+
+class MatchView(Match):
+    """Match lu et écrit directement dans les colonnes d'une ronde (voir `MatchColumns`).
+
+    Une vue est créée à chaque accès et ne garde que la position du match :
+    modifier un score ou un joueur met à jour la colonne correspondante.
+    """
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: MatchColumns, row: int):
+        self._columns = columns
+        self._row = row
+
+    @property
+    def white_player(self) -> Player:
+        return self._columns.players[self._columns.white[self._row]]
+
+    @white_player.setter
+    def white_player(self, player: Player):
+        self._columns.white[self._row] = self._columns.position(player.national_chess_id)
+
+    @property
+    def black_player(self) -> Player:
+        return self._columns.players[self._columns.black[self._row]]
+
+    @black_player.setter
+    def black_player(self, player: Player):
+        self._columns.black[self._row] = self._columns.position(player.national_chess_id)
+
+    @property
+    def white_player_score(self) -> Optional[float]:
+        return _score(self._columns.white_score[self._row])
+
+    @white_player_score.setter
+    def white_player_score(self, value: Optional[float]):
+        self._columns.white_score[self._row] = _NAN if value is None else value
+
+    @property
+    def black_player_score(self) -> Optional[float]:
+        return _score(self._columns.black_score[self._row])
+
+    @black_player_score.setter
+    def black_player_score(self, value: Optional[float]):
+        self._columns.black_score[self._row] = _NAN if value is None else value
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Match):
+            return NotImplemented
+        return (
+            self.white_player, self.white_player_score, self.black_player, self.black_player_score
+        ) == (other.white_player, other.white_player_score, other.black_player, other.black_player_score)
+
+    def __repr__(self) -> str:
+        return (
+            f"MatchView(white_player={self.white_player!r}, white_player_score={self.white_player_score!r}, "
+            f"black_player={self.black_player!r}, black_player_score={self.black_player_score!r})"
+        )
+
+
+class MatchColumns:
+    """Matchs d'une ronde stockés en colonnes plutôt qu'en objets.
+
+    Quatre tableaux `array` de 4 octets par match : position du joueur blanc et
+    du joueur noir dans la liste des joueurs du tournoi, score des blancs et
+    des noirs (float32, exact pour 0, 0.5 et 1 ; nan pour un score absent).
+    Un match coûte 16 octets au lieu d'un objet `Match` ; les matchs sont
+    exposés sous forme de `MatchView` créées à la demande.
+
+    S'utilise comme la liste `Round.matches` : longueur, indexation, parcours,
+    `append` d'un `Match`.
+
+    Attributes:
+        players (List[Player]): Les joueurs du tournoi (liste partagée, non copiée).
+        white (array): Position du joueur blanc de chaque match.
+        black (array): Position du joueur noir de chaque match.
+        white_score (array): Score des blancs de chaque match.
+        black_score (array): Score des noirs de chaque match.
+    """
+
+    __slots__ = ("players", "_positions", "white", "black", "white_score", "black_score")
+
+    def __init__(self, players: List[Player], matches: Iterable[Match] = ()):
+        self.players = players
+        self._positions: Dict[str, int] = {}
+        self.white = array("i")
+        self.black = array("i")
+        self.white_score = array("f")
+        self.black_score = array("f")
+        for match in matches:
+            self.append(match)
+
+    def position(self, player_id: str) -> int:
+        """Retourne la position d'un joueur dans la liste des joueurs du tournoi.
+
+        Args:
+            player_id (str): L'identifiant national du joueur.
+
+        Returns:
+            int: Sa position.
+
+        Raises:
+            ValueError: Si le joueur n'est pas inscrit au tournoi.
+        """
+        if player_id not in self._positions:
+            # Joueurs inscrits depuis la dernière recherche : l'index est complété
+            for idx in range(len(self._positions), len(self.players)):
+                self._positions.setdefault(self.players[idx].national_chess_id, idx)
+            if player_id not in self._positions:
+                raise ValueError(f"match référençant un joueur non inscrit ({player_id!r})")
+        return self._positions[player_id]
+
+    def append(self, match: Match):
+        """Ajoute un match en fin de ronde.
+
+        Args:
+            match (Match): Le match à stocker.
+        """
+        self.white.append(self.position(match.white_player.national_chess_id))
+        self.black.append(self.position(match.black_player.national_chess_id))
+        self.white_score.append(_NAN if match.white_player_score is None else match.white_player_score)
+        self.black_score.append(_NAN if match.black_player_score is None else match.black_player_score)
+
+    def append_tuple(self, data: tuple[list, list]):
+        """Ajoute un match sérialisé (format de `Match.to_tuple`) sans créer d'objet Match.
+
+        Args:
+            data (tuple[list, list]): ([identifiant blanc, score], [identifiant noir, score]) ;
+                l'ancien format v1 (fiche complète du joueur) est aussi accepté.
+
+        Raises:
+            ValueError: Si un joueur référencé n'est pas inscrit au tournoi.
+        """
+        (white, white_score), (black, black_score) = data
+        for ref, column in ((white, self.white), (black, self.black)):
+            column.append(self.position(ref.get("national_chess_id", "") if isinstance(ref, dict) else ref))
+        self.white_score.append(_NAN if white_score is None else white_score)
+        self.black_score.append(_NAN if black_score is None else black_score)
+
+    def __len__(self) -> int:
+        return len(self.white)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [MatchView(self, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index de match hors limites")
+        return MatchView(self, index)
+
+    def __iter__(self) -> Iterator[MatchView]:
+        for row in range(len(self)):
+            yield MatchView(self, row)
+
+    def __eq__(self, other) -> bool:
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MatchColumns({len(self)} matchs)"
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Modèle représentant un joueur d'échecs.
 
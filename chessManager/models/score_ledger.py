@@ -0,0 +1,73 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, Mapping
+
+
+@dataclass(slots=True)
+class ScoreLedger:
+    """Registre des points marqués par chaque joueur, ronde par ronde.
+
+    Les points sont indexés par ronde puis par identifiant national : saisir un
+    résultat est en O(1) et annuler une ronde ne parcourt que cette ronde.
+
+    Attributes:
+        rounds (Dict[int, Dict[str, float]]): numéro de ronde → (identifiant → points).
+    """
+
+    rounds: Dict[int, Dict[str, float]] = field(default_factory=dict)
+
+    def set_points(self, round_number: int, player_id: str, points: float) -> float:
+        """Enregistre les points d'un joueur pour une ronde.
+
+        Args:
+            round_number (int): Le numéro de la ronde.
+            player_id (str): L'identifiant national du joueur.
+            points (float): Les points marqués dans cette ronde.
+
+        Returns:
+            float: L'écart avec la valeur précédemment enregistrée, à reporter
+            sur le score cumulé du joueur.
+        """
+        entries = self.rounds.setdefault(round_number, {})
+        previous = entries.get(player_id, 0.0)
+        entries[player_id] = points
+        return points - previous
+
+    def set_round_points(self, round_number: int, points: Mapping[str, float]) -> Dict[str, float]:
+        """Enregistre en une fois les points de plusieurs joueurs pour une ronde.
+
+        Args:
+            round_number (int): Le numéro de la ronde.
+            points (Mapping[str, float]): identifiant → points marqués dans cette ronde.
+
+        Returns:
+            Dict[str, float]: Les écarts avec les valeurs précédentes, par identifiant.
+        """
+        entries = self.rounds.setdefault(round_number, {})
+        deltas = {pid: value - entries.get(pid, 0.0) for pid, value in points.items()}
+        entries.update(points)
+        return deltas
+
+    def points(self, round_number: int, player_id: str) -> float:
+        """Retourne les points d'un joueur pour une ronde.
+
+        Args:
+            round_number (int): Le numéro de la ronde.
+            player_id (str): L'identifiant national du joueur.
+
+        Returns:
+            float: Les points enregistrés (0.0 si aucun).
+        """
+        return self.rounds.get(round_number, {}).get(player_id, 0.0)
+
+    def undo_round(self, round_number: int) -> Dict[str, float]:
+        """Retire une ronde du registre.
+
+        Args:
+            round_number (int): Le numéro de la ronde à annuler.
+
+        Returns:
+            Dict[str, float]: Les points retirés, par identifiant, à soustraire
+            des scores cumulés.
+        """
+        return self.rounds.pop(round_number, {})
@@ -1,11 +1,60 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
-from chessManager.models import Player
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Any, Set, Iterable, Tuple
+from chessManager.models import Player, Match
 from chessManager.models import Round
+from chessManager.models.score_ledger import ScoreLedger
 
+# Statuts d'un tournoi affichés dans les listes
+STATUS_PLANNED = "À venir"
+STATUS_RUNNING = "En cours"
+STATUS_FINISHED = "Terminé"
 
-@dataclass
+
+@dataclass(slots=True)
+class TournamentHeader:
+    """En-tête léger d'un tournoi, suffisant pour les menus et listes.
+
+    Attributes:
+        tournament_id (int): Identifiant attribué par le stockage.
+        name (str): Le nom du tournoi.
+        location (str): Le lieu.
+        start_date (str): La date de début.
+        end_date (str): La date de fin.
+        number_of_rounds (int): Le nombre de tours prévus.
+        player_count (int): Le nombre de joueurs inscrits.
+        rounds_played (int): Le nombre de rondes clôturées.
+        status (str): À venir, En cours ou Terminé.
+    """
+
+    tournament_id: int
+    name: str
+    location: str
+    start_date: str
+    end_date: str
+    number_of_rounds: int
+    player_count: int = 0
+    rounds_played: int = 0
+    status: str = STATUS_PLANNED
+
+    @staticmethod
+    def status_of(number_of_rounds: int, rounds_played: int, started: bool) -> str:
+        """Déduit le statut d'un tournoi de l'avancement de ses rondes.
+
+        Args:
+            number_of_rounds (int): Le nombre de tours prévus.
+            rounds_played (int): Le nombre de rondes clôturées.
+            started (bool): True si au moins un match a été apparié.
+
+        Returns:
+            str: STATUS_PLANNED, STATUS_RUNNING ou STATUS_FINISHED.
+        """
+        if number_of_rounds and rounds_played >= number_of_rounds:
+            return STATUS_FINISHED
+        return STATUS_RUNNING if started or rounds_played else STATUS_PLANNED
+
+
+@dataclass(slots=True)
 class Tournament:
     """Modèle représentant un tournoi d'échecs.
 
@@ -21,6 +70,14 @@ class Tournament:
         players (List[Player]): Liste des joueurs inscrits.
         rounds (List[Round]): Liste des rondes du tournoi.
         current_round (Optional[Round]): La ronde actuellement en cours.
+        tournament_id (Optional[int]): Identifiant attribué par le stockage.
+        ledger (ScoreLedger): Points marqués par joueur et par ronde.
+        tie_break_cache (Dict[Any, Any]): Départages de la dernière ronde clôturée
+            (voir `controllers.tie_breaks`).
+        dirty (bool): True si les joueurs ou leurs scores ont changé depuis la
+            dernière sauvegarde (les rondes portent leur propre indicateur).
+        version (int): Version enregistrée sur laquelle repose l'état en mémoire,
+            incrémentée par le stockage à chaque sauvegarde (concurrence optimiste).
     """
 
     name: str
@@ -33,21 +90,52 @@ class Tournament:
     players: List[Player] = field(default_factory=list)
     rounds: List[Round] = field(default_factory=list)
     current_round: Optional[Round] = None
+    tournament_id: Optional[int] = None
+    version: int = field(default=0, compare=False, repr=False)
+    _players_by_id: Dict[str, Player] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _opponents: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _colors: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    ledger: ScoreLedger = field(default_factory=ScoreLedger, init=False, repr=False, compare=False)
+    tie_break_cache: Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    dirty: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Initialise les rondes après la création de l'instance.
+        """Initialise les rondes et l'index des joueurs après la création de l'instance.
 
         Convertit number_of_rounds en int si nécessaire et prépare la liste
         des rondes si elle est vide.
         """
         self.number_of_rounds = int(self.number_of_rounds)  # Force la conversion en int
+        self._players_by_id = {p.national_chess_id: p for p in self.players}
         if (
             not self.rounds
         ):  # éviter de recréer les rounds lors du chargement depuis JSON
             # Import local pour éviter les cycles si nécessaire,
             # bien que Round soit déjà importé en haut.
             from chessManager.models import Round
-            self.rounds = [Round(name=f"Round {i + 1}") for i in range(self.number_of_rounds)]
+            self.rounds = [Round(round_number=i + 1) for i in range(self.number_of_rounds)]
+        self.rebuild_history()
+
+    def header(self) -> TournamentHeader:
+        """Construit l'en-tête léger du tournoi.
+
+        Returns:
+            TournamentHeader: L'en-tête correspondant.
+        """
+        rounds_played = sum(1 for rnd in self.rounds if rnd.end_datetime is not None)
+        return TournamentHeader(
+            tournament_id=self.tournament_id,
+            name=self.name,
+            location=self.location,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            number_of_rounds=self.number_of_rounds,
+            player_count=len(self.players),
+            rounds_played=rounds_played,
+            status=TournamentHeader.status_of(
+                self.number_of_rounds, rounds_played, any(rnd.matches for rnd in self.rounds)
+            ),
+        )
 
     def add_player(self, player: Player):
         """Ajoute un joueur à la liste des participants.
@@ -56,6 +144,183 @@ class Tournament:
             player (Player): Le joueur à ajouter.
         """
         self.players.append(player)
+        self._players_by_id[player.national_chess_id] = player
+        self.dirty = True
+
+    def has_changes(self) -> bool:
+        """Indique si le tournoi a changé depuis sa dernière sauvegarde.
+
+        Returns:
+            bool: True si les joueurs, leurs scores ou une ronde ont été modifiés.
+        """
+        return self.dirty or any(rnd.dirty for rnd in self.rounds)
+
+    def mark_clean(self):
+        """Marque le tournoi et ses rondes comme sauvegardés."""
+        self.dirty = False
+        for rnd in self.rounds:
+            rnd.dirty = False
+
+    def replace_with(self, other: Tournament):
+        """Remplace l'état du tournoi par celui d'un autre, en gardant l'identité de l'objet.
+
+        Sert à recharger un tournoi depuis le stockage alors que des vues ou
+        des requêtes en cours le référencent encore.
+
+        Args:
+            other (Tournament): Le tournoi relu (il ne doit plus être utilisé ensuite).
+        """
+        for f in fields(self):
+            setattr(self, f.name, getattr(other, f.name))
+        self.rebuild_history()
+
+    def get_player(self, national_chess_id: str) -> Optional[Player]:
+        """Retrouve un joueur inscrit par son identifiant national, en O(1).
+
+        Args:
+            national_chess_id (str): L'identifiant recherché.
+
+        Returns:
+            Optional[Player]: Le joueur, ou None s'il n'est pas inscrit.
+        """
+        return self._players_by_id.get(national_chess_id)
+
+    def rebuild_history(self):
+        """Reconstruit l'historique des adversaires, des couleurs et des points depuis les rondes.
+
+        Rattache aussi chaque ronde au tournoi pour que les matchs ajoutés ensuite
+        via `Round.add_match` mettent l'historique à jour. Les scores cumulés des
+        joueurs ne sont pas modifiés.
+        """
+        self._opponents = {}
+        self._colors = {}
+        self.ledger = ScoreLedger()
+        for rnd in self.rounds:
+            rnd.on_match_added = self.record_pairing
+            for match in rnd.matches:
+                self.record_pairing(match)
+                self.ledger.set_points(
+                    rnd.round_number, match.white_player.national_chess_id, match.white_player_score or 0.0
+                )
+                self.ledger.set_points(
+                    rnd.round_number, match.black_player.national_chess_id, match.black_player_score or 0.0
+                )
+            if rnd.bye is not None:
+                self.ledger.set_points(rnd.round_number, rnd.bye, 1.0)
+
+    def record_result(self, rnd: Round, match: Match, white_score: float, black_score: float):
+        """Enregistre le résultat d'un match et met à jour les scores en O(1).
+
+        Args:
+            rnd (Round): La ronde du match.
+            match (Match): Le match concerné.
+            white_score (float): Score des blancs.
+            black_score (float): Score des noirs.
+        """
+        match.white_player_score = white_score
+        match.black_player_score = black_score
+        self.dirty = rnd.dirty = True
+        for player, points in ((match.white_player, white_score), (match.black_player, black_score)):
+            player.tournament_score_value += self.ledger.set_points(
+                rnd.round_number, player.national_chess_id, points
+            )
+
+    def record_results(self, rnd: Round, results: Iterable[Tuple[Match, float, float]]):
+        """Enregistre les résultats de plusieurs matchs d'une ronde en une seule mise à jour du registre.
+
+        Args:
+            rnd (Round): La ronde des matchs.
+            results (Iterable[Tuple[Match, float, float]]): (match, score blancs, score noirs).
+        """
+        points: Dict[str, float] = {}
+        self.dirty = rnd.dirty = True
+        for match, white_score, black_score in results:
+            match.white_player_score = white_score
+            match.black_player_score = black_score
+            points[match.white_player.national_chess_id] = white_score
+            points[match.black_player.national_chess_id] = black_score
+        for player_id, delta in self.ledger.set_round_points(rnd.round_number, points).items():
+            self._players_by_id[player_id].tournament_score_value += delta
+
+    def record_bye(self, rnd: Round, player: Player, points: float = 1.0):
+        """Exempte un joueur pour une ronde et lui attribue les points correspondants.
+
+        Args:
+            rnd (Round): La ronde concernée.
+            player (Player): Le joueur exempté.
+            points (float): Points accordés (1.0 par défaut).
+        """
+        rnd.bye = player.national_chess_id
+        self.dirty = rnd.dirty = True
+        player.tournament_score_value += self.ledger.set_points(
+            rnd.round_number, player.national_chess_id, points
+        )
+
+    def undo_round_scores(self, rnd: Round):
+        """Retire des scores cumulés les seuls points marqués lors d'une ronde.
+
+        Args:
+            rnd (Round): La ronde à annuler.
+        """
+        self.dirty = rnd.dirty = True
+        for player_id, points in self.ledger.undo_round(rnd.round_number).items():
+            player = self.get_player(player_id)
+            if player is not None:
+                player.tournament_score_value -= points
+
+    def reset_scores(self):
+        """Remet à zéro les scores de tous les joueurs et vide le registre des points."""
+        for player in self.players:
+            player.tournament_score_value = 0.0
+        self.ledger = ScoreLedger()
+        self.dirty = True
+
+    def record_pairing(self, match: Match):
+        """Enregistre un appariement dans l'historique des adversaires et des couleurs.
+
+        Args:
+            match (Match): Le match ajouté.
+        """
+        white = match.white_player.national_chess_id
+        black = match.black_player.national_chess_id
+        self._opponents.setdefault(white, set()).add(black)
+        self._opponents.setdefault(black, set()).add(white)
+        self._colors.setdefault(white, []).append("W")
+        self._colors.setdefault(black, []).append("B")
+
+    def have_played(self, player1: Player, player2: Player) -> bool:
+        """Vérifie en O(1) si deux joueurs se sont déjà affrontés dans ce tournoi.
+
+        Args:
+            player1 (Player): Le premier joueur.
+            player2 (Player): Le deuxième joueur.
+
+        Returns:
+            bool: True si un match (dans n'importe quel sens) a déjà été apparié.
+        """
+        return player2.national_chess_id in self._opponents.get(player1.national_chess_id, ())
+
+    def opponents_of(self, player: Player) -> Set[str]:
+        """Retourne les identifiants des adversaires déjà rencontrés par un joueur.
+
+        Args:
+            player (Player): Le joueur concerné.
+
+        Returns:
+            Set[str]: Les identifiants nationaux de ses adversaires.
+        """
+        return self._opponents.get(player.national_chess_id, set())
+
+    def color_history(self, player: Player) -> List[str]:
+        """Retourne les couleurs jouées par un joueur, dans l'ordre des rondes.
+
+        Args:
+            player (Player): Le joueur concerné.
+
+        Returns:
+            List[str]: "W" (blancs) ou "B" (noirs) pour chaque match apparié.
+        """
+        return self._colors.get(player.national_chess_id, [])
 
     def player_list(self) -> List[Player]:
         """Retourne la liste des joueurs du tournoi.
@@ -114,6 +379,8 @@ class Tournament:
             Dict[str, Any]: Représentation dictionnaire du tournoi.
         """
         return {
+            "id": self.tournament_id,
+            "version": self.version,
             "name": self.name,
             "location": self.location,
             "start_date": self.start_date,
@@ -125,15 +392,18 @@ class Tournament:
         }
 
     @staticmethod
-    def from_record(data: Dict[str, Any]) -> Tournament:
+    def from_record(data: Dict[str, Any], columnar: bool = False) -> Tournament:
         """Reconstruit une instance de Tournament à partir d'un dictionnaire.
 
         Args:
             data (Dict[str, Any]): Données du tournoi.
+            columnar (bool): Stocker les matchs en colonnes (`MatchColumns`) :
+                moins de mémoire pour les tournois archivés volumineux.
 
         Returns:
             Tournament: L'instance reconstruite.
         """
+        players = [Player.from_record(p) for p in data.get("players", [])]
         tournament = Tournament(
             name=data["name"],
             location=data["location"],
@@ -141,12 +411,19 @@ class Tournament:
             end_date=data["end_date"],
             number_of_rounds=data["number_of_rounds"],
             description=data.get("description"),
+            players=players,
+            tournament_id=data.get("id"),
+            version=data.get("version", 0),
         )
-        tournament.players = [Player.from_record(p) for p in data.get("players", [])]
 
-        # Reconstruction des rondes avec les joueurs associés
-        # Nécessite que Round.from_record gère correctement le lien avec les joueurs existants
-        tournament.rounds = [
-            Round.from_record(r, tournament.players) for r in data.get("rounds", [])
-        ]
+        # Reconstruction des rondes : un seul index identifiant → joueur, partagé
+        # par tous les matchs, rend l'hydratation linéaire
+        try:
+            tournament.rounds = [
+                Round.from_record(r, tournament._players_by_id, players if columnar else None)
+                for r in data.get("rounds", [])
+            ]
+        except ValueError as e:
+            raise ValueError(f"Tournoi « {tournament.name} » : {e}") from e
+        tournament.rebuild_history()
         return tournament
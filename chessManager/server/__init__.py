@@ -0,0 +1,10 @@
+from .http import HttpClient, HttpError
+from .service import TournamentService
+from .app import serve
+
+__all__ = [
+    "HttpClient",
+    "HttpError",
+    "TournamentService",
+    "serve",
+]
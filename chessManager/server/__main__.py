@@ -0,0 +1,42 @@
+"""Serveur HTTP local des tournois : python -m chessManager.server [--host 127.0.0.1] [--port 8765]
+
+Expose les opérations du contrôleur (liste des tournois, inscription,
+appariement, saisie des résultats, classement) en JSON pour plusieurs
+arbitres simultanés. Voir `chessManager.server.app` pour les routes.
+"""
+
+import argparse
+import asyncio
+
+from constant import SERVER_HOST, SERVER_PORT
+from chessManager.controllers.tournaments_control import TournamentController
+from chessManager.server import TournamentService, serve
+
+
+async def run(host: str, port: int):
+    """Sert l'API jusqu'à l'interruption du processus."""
+    service = TournamentService(TournamentController())
+    server = await serve(service, host, port)
+    address = server.sockets[0].getsockname()
+    print(f"🚀 API des tournois sur http://{address[0]}:{address[1]} (Ctrl+C pour arrêter)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chessManager.server", description=__doc__)
+    parser.add_argument("--host", default=SERVER_HOST, help="adresse d'écoute")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="port d'écoute")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(run(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Serveur arrêté.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
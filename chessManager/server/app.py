@@ -0,0 +1,96 @@
+"""Routes de l'API HTTP/JSON et boucle de service des connexions.
+
+Routes :
+    GET  /tournaments                       en-têtes de tous les tournois
+    POST /tournaments/{id}/players          inscrire un joueur
+    GET  /tournaments/{id}/rounds/current   appariements de la ronde en cours
+    POST /tournaments/{id}/rounds           apparier la ronde en cours
+    POST /tournaments/{id}/results          saisir un ou plusieurs résultats
+    GET  /tournaments/{id}/standings        classement et départages
+"""
+
+import asyncio
+import re
+import traceback
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from chessManager.server.http import HttpError, Request, encode_response, read_request
+from chessManager.server.service import TournamentService
+
+# Un gestionnaire reçoit le service, la requête puis les identifiants extraits du chemin
+Handler = Callable[..., Awaitable[Any]]
+
+ROUTES: List[Tuple[str, re.Pattern, Handler, int]] = [
+    ("GET", re.compile(r"/tournaments"), lambda s, r: s.list_tournaments(), 200),
+    ("POST", re.compile(r"/tournaments/(\d+)/players"), lambda s, r, t: s.register_player(t, r.json()), 201),
+    ("GET", re.compile(r"/tournaments/(\d+)/rounds/current"), lambda s, r, t: s.current_round(t), 200),
+    ("POST", re.compile(r"/tournaments/(\d+)/rounds"), lambda s, r, t: s.pair_round(t), 201),
+    ("POST", re.compile(r"/tournaments/(\d+)/results"), lambda s, r, t: s.submit_results(t, r.json()), 200),
+    ("GET", re.compile(r"/tournaments/(\d+)/standings"), lambda s, r, t: s.standings(t), 200),
+]
+
+
+async def dispatch(service: TournamentService, request: Request) -> Tuple[int, Any]:
+    """Exécute la route correspondant à une requête.
+
+    Returns:
+        Tuple[int, Any]: Le code HTTP et le contenu de la réponse.
+
+    Raises:
+        HttpError: 404 si aucune route ne correspond, 405 si la méthode n'est pas acceptée.
+    """
+    allowed = False
+    for method, pattern, handler, status in ROUTES:
+        match = pattern.fullmatch(request.path)
+        if match is None:
+            continue
+        if method != request.method:
+            allowed = True
+            continue
+        args = [int(group) for group in match.groups()]
+        return status, await handler(service, request, *args)
+    if allowed:
+        raise HttpError(405, f"Méthode {request.method} non acceptée sur {request.path}")
+    raise HttpError(404, f"Route inconnue : {request.path}")
+
+
+async def handle_connection(service: TournamentService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Sert les requêtes d'une connexion jusqu'à sa fermeture (connexion persistante)."""
+    try:
+        while True:
+            keep_alive = False
+            try:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                keep_alive = request.keep_alive
+                status, payload = await dispatch(service, request)
+            except HttpError as e:
+                status, payload = e.status, {"error": e.message}
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            except Exception as e:
+                traceback.print_exc()
+                status, payload = 500, {"error": str(e)}
+            writer.write(encode_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service: TournamentService, host: str, port: int) -> asyncio.Server:
+    """Démarre le serveur HTTP (le port 0 choisit un port libre).
+
+    Args:
+        service (TournamentService): Les opérations exposées.
+        host (str): L'adresse d'écoute.
+        port (int): Le port d'écoute.
+
+    Returns:
+        asyncio.Server: Le serveur démarré.
+    """
+    return await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port)
@@ -0,0 +1,214 @@
+"""HTTP/1.1 minimal sur les flux asyncio : requêtes et réponses JSON, connexions persistantes.
+
+Seul ce dont l'API a besoin est pris en charge : corps de longueur connue
+(`Content-Length`, pas de `chunked`), JSON en UTF-8, `Connection: keep-alive`
+par défaut. Le client (`HttpClient`) sert au générateur de charge.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from chessManager.storage import get_codec
+
+# Taille maximale d'un corps de requête
+MAX_BODY_SIZE = 1 << 20
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    """Erreur renvoyée au client avec un code HTTP et un message."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class Request:
+    """Requête HTTP décodée.
+
+    Attributes:
+        method (str): GET, POST...
+        path (str): Le chemin, sans la chaîne de requête.
+        query (Dict[str, str]): Les paramètres de la chaîne de requête.
+        headers (Dict[str, str]): Les en-têtes (noms en minuscules).
+        body (bytes): Le corps brut.
+    """
+
+    method: str
+    path: str
+    query: Dict[str, str] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @property
+    def keep_alive(self) -> bool:
+        """True si le client garde la connexion ouverte après la réponse."""
+        return self.headers.get("connection", "").lower() != "close"
+
+    def json(self) -> Any:
+        """Décode le corps JSON (None si vide).
+
+        Raises:
+            HttpError: 400 si le corps n'est pas du JSON valide.
+        """
+        if not self.body.strip():
+            return None
+        try:
+            return get_codec().loads(self.body)
+        except json.JSONDecodeError as e:
+            raise HttpError(400, f"Corps JSON illisible : {e}")
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Tuple[Optional[str], Dict[str, str]]:
+    """Lit la première ligne et les en-têtes d'un message HTTP.
+
+    Returns:
+        Tuple[Optional[str], Dict[str, str]]: La première ligne (None si la
+        connexion est fermée) et les en-têtes.
+    """
+    line = await reader.readline()
+    if not line:
+        return None, {}
+    headers = {}
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = header.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return line.decode("latin-1").strip(), headers
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str], limit: Optional[int] = None) -> bytes:
+    """Lit un corps de longueur `Content-Length`.
+
+    Raises:
+        HttpError: 400 si la longueur est invalide, 413 si elle dépasse `limit`.
+    """
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "Content-Length invalide")
+    if limit is not None and length > limit:
+        raise HttpError(413, f"Corps trop volumineux (maximum {limit} octets)")
+    return await reader.readexactly(length) if length else b""
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Lit une requête sur une connexion.
+
+    Returns:
+        Optional[Request]: La requête, ou None si le client a fermé la connexion.
+
+    Raises:
+        HttpError: 400 si la requête est mal formée.
+    """
+    line, headers = await _read_head(reader)
+    if line is None:
+        return None
+    try:
+        method, target, _ = line.split(" ", 2)
+    except ValueError:
+        raise HttpError(400, f"Ligne de requête invalide : {line}")
+    url = urlsplit(target)
+    return Request(
+        method=method.upper(),
+        path=url.path.rstrip("/") or "/",
+        query=dict(parse_qsl(url.query)),
+        headers=headers,
+        body=await _read_body(reader, headers, MAX_BODY_SIZE),
+    )
+
+
+def encode_response(status: int, payload: Any, keep_alive: bool = True) -> bytes:
+    """Construit une réponse HTTP au corps JSON.
+
+    Args:
+        status (int): Le code HTTP.
+        payload (Any): Le contenu, encodé en JSON compact.
+        keep_alive (bool): Garder la connexion ouverte.
+
+    Returns:
+        bytes: La réponse complète.
+    """
+    body = get_codec().dumps(payload)
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class HttpClient:
+    """Client HTTP/1.1 sur une connexion persistante (une requête à la fois).
+
+    Attributes:
+        host (str): L'hôte du serveur.
+        port (int): Son port.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, Any]:
+        """Envoie une requête et attend la réponse.
+
+        Args:
+            method (str): GET, POST...
+            path (str): Le chemin.
+            payload (Any, optional): Le corps, encodé en JSON.
+
+        Returns:
+            Tuple[int, Any]: Le code HTTP et le corps JSON décodé.
+        """
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        body = b"" if payload is None else get_codec().dumps(payload)
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        self._writer.write(head.encode("latin-1") + body)
+        await self._writer.drain()
+
+        line, headers = await _read_head(self._reader)
+        if line is None:
+            raise ConnectionError("Connexion fermée par le serveur")
+        status = int(line.split(" ", 2)[1])
+        data = await _read_body(self._reader, headers)
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, get_codec().loads(data) if data else None
+
+    async def close(self):
+        """Ferme la connexion."""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._reader = self._writer = None
@@ -0,0 +1,248 @@
+"""Opérations du contrôleur des tournois pour plusieurs arbitres simultanés.
+
+Chaque tournoi a son verrou asyncio : les requêtes d'un même tournoi sont
+appliquées l'une après l'autre, celles de tournois différents en parallèle.
+Tous les accès au stockage passent par un unique thread dédié, la boucle
+d'événements n'attend donc jamais le disque.
+
+Une requête modifie le tournoi en mémoire sous son verrou, le relâche, puis
+attend que la modification soit sauvegardée avant de répondre. Les tournois
+modifiés pendant une sauvegarde sont sauvegardés ensemble à la suivante, en
+une seule ligne de journal (voir `TournamentController.save_changes`) : dix
+arbitres qui saisissent des résultats en même temps partagent les mêmes
+écritures disque.
+
+D'autres programmes peuvent écrire dans le même dossier Data/ : un tournoi
+sans modification en attente est rechargé s'il a changé (vérifié au plus
+toutes les `SERVER_REFRESH_INTERVAL` secondes, pour ne pas passer par le
+thread du stockage à chaque requête), et une requête dont la sauvegarde est refusée (conflit, voir
+`TournamentController.save_changes`) reçoit une erreur 409.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from constant import DB_LICENSED_PLAYERS, SERVER_REFRESH_INTERVAL
+from chessManager.models import Player, Tournament
+from chessManager.controllers.results_import import apply_round_results
+from chessManager.controllers.rounds_control import pair_first_round, prepare_next_round, round_summary
+from chessManager.controllers.tie_breaks import standings_rows
+from chessManager.controllers.tournaments_control import TournamentController
+from chessManager.server.http import HttpError
+from chessManager.storage import registry_for
+
+
+class TournamentService:
+    """Façade asynchrone du contrôleur des tournois.
+
+    Attributes:
+        controller (TournamentController): Le contrôleur, utilisé uniquement
+            depuis le thread du stockage.
+        executor (ThreadPoolExecutor): Le thread du stockage.
+    """
+
+    def __init__(self, controller: TournamentController):
+        self.controller = controller
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chessManager-store")
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._open: Dict[int, Tournament] = {}
+        self._checked: Dict[int, float] = {}
+        self._pending: Dict[int, Tournament] = {}
+        self._waiters: List[Tuple[int, asyncio.Future]] = []
+        self._committer: Optional[asyncio.Task] = None
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        """Exécute une fonction dans le thread du stockage."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def _lock(self, tournament_id: int) -> asyncio.Lock:
+        """Retourne le verrou d'un tournoi."""
+        return self._locks.setdefault(tournament_id, asyncio.Lock())
+
+    async def _tournament(self, tournament_id: int) -> Tournament:
+        """Retourne un tournoi ouvert (à appeler sous son verrou), chargé au premier accès.
+
+        Raises:
+            HttpError: 404 si le tournoi n'existe pas.
+        """
+        tournament = self._open.get(tournament_id)
+        now = asyncio.get_running_loop().time()
+        if tournament is not None and now - self._checked[tournament_id] < SERVER_REFRESH_INTERVAL:
+            return tournament
+        try:
+            tournament = await self._run(self._load, tournament_id, tournament)
+        except KeyError:
+            raise HttpError(404, f"Tournoi introuvable : {tournament_id}")
+        self._open[tournament_id] = tournament
+        self._checked[tournament_id] = now
+        return tournament
+
+    def _load(self, tournament_id: int, tournament: Optional[Tournament]) -> Tournament:
+        """Charge un tournoi, ou recharge celui déjà ouvert si un autre processus l'a modifié (thread du stockage).
+
+        Un tournoi dont des modifications attendent leur sauvegarde n'est pas
+        rechargé : le conflit éventuel est traité à la sauvegarde.
+        """
+        store = self.controller.store
+        if tournament is None:
+            return store.load_tournament(tournament_id)
+        if not tournament.has_changes() and store.version_of(tournament_id) not in (None, tournament.version):
+            tournament.replace_with(store.load_tournament(tournament_id))
+        return tournament
+
+    async def _commit(self, tournament: Tournament):
+        """Attend que les modifications d'un tournoi soient sauvegardées (validation groupée).
+
+        À appeler après avoir relâché le verrou du tournoi.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending[tournament.tournament_id] = tournament
+        self._waiters.append((tournament.tournament_id, future))
+        if self._committer is None or self._committer.done():
+            self._committer = asyncio.create_task(self._commit_pending())
+        await future
+
+    async def _commit_pending(self):
+        """Sauvegarde les tournois en attente jusqu'à ce qu'il n'y en ait plus.
+
+        Les verrous des tournois sauvegardés sont pris (par identifiant croissant)
+        le temps de la sérialisation, pour qu'aucune requête ne les modifie
+        pendant leur écriture. Les requêtes d'un tournoi dont les modifications
+        sont refusées reçoivent une erreur 409.
+        """
+        while self._pending:
+            tournaments = [self._pending[tid] for tid in sorted(self._pending)]
+            waiters, self._pending, self._waiters = self._waiters, {}, []
+            try:
+                async with AsyncExitStack() as stack:
+                    for tournament in tournaments:
+                        await stack.enter_async_context(self._lock(tournament.tournament_id))
+                    saved = await self._run(self.controller.save_changes, *tournaments)
+            except Exception as e:
+                await self._discard_unsaved(tournaments)
+                for _, future in waiters:
+                    future.set_exception(e)
+                continue
+            saved_ids = {tournament.tournament_id for tournament in saved}
+            for tournament_id, future in waiters:
+                if tournament_id in saved_ids:
+                    future.set_result(None)
+                else:
+                    future.set_exception(
+                        HttpError(409, f"Tournoi {tournament_id} modifié par un autre processus : requête annulée")
+                    )
+
+    async def _discard_unsaved(self, tournaments: List[Tournament]):
+        """Rétablit l'état enregistré des tournois dont la sauvegarde a échoué (erreur disque...).
+
+        Sans cela, les modifications refusées au client resteraient dans le
+        tournoi ouvert et partiraient avec la sauvegarde suivante. Un tournoi
+        qui ne peut pas être relu est retiré des tournois ouverts : il sera
+        chargé au prochain accès.
+        """
+        store = self.controller.store
+        for tournament in tournaments:
+            tournament_id = tournament.tournament_id
+            async with self._lock(tournament_id):
+                try:
+                    tournament.replace_with(await self._run(store.load_tournament, tournament_id))
+                except Exception:
+                    self._open.pop(tournament_id, None)
+
+    async def list_tournaments(self) -> Dict[str, Any]:
+        """Liste les en-têtes des tournois."""
+        headers = await self._run(self.controller.list_tournaments)
+        return {"tournaments": [asdict(h) for h in headers]}
+
+    async def register_player(self, tournament_id: int, data: Any) -> Dict[str, Any]:
+        """Inscrit un joueur à un tournoi et l'ajoute au registre des licenciés.
+
+        Raises:
+            HttpError: 400 si le joueur est incomplet, 409 s'il est déjà inscrit.
+        """
+        if not isinstance(data, dict) or not all(data.get(key) for key in ("name", "birthdate", "national_chess_id")):
+            raise HttpError(400, "Joueur incomplet : name, birthdate et national_chess_id sont requis")
+        player = Player.from_record(data)
+        async with self._lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            if tournament.get_player(player.national_chess_id) is not None:
+                raise HttpError(409, f"Joueur déjà inscrit : {player.national_chess_id}")
+            tournament.add_player(player)
+        await self._commit(tournament)
+        await self._run(registry_for(DB_LICENSED_PLAYERS).add_missing, [player])
+        return {"player": player.to_record()}
+
+    async def pair_round(self, tournament_id: int) -> Dict[str, Any]:
+        """Apparie la ronde en cours (tirage au sort pour la première, système suisse ensuite).
+
+        Raises:
+            HttpError: 409 si le tournoi est terminé, si la ronde est déjà
+                appariée ou s'il n'y a pas assez de joueurs.
+        """
+        async with self._lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            rnd = tournament.get_current_round()
+            if rnd is None:
+                raise HttpError(409, "Tournoi terminé")
+            if rnd.matches:
+                raise HttpError(409, f"Round {rnd.round_number} déjà apparié")
+            rnd = pair_first_round(tournament) if rnd.round_number == 1 else prepare_next_round(tournament)
+            if rnd is None:
+                raise HttpError(409, "Pas assez de joueurs")
+            payload = round_summary(rnd)
+        await self._commit(tournament)
+        return payload
+
+    async def current_round(self, tournament_id: int) -> Dict[str, Any]:
+        """Retourne les appariements et résultats de la ronde en cours.
+
+        Raises:
+            HttpError: 409 si le tournoi est terminé.
+        """
+        async with self._lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            rnd = tournament.get_current_round()
+            if rnd is None:
+                raise HttpError(409, "Tournoi terminé")
+            return round_summary(rnd)
+
+    async def submit_results(self, tournament_id: int, data: Any) -> Dict[str, Any]:
+        """Enregistre un ou plusieurs résultats de la ronde en cours.
+
+        Le corps est une ligne au format des fichiers de résultats
+        (`board`, `white`, `black`, `result`, `black_result`) ou
+        `{"results": [...]}`. La ronde est clôturée et la suivante appariée
+        lorsque tous les échiquiers ont un résultat.
+
+        Raises:
+            HttpError: 422 si aucun résultat n'a pu être appliqué.
+        """
+        rows = data.get("results", [data]) if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            raise HttpError(400, "Résultat attendu : objet ou liste d'objets")
+        async with self._lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            report = apply_round_results(tournament, enumerate(rows, start=1))
+        if report.applied:
+            await self._commit(tournament)
+        payload = asdict(report)
+        if report.rejected and not report.applied:
+            raise HttpError(422, "; ".join(f"ligne {r.line} : {r.reason}" for r in report.rejected))
+        return payload
+
+    async def standings(self, tournament_id: int) -> Dict[str, Any]:
+        """Retourne le classement, départages compris."""
+        async with self._lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            rows = standings_rows(tournament)
+        return {"standings": rows}
+
+    async def close(self):
+        """Termine les sauvegardes en cours puis arrête le thread du stockage."""
+        if self._committer is not None:
+            await self._committer
+        self.executor.shutdown(wait=True)
+        self.controller.store.close()
@@ -0,0 +1,68 @@
+"""Stockage des tournois et des joueurs licenciés.
+
+Les noms exportés sont importés à leur premier accès (`__getattr__`) : une
+commande qui ne lit que le catalogue n'importe ni SQLite, ni le registre des
+joueurs, ni l'index de recherche.
+"""
+
+import importlib
+
+# Nom exporté → module qui le définit
+_EXPORTS = {
+    "get_codec": ".codec",
+    "TournamentJournal": ".journal",
+    "TournamentStore": ".base",
+    "ConflictError": ".base",
+    "FileLock": ".locking",
+    "TournamentCatalog": ".catalog",
+    "JsonTournamentStore": ".json_store",
+    "SqliteTournamentStore": ".sqlite_store",
+    "LicensedPlayerRegistry": ".player_registry",
+    "registry_for": ".player_registry",
+    "PlayerSearchIndex": ".player_search",
+    "search_index_for": ".player_search",
+    "lookup_player": ".player_search",
+}
+
+# Backend → classe de stockage (importée par `open_store`)
+BACKENDS = {
+    "json": "JsonTournamentStore",
+    "sqlite": "SqliteTournamentStore",
+}
+
+
+def __getattr__(name: str):
+    """Importe à la demande le module d'un nom exporté."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+def open_store(backend: str = None):
+    """Instancie le backend de stockage demandé.
+
+    Args:
+        backend (str, optional): "json" ou "sqlite" (défaut : constant.STORAGE_BACKEND).
+
+    Returns:
+        TournamentStore: Le backend prêt à l'emploi.
+
+    Raises:
+        ValueError: Si le backend est inconnu.
+    """
+    from constant import STORAGE_BACKEND
+
+    name = backend or STORAGE_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Backend de stockage inconnu : {name}")
+    return __getattr__(BACKENDS[name])()
+
+
+__all__ = [*_EXPORTS, "BACKENDS", "open_store"]
@@ -0,0 +1,129 @@
+"""Écritures sûres en cas d'arrêt brutal.
+
+Un fichier réécrit en entier l'est dans un fichier temporaire voisin
+(`.<pid>.tmp`, propre au processus qui écrit),
+forcé sur disque (fsync) puis renommé : le fichier d'origine reste intact tant
+que le nouveau n'est pas complet. Un ajout en fin de fichier est forcé sur
+disque avant de rendre la main. `DURABLE_WRITES` désactive les fsync (tests,
+mesures) sans changer l'ordre des écritures.
+"""
+
+import glob
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+from constant import DURABLE_WRITES
+
+
+# Suffixe d'un fichier temporaire : `.tmp` (anciennes versions) ou `.<pid>.tmp`
+_TEMPORARY_SUFFIX = re.compile(r"(?:\.(\d+))?\.tmp")
+
+
+def temporary_path(path: Path) -> Path:
+    """Retourne le fichier temporaire utilisé par ce processus pour réécrire `path`.
+
+    Le numéro de processus dans le nom évite que deux programmes ouverts sur
+    le même dossier Data/ écrivent le même fichier temporaire.
+    """
+    return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+
+def _process_alive(pid: int) -> bool:
+    """Indique si un processus est en cours d'exécution (toujours True sous Windows, par prudence)."""
+    if os.name == "nt" or pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def fsync_directory(directory: Path):
+    """Force sur disque le contenu d'un dossier (renommage d'un fichier).
+
+    Sans effet sur les systèmes qui ne permettent pas d'ouvrir un dossier (Windows).
+
+    Args:
+        directory (Path): Le dossier concerné.
+    """
+    if not DURABLE_WRITES or not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "wb", encoding: str = None) -> Iterator[IO]:
+    """Réécrit un fichier en entier, de façon atomique.
+
+    Args:
+        path (Path): Le fichier à remplacer.
+        mode (str): "wb" ou "w".
+        encoding (str, optional): L'encodage en mode texte.
+
+    Yields:
+        IO: Le fichier temporaire ouvert en écriture ; il remplace `path` à la
+        sortie du bloc, ou est supprimé si une exception est levée.
+    """
+    path = Path(path)
+    tmp_path = temporary_path(path)
+    f = open(tmp_path, mode, encoding=encoding)
+    try:
+        yield f
+        f.flush()
+        if DURABLE_WRITES:
+            os.fsync(f.fileno())
+    except BaseException:
+        f.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    f.close()
+    os.replace(tmp_path, path)
+    fsync_directory(path.parent)
+
+
+def append_durable(path: Path, data: bytes):
+    """Ajoute des octets en fin de fichier en une seule écriture, forcée sur disque.
+
+    Args:
+        path (Path): Le fichier complété (créé s'il n'existe pas).
+        data (bytes): Les octets à ajouter.
+    """
+    with open(path, "ab") as f:
+        f.write(data)
+        f.flush()
+        if DURABLE_WRITES:
+            os.fsync(f.fileno())
+
+
+def discard_partial(path: Path) -> bool:
+    """Supprime les fichiers temporaires laissés par des réécritures interrompues.
+
+    Le renommage n'ayant pas eu lieu, le fichier d'origine est toujours valide.
+    Le fichier temporaire d'un processus encore en cours d'exécution est
+    laissé : sa réécriture est peut-être en cours.
+
+    Args:
+        path (Path): Le fichier dont la réécriture a pu être interrompue.
+
+    Returns:
+        bool: True si un fichier temporaire a été supprimé.
+    """
+    path = Path(path)
+    removed = False
+    for tmp_path in path.parent.glob(glob.escape(path.name) + ".*tmp"):
+        match = _TEMPORARY_SUFFIX.fullmatch(tmp_path.name[len(path.name):])
+        if match is None or (match.group(1) and _process_alive(int(match.group(1)))):
+            continue
+        tmp_path.unlink(missing_ok=True)
+        removed = True
+    return removed
@@ -0,0 +1,167 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from chessManager.models import Tournament, TournamentHeader, Player, Round
+
+
+class ConflictError(Exception):
+    """Écriture refusée : le tournoi a été modifié par un autre processus depuis son chargement.
+
+    Attributes:
+        tournament_id (int): Le tournoi concerné.
+        expected (int): La version sur laquelle reposait la modification.
+        current (int): La version enregistrée.
+    """
+
+    def __init__(self, tournament_id: int, expected: int, current: int):
+        super().__init__(
+            f"Tournoi {tournament_id} modifié par un autre processus "
+            f"(version enregistrée {current}, modification faite sur la version {expected})."
+        )
+        self.tournament_id = tournament_id
+        self.expected = expected
+        self.current = current
+
+
+class TournamentStore(ABC):
+    """Interface commune des backends de stockage des tournois.
+
+    Les contrôleurs ne manipulent que cette interface : chaque mutation est
+    persistée au plus près de ce qui a changé (un joueur, une ronde) plutôt
+    qu'en réécrivant toute la base.
+
+    Plusieurs processus peuvent partager les mêmes données : chaque tournoi
+    porte un compteur de version (`Tournament.version`), comparé à la version
+    enregistrée à chaque écriture (concurrence optimiste).
+    """
+
+    def source_paths(self) -> List[Path]:
+        """Liste les fichiers où le backend persiste les tournois.
+
+        Leur état (date de modification, taille) sert à valider le catalogue
+        des tournois (voir `TournamentCatalog`).
+
+        Returns:
+            List[Path]: Les fichiers de données, existants ou non.
+        """
+        return []
+
+    @abstractmethod
+    def list_headers(self) -> List[TournamentHeader]:
+        """Liste les en-têtes de tous les tournois, sans joueurs ni rondes.
+
+        Returns:
+            List[TournamentHeader]: Les en-têtes, dans l'ordre de création.
+        """
+        ...
+
+    def version_of(self, tournament_id: int) -> Optional[int]:
+        """Retourne la version enregistrée d'un tournoi, écritures des autres processus comprises.
+
+        Chaque sauvegarde d'un tournoi incrémente sa version ; un tournoi en
+        mémoire dont `Tournament.version` diffère est périmé.
+
+        Args:
+            tournament_id (int): L'identifiant du tournoi.
+
+        Returns:
+            Optional[int]: La version, ou None si le backend ne les suit pas.
+        """
+        return None
+
+    def external_changes(self) -> bool:
+        """Indique si d'autres processus ont écrit depuis le dernier appel.
+
+        Permet de savoir si des en-têtes tenus à jour en mémoire doivent être relus.
+
+        Returns:
+            bool: True si des écritures extérieures ont pu avoir lieu (True au premier appel).
+        """
+        return False
+
+    @abstractmethod
+    def load_tournament(self, tournament_id: int) -> Tournament:
+        """Reconstruit un tournoi complet (joueurs, rondes, matchs).
+
+        Args:
+            tournament_id (int): L'identifiant du tournoi.
+
+        Returns:
+            Tournament: Le tournoi reconstruit.
+
+        Raises:
+            KeyError: Si le tournoi n'existe pas.
+        """
+        ...
+
+    def load_tournaments(self) -> List[Tournament]:
+        """Charge tous les tournois stockés.
+
+        Returns:
+            List[Tournament]: Les tournois reconstruits.
+        """
+        return [self.load_tournament(h.tournament_id) for h in self.list_headers()]
+
+    @abstractmethod
+    def insert_tournament(self, tournament: Tournament):
+        """Enregistre un nouveau tournoi et lui attribue un identifiant.
+
+        Args:
+            tournament (Tournament): Le tournoi à créer.
+        """
+        ...
+
+    @abstractmethod
+    def save_tournament(self, tournament: Tournament):
+        """Réécrit intégralement un tournoi existant.
+
+        Args:
+            tournament (Tournament): Le tournoi à sauvegarder.
+
+        Raises:
+            ConflictError: Si un autre processus a modifié le tournoi depuis
+                son chargement et que les modifications ne peuvent être fusionnées.
+        """
+        ...
+
+    @abstractmethod
+    def save_players(self, tournament: Tournament, players: List[Player]):
+        """Ajoute ou met à jour des joueurs d'un tournoi.
+
+        Args:
+            tournament (Tournament): Le tournoi concerné.
+            players (List[Player]): Les joueurs nouveaux ou modifiés.
+
+        Raises:
+            ConflictError: Si un autre processus a modifié le tournoi depuis
+                son chargement et que les modifications ne peuvent être fusionnées.
+        """
+        ...
+
+    @abstractmethod
+    def save_round(self, tournament: Tournament, rnd: Round):
+        """Ajoute ou met à jour une ronde et ses matchs.
+
+        Args:
+            tournament (Tournament): Le tournoi concerné.
+            rnd (Round): La ronde à sauvegarder.
+
+        Raises:
+            ConflictError: Si un autre processus a modifié le tournoi depuis
+                son chargement et que les modifications ne peuvent être fusionnées.
+        """
+        ...
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Regroupe plusieurs écritures en une seule unité atomique.
+
+        L'implémentation par défaut n'apporte aucune garantie supplémentaire.
+        """
+        yield
+
+    def close(self):
+        """Libère les ressources du backend."""
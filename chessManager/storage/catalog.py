@@ -0,0 +1,109 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+from constant import DEFAULT_ENCODING
+from chessManager.models import TournamentHeader
+from chessManager.storage.atomic import atomic_write
+from chessManager.storage.base import TournamentStore
+
+# Version du fichier catalogue (à incrémenter si TournamentHeader change)
+CATALOG_VERSION = 1
+
+
+class TournamentCatalog:
+    """Catalogue persistant des en-têtes de tournois (une ligne de résumé par tournoi).
+
+    Le catalogue est enregistré à côté du premier fichier du backend
+    (Data/tournaments/manifest.catalog.json pour le backend JSON,
+    Data/chessManager.catalog.json pour SQLite) avec l'état de chaque
+    fichier de données (date de modification en ns, taille) au moment de son
+    écriture. Le contrôleur le lit au démarrage sans décoder la base ; s'il ne
+    correspond plus aux fichiers (modification par un autre processus, arrêt
+    avant sa mise à jour), il est reconstruit depuis le backend.
+
+    Le contrôleur le réécrit après chaque mutation, une fois la sauvegarde du
+    tournoi terminée, pour que l'état enregistré couvre cette sauvegarde. Il
+    est écrit dans une transaction du backend (sous son verrou) : aucun autre
+    processus ne peut écrire entre la lecture des en-têtes et l'enregistrement
+    de l'état des fichiers.
+
+    Attributes:
+        sources (List[Path]): Les fichiers de données du backend.
+        path (Path): Le fichier catalogue.
+    """
+
+    def __init__(self, sources: List[Path]):
+        self.sources = [Path(p) for p in sources]
+        self.path = self.sources[0].with_suffix(".catalog.json") if self.sources else None
+
+    def stamp(self) -> List[Optional[List[int]]]:
+        """Identifie l'état des fichiers de données : (mtime en ns, taille), None si absent.
+
+        Returns:
+            List[Optional[List[int]]]: Un état par fichier source.
+        """
+        stamps = []
+        for source in self.sources:
+            try:
+                stat = source.stat()
+            except FileNotFoundError:
+                stamps.append(None)
+                continue
+            stamps.append([stat.st_mtime_ns, stat.st_size])
+        return stamps
+
+    def read(self) -> Optional[List[TournamentHeader]]:
+        """Lit le catalogue s'il correspond encore aux fichiers de données.
+
+        Returns:
+            Optional[List[TournamentHeader]]: Les en-têtes, ou None si le
+            catalogue est absent, illisible ou périmé.
+        """
+        if self.path is None:
+            return None
+        try:
+            with open(self.path, "r", encoding=DEFAULT_ENCODING) as f:
+                data = json.load(f)
+            if data.get("version") != CATALOG_VERSION or data.get("stamp") != self.stamp():
+                return None
+            return [TournamentHeader(**row) for row in data["tournaments"]]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def write(self, headers: List[TournamentHeader]):
+        """Enregistre les en-têtes avec l'état courant des fichiers de données.
+
+        Args:
+            headers (List[TournamentHeader]): Les en-têtes de tous les tournois.
+        """
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.path, "w", encoding=DEFAULT_ENCODING) as f:
+            json.dump(
+                {
+                    "version": CATALOG_VERSION,
+                    "stamp": self.stamp(),
+                    "tournaments": [asdict(h) for h in headers],
+                },
+                f,
+                ensure_ascii=False,
+            )
+
+    def headers(self, store: TournamentStore) -> List[TournamentHeader]:
+        """Retourne les en-têtes du catalogue, reconstruit depuis le backend s'il est périmé.
+
+        Args:
+            store (TournamentStore): Le backend décrit par le catalogue.
+
+        Returns:
+            List[TournamentHeader]: Les en-têtes, dans l'ordre de création.
+        """
+        headers = self.read()
+        if headers is None:
+            with store.transaction():
+                headers = store.list_headers()
+                self.write(headers)
+        return headers
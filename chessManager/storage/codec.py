@@ -0,0 +1,168 @@
+"""Encodage et décodage JSON des fichiers de données.
+
+Trois implémentations interchangeables, choisies par `JSON_CODEC` dans
+constant.py ("auto" : la plus rapide disponible) :
+    - msgspec : décodage typé directement en `Player`, sans dictionnaire
+      intermédiaire (registre des licenciés), et décodage rapide en
+      dictionnaires pour les tournois ;
+    - orjson : encodage et décodage rapides en dictionnaires ;
+    - json (bibliothèque standard) : toujours disponible.
+
+Toutes produisent des octets UTF-8 et lèvent `json.JSONDecodeError` sur un
+document illisible, quelle que soit la bibliothèque sous-jacente. Le mode
+compact (sans indentation, `JSON_COMPACT`) est destiné à la production ;
+sinon les fichiers restent indentés pour être lisibles.
+"""
+
+from __future__ import annotations
+import json
+from typing import Any, Dict, Union
+
+from constant import DEFAULT_ENCODING, JSON_CODEC
+from chessManager.models import Player
+
+Data = Union[bytes, str]
+
+# Ordre de préférence pour JSON_CODEC = "auto"
+CODEC_PREFERENCE = ("msgspec", "orjson", "json")
+
+
+class StdlibCodec:
+    """Codec de la bibliothèque standard (référence et solution de repli)."""
+
+    name = "json"
+
+    def dumps(self, obj: Any, compact: bool = True) -> bytes:
+        """Encode un objet en JSON UTF-8.
+
+        Args:
+            obj (Any): L'objet (dictionnaires, listes, tuples, scalaires).
+            compact (bool): Sans indentation ni espaces superflus.
+
+        Returns:
+            bytes: Le document encodé.
+        """
+        if compact:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        else:
+            text = json.dumps(obj, ensure_ascii=False, indent=4)
+        return text.encode(DEFAULT_ENCODING)
+
+    def loads(self, data: Data) -> Any:
+        """Décode un document JSON en dictionnaires et listes.
+
+        Raises:
+            json.JSONDecodeError: Si le document est illisible (UTF-8 invalide compris).
+        """
+        try:
+            return json.loads(data)
+        except UnicodeDecodeError as e:
+            # Même contrat que les autres codecs : une ligne tronquée peut couper un caractère UTF-8
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    def decode_player(self, data: Data) -> Player:
+        """Décode un enregistrement de joueur.
+
+        Raises:
+            json.JSONDecodeError: Si le document est illisible.
+        """
+        return Player.from_record(self.loads(data))
+
+
+class OrjsonCodec(StdlibCodec):
+    """Codec orjson : mêmes dictionnaires que la bibliothèque standard, plus rapide."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, compact: bool = True) -> bytes:
+        # orjson ne propose que l'indentation à 2 espaces
+        return self._orjson.dumps(obj, option=0 if compact else self._orjson.OPT_INDENT_2)
+
+    def loads(self, data: Data) -> Any:
+        # orjson.JSONDecodeError dérive de json.JSONDecodeError
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(StdlibCodec):
+    """Codec msgspec : décodage typé des joueurs, sans dictionnaire intermédiaire.
+
+    Un joueur qui ne correspond pas au schéma typé (champ manquant) est décodé
+    par le chemin générique `from_record`.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._player_decoder = msgspec.json.Decoder(Player)
+
+    def dumps(self, obj: Any, compact: bool = True) -> bytes:
+        data = self._encoder.encode(obj)
+        return data if compact else self._msgspec.json.format(data, indent=4)
+
+    def _decode(self, decoder, data: Data) -> Any:
+        try:
+            return decoder.decode(data)
+        except self._msgspec.ValidationError:
+            raise
+        except self._msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from e
+
+    def loads(self, data: Data) -> Any:
+        return self._decode(self._decoder, data)
+
+    def decode_player(self, data: Data) -> Player:
+        try:
+            return self._decode(self._player_decoder, data)
+        except self._msgspec.ValidationError:
+            return super().decode_player(data)
+
+
+CODECS = {
+    "msgspec": MsgspecCodec,
+    "orjson": OrjsonCodec,
+    "json": StdlibCodec,
+}
+
+_codecs: Dict[str, StdlibCodec] = {}
+
+
+def get_codec(name: str = None) -> StdlibCodec:
+    """Retourne le codec demandé, instancié une fois par processus.
+
+    Args:
+        name (str, optional): "auto", "msgspec", "orjson" ou "json"
+            (défaut : constant.JSON_CODEC). "auto" retient la première
+            bibliothèque installée de `CODEC_PREFERENCE`.
+
+    Returns:
+        StdlibCodec: Le codec.
+
+    Raises:
+        ValueError: Si le codec est inconnu.
+        ImportError: Si la bibliothèque d'un codec explicitement demandé n'est pas installée.
+    """
+    name = name or JSON_CODEC
+    if name in _codecs:
+        return _codecs[name]
+    if name == "auto":
+        for candidate in CODEC_PREFERENCE:
+            try:
+                codec = get_codec(candidate)
+            except ImportError:
+                continue
+            _codecs[name] = codec
+            return codec
+    if name not in CODECS:
+        raise ValueError(f"Codec JSON inconnu : {name} (auto, {', '.join(CODECS)})")
+    _codecs[name] = CODECS[name]()
+    return _codecs[name]
@@ -0,0 +1,486 @@
+from __future__ import annotations
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from constant import (
+    DB_FORMAT_VERSION,
+    DB_TOURNAMENTS,
+    DB_TOURNAMENTS_DIR,
+    DB_TOURNAMENTS_JOURNAL,
+    DURABLE_WRITES,
+    JOURNAL_COMPACTION_THRESHOLD,
+    JSON_COMPACT,
+)
+from chessManager.models import TournamentHeader
+from chessManager.storage.atomic import append_durable, atomic_write, discard_partial
+
+if TYPE_CHECKING:
+    from chessManager.storage.codec import StdlibCodec
+
+MANIFEST_NAME = "manifest.json"
+JOURNAL_NAME = "journal.ndjson"
+LOCK_NAME = ".lock"
+
+# Partie touchée par une entrée qui remplace le tournoi complet
+WHOLE = "*"
+
+
+class TournamentJournal:
+    """Persistance des tournois : un fichier par tournoi, un manifeste et un journal en ajout seul.
+
+    Le dossier des tournois (Data/tournaments/) contient :
+        - `<id>.json` : l'enregistrement complet d'un tournoi à la dernière
+          compaction qui l'a concerné ;
+        - `manifest.json` : l'en-tête de chaque tournoi, dans l'ordre de
+          création (les listes n'ouvrent aucun fichier de tournoi) ;
+        - `journal.ndjson` : une ligne JSON par sauvegarde depuis la dernière
+          compaction, avec le seul tournoi modifié.
+
+    Au chargement, le journal est rejoué par-dessus les fichiers des tournois
+    qu'il concerne. Lorsqu'il dépasse `compaction_threshold` entrées, seuls les
+    tournois modifiés depuis la compaction précédente sont réécrits, puis le
+    manifeste : le coût d'une sauvegarde dépend de la taille des tournois en
+    cours, pas de celle des archives.
+
+    Chaque entrée porte la nouvelle version du tournoi (`version`), reprise
+    dans son enregistrement avec, dans `changes`, la version de la dernière
+    écriture de chaque partie touchée (`round:<n>`, `player:<id>`, ou `*` pour
+    le tournoi complet) : de quoi juger si deux écritures concurrentes
+    portent sur des parties différentes. Plusieurs processus peuvent partager le dossier :
+    les écritures et compactions se font sous le verrou `.lock` (voir
+    `FileLock`) et `offset` permet de relire uniquement les entrées ajoutées
+    depuis la dernière lecture.
+
+    L'ancien fichier unique (Tournaments.json et son journal) est lu par
+    `load_legacy` pour être importé au premier lancement ; il n'est pas modifié.
+
+    Attributes:
+        directory (Path): Le dossier des tournois.
+        manifest_path (Path): Chemin du manifeste.
+        journal_path (Path): Chemin du journal (une entrée JSON par ligne).
+        lock_path (Path): Fichier du verrou entre processus.
+        legacy_snapshot_path (Path): Ancien fichier unique des tournois.
+        legacy_journal_path (Path): Ancien journal associé.
+        compaction_threshold (int): Nombre d'entrées déclenchant une compaction.
+        entries (int): Nombre d'entrées actuellement présentes dans le journal.
+        offset (int): Position de fin de la dernière entrée lue ou écrite.
+        codec (StdlibCodec): Le codec JSON (voir `storage.codec`).
+    """
+
+    def __init__(
+        self,
+        directory: Path = DB_TOURNAMENTS_DIR,
+        compaction_threshold: int = JOURNAL_COMPACTION_THRESHOLD,
+        codec: StdlibCodec = None,
+        legacy_snapshot_path: Path = DB_TOURNAMENTS,
+        legacy_journal_path: Path = DB_TOURNAMENTS_JOURNAL,
+    ):
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / MANIFEST_NAME
+        self.journal_path = self.directory / JOURNAL_NAME
+        self.lock_path = self.directory / LOCK_NAME
+        self.legacy_snapshot_path = Path(legacy_snapshot_path)
+        self.legacy_journal_path = Path(legacy_journal_path)
+        self.compaction_threshold = compaction_threshold
+        self.entries = 0
+        self.offset = 0
+        self._codec = codec
+
+    @property
+    def codec(self) -> StdlibCodec:
+        """Le codec JSON, instancié à la première lecture ou écriture d'un tournoi.
+
+        Le catalogue suffit aux commandes qui ne listent que les tournois : elles
+        n'importent ni le module des codecs ni sa bibliothèque.
+        """
+        if self._codec is None:
+            from chessManager.storage.codec import get_codec
+
+            self._codec = get_codec()
+        return self._codec
+
+    def shard_path(self, tournament_id: int) -> Path:
+        """Retourne le fichier d'un tournoi.
+
+        Args:
+            tournament_id (int): L'identifiant du tournoi.
+
+        Returns:
+            Path: Le fichier `<id>.json` du dossier des tournois.
+        """
+        return self.directory / f"{tournament_id}.json"
+
+    def _read(self, path: Path, what: str) -> Optional[Any]:
+        """Lit et décode un fichier réécrit par `atomic_write`.
+
+        Args:
+            path (Path): Le fichier à lire.
+            what (str): Sa désignation dans le message d'erreur.
+
+        Returns:
+            Optional[Any]: Le contenu décodé, ou None si le fichier est absent ou vide.
+
+        Raises:
+            ValueError: Si le fichier est illisible (il n'est pas modifié).
+        """
+        discard_partial(path)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if not data.strip():
+            return None
+        try:
+            return self.codec.loads(data)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{what} illisible : {path} ({e}).") from e
+
+    @staticmethod
+    def _check_version(data: Dict[str, Any]):
+        """Refuse un fichier écrit par une version plus récente.
+
+        Raises:
+            ValueError: Si la version du fichier dépasse DB_FORMAT_VERSION.
+        """
+        version = data.get("version", 1)
+        if version > DB_FORMAT_VERSION:
+            raise ValueError(
+                f"Format de fichier v{version} non supporté (maximum : v{DB_FORMAT_VERSION})."
+            )
+
+    def manifest_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """Identifie la version du manifeste : (inode, date de modification, taille).
+
+        Le manifeste n'est réécrit (par renommage) qu'à une compaction : un
+        changement signale qu'un autre processus a compacté et vidé le journal.
+
+        Returns:
+            Optional[Tuple[int, int, int]]: L'état du fichier, ou None s'il n'existe pas.
+        """
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def load_manifest(self) -> Optional[List[TournamentHeader]]:
+        """Lit les en-têtes du manifeste.
+
+        Returns:
+            Optional[List[TournamentHeader]]: Les en-têtes dans l'ordre de
+            création, ou None si le dossier des tournois n'a jamais été écrit.
+
+        Raises:
+            ValueError: Si le manifeste est illisible ou d'une version plus récente.
+        """
+        data = self._read(self.manifest_path, "Manifeste")
+        if data is None:
+            return None
+        self._check_version(data)
+        return [TournamentHeader(**row) for row in data.get("tournaments", [])]
+
+    def read_shard(self, tournament_id: int) -> Dict[str, Any]:
+        """Lit l'enregistrement complet d'un tournoi.
+
+        Args:
+            tournament_id (int): L'identifiant du tournoi.
+
+        Returns:
+            Dict[str, Any]: L'enregistrement tel qu'écrit à la dernière compaction.
+
+        Raises:
+            ValueError: Si le fichier du tournoi est absent ou illisible.
+        """
+        path = self.shard_path(tournament_id)
+        data = self._read(path, "Tournoi")
+        if data is None:
+            raise ValueError(f"Tournoi introuvable : {path}.")
+        self._check_version(data)
+        return data["tournament"]
+
+    def load_entries(self, start: int = 0, repair: bool = True) -> Optional[List[Dict[str, Any]]]:
+        """Relit le journal à partir d'une position, en réparant une écriture interrompue.
+
+        Une entrée n'est validée que par son retour à la ligne final. La
+        lecture s'arrête à la première ligne incomplète ou illisible. Avec
+        `repair` (verrou tenu : aucun autre processus n'est en train d'écrire),
+        c'est un arrêt pendant l'écriture : le journal est tronqué à la dernière
+        entrée valide et la fin écartée est copiée dans `<journal>.torn`, pour
+        que les sauvegardes suivantes ne soient pas ajoutées derrière une ligne
+        illisible. Sans le verrou, la ligne est peut-être en cours d'écriture :
+        elle est simplement laissée pour la lecture suivante.
+
+        Args:
+            start (int): Position de départ (0, ou `offset` pour ne lire que
+                les entrées ajoutées depuis la dernière lecture).
+            repair (bool): Tronquer le journal après la dernière entrée valide.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Les entrées valides, dans l'ordre
+            d'écriture, ou None si le journal est plus court que `start`
+            (vidé par une compaction).
+        """
+        if start == 0:
+            self.entries = self.offset = 0
+        try:
+            f = open(self.journal_path, "rb")
+        except FileNotFoundError:
+            return [] if start == 0 else None
+
+        entries, valid_end = [], start
+        with f:
+            if os.fstat(f.fileno()).st_size < start:
+                return None
+            f.seek(start)
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise json.JSONDecodeError("entrée incomplète", "", len(line))
+                        entries.append(self.codec.loads(line))
+                    except json.JSONDecodeError:
+                        if repair:
+                            self._truncate(valid_end, line_number)
+                        break
+                valid_end += len(line)
+        self.entries += len(entries)
+        self.offset = valid_end
+        return entries
+
+    def _truncate(self, offset: int, line_number: int):
+        """Coupe le journal après sa dernière entrée valide, en gardant une copie de la fin écartée.
+
+        Args:
+            offset (int): Position de fin de la dernière entrée valide.
+            line_number (int): Numéro de la première ligne écartée (depuis la position de lecture).
+        """
+        torn_path = self.journal_path.with_name(self.journal_path.name + ".torn")
+        with open(self.journal_path, "r+b") as f:
+            f.seek(offset)
+            tail = f.read()
+            append_durable(torn_path, tail)
+            f.truncate(offset)
+            f.flush()
+            if DURABLE_WRITES:
+                os.fsync(f.fileno())
+        print(
+            f"⚠️ Écriture interrompue détectée dans le journal (ligne {line_number}) : "
+            f"{len(tail)} octets écartés, copiés dans {torn_path}."
+        )
+
+    def load_legacy(self) -> Optional[List[Dict[str, Any]]]:
+        """Lit l'ancien fichier unique des tournois et rejoue son journal.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Les enregistrements, ou None s'il
+            n'y a pas d'ancien fichier.
+
+        Raises:
+            ValueError: Si l'ancien fichier est illisible ou d'une version plus récente.
+        """
+        data = self._read(self.legacy_snapshot_path, "Snapshot")
+        if data is None:
+            return None
+        records = self.unwrap(data)
+        try:
+            with open(self.legacy_journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    if line.strip():
+                        self.apply(records, self.codec.loads(line))
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            # Ancien journal interrompu en cours d'écriture : les entrées suivantes étaient déjà ignorées
+            pass
+        return records
+
+    @staticmethod
+    def unwrap(data) -> List[Dict[str, Any]]:
+        """Extrait la liste des tournois de l'ancien fichier unique, quelle que soit sa version.
+
+        Le format v1 est une simple liste de tournois ; à partir de la v2, le
+        fichier est un objet `{"version": n, "tournaments": [...]}`.
+
+        Args:
+            data: Le contenu JSON décodé du fichier.
+
+        Returns:
+            List[Dict[str, Any]]: Les enregistrements de tournois.
+
+        Raises:
+            ValueError: Si le fichier a été écrit par une version plus récente.
+        """
+        if isinstance(data, list):
+            return data
+        TournamentJournal._check_version(data)
+        return data.get("tournaments", [])
+
+    @staticmethod
+    def header(record: Dict[str, Any]) -> TournamentHeader:
+        """Construit l'en-tête d'un tournoi depuis son enregistrement brut.
+
+        Args:
+            record (Dict[str, Any]): L'enregistrement du tournoi.
+
+        Returns:
+            TournamentHeader: L'en-tête correspondant.
+        """
+        rounds = record.get("rounds", [])
+        rounds_played = sum(1 for rnd in rounds if rnd.get("end_datetime"))
+        return TournamentHeader(
+            tournament_id=record["id"],
+            name=record["name"],
+            location=record["location"],
+            start_date=record["start_date"],
+            end_date=record["end_date"],
+            number_of_rounds=record["number_of_rounds"],
+            player_count=len(record.get("players", [])),
+            rounds_played=rounds_played,
+            status=TournamentHeader.status_of(
+                int(record["number_of_rounds"]), rounds_played, any(rnd.get("matches") for rnd in rounds)
+            ),
+        )
+
+    @staticmethod
+    def parts(entry: Dict[str, Any]) -> List[str]:
+        """Retourne les parties du tournoi touchées par une entrée.
+
+        Args:
+            entry (Dict[str, Any]): L'entrée du journal (hors `batch`).
+
+        Returns:
+            List[str]: `round:<n>`, `player:<id>`... ou `*` pour le tournoi complet.
+        """
+        if entry["op"] == "put_round":
+            return [f"round:{entry['record']['round_number']}"]
+        if entry["op"] == "put_players":
+            return [f"player:{record.get('national_chess_id')}" for record in entry["records"]]
+        return [WHOLE]
+
+    @staticmethod
+    def apply(records: List[Dict[str, Any]], entry: Dict[str, Any]):
+        """Applique une entrée du journal à la liste des enregistrements.
+
+        Opérations reconnues :
+            - `put` : remplace (ou ajoute) le tournoi complet à la position `index` ;
+            - `put_round` : remplace la ronde de même numéro dans le tournoi `index` ;
+            - `put_players` : met à jour ou ajoute des joueurs (clé : national_chess_id) ;
+            - `batch` : applique dans l'ordre les entrées `entries` (une validation groupée).
+        La version portée par l'entrée, s'il y en a une, devient celle du
+        tournoi et celle des parties touchées (voir `parts`).
+
+        Args:
+            records (List[Dict[str, Any]]): Les tournois en cours de reconstruction.
+            entry (Dict[str, Any]): L'entrée du journal.
+        """
+        op = entry.get("op")
+        if op == "batch":
+            for sub_entry in entry["entries"]:
+                TournamentJournal.apply(records, sub_entry)
+            return
+        index = entry["index"]
+        if op == "put":
+            if index < len(records):
+                records[index] = entry["record"]
+            else:
+                records.append(entry["record"])
+        elif op == "put_round":
+            rounds = records[index].setdefault("rounds", [])
+            position = entry["record"]["round_number"] - 1
+            if position < len(rounds):
+                rounds[position] = entry["record"]
+            else:
+                rounds.append(entry["record"])
+        elif op == "put_players":
+            players = records[index].setdefault("players", [])
+            positions = {p.get("national_chess_id"): i for i, p in enumerate(players)}
+            for record in entry["records"]:
+                position = positions.get(record.get("national_chess_id"))
+                if position is None:
+                    positions[record.get("national_chess_id")] = len(players)
+                    players.append(record)
+                else:
+                    players[position] = record
+        if "version" in entry:
+            record = records[index]
+            record["version"] = entry["version"]
+            changes = {} if op == "put" else record.setdefault("changes", {})
+            changes.update(dict.fromkeys(TournamentJournal.parts(entry), entry["version"]))
+            record["changes"] = changes
+
+    def write(self, entry: Dict[str, Any]):
+        """Ajoute une entrée en fin de journal, en une écriture forcée sur disque.
+
+        Args:
+            entry (Dict[str, Any]): L'entrée à écrire.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        line = self.codec.dumps(entry) + b"\n"
+        append_durable(self.journal_path, line)
+        self.entries += 1
+        self.offset += len(line)
+
+    def write_group(self, entries: List[Dict[str, Any]]):
+        """Écrit plusieurs entrées en une seule ligne `batch` (validation groupée).
+
+        La ligne étant validée ou écartée en bloc au rechargement, le groupe est
+        atomique. Les mises à jour partielles (`put_round`, `put_players`)
+        suivies d'un `put` du même tournoi dans le groupe sont omises.
+
+        Args:
+            entries (List[Dict[str, Any]]): Les entrées, dans l'ordre d'application.
+        """
+        last_put = {e["index"]: i for i, e in enumerate(entries) if e.get("op") == "put"}
+        entries = [e for i, e in enumerate(entries) if e.get("op") == "put" or i > last_put.get(e["index"], -1)]
+        if not entries:
+            return
+        self.write(entries[0] if len(entries) == 1 else {"op": "batch", "entries": entries})
+
+    def needs_compaction(self) -> bool:
+        """Indique si le journal a atteint le seuil de compaction.
+
+        Returns:
+            bool: True si une compaction est due.
+        """
+        return self.entries >= self.compaction_threshold
+
+    def compact(
+        self,
+        records: List[Dict[str, Any]],
+        headers: List[TournamentHeader],
+        compact: bool = JSON_COMPACT,
+    ):
+        """Réécrit les tournois modifiés et le manifeste, puis vide le journal.
+
+        Chaque fichier est écrit dans un fichier temporaire, forcé sur disque
+        puis renommé (voir `atomic_write`). Les tournois sont écrits avant le
+        manifeste qui les référence ; un arrêt avant la remise à zéro du journal
+        est sans conséquence, le rejeu des entrées étant idempotent.
+
+        Args:
+            records (List[Dict[str, Any]]): Les tournois modifiés depuis la
+                dernière compaction (les autres fichiers ne sont pas touchés).
+            headers (List[TournamentHeader]): Les en-têtes de tous les tournois.
+            compact (bool): Fichiers sans indentation (voir constant.JSON_COMPACT).
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for record in records:
+            with atomic_write(self.shard_path(record["id"])) as f:
+                f.write(self.codec.dumps({"version": DB_FORMAT_VERSION, "tournament": record}, compact=compact))
+        with atomic_write(self.manifest_path) as f:
+            f.write(
+                self.codec.dumps(
+                    {"version": DB_FORMAT_VERSION, "tournaments": [asdict(h) for h in headers]}, compact=compact
+                )
+            )
+
+        with open(self.journal_path, "wb") as f:
+            if DURABLE_WRITES:
+                os.fsync(f.fileno())
+        self.entries = self.offset = 0
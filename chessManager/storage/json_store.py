@@ -0,0 +1,329 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from chessManager.models import Tournament, TournamentHeader, Player, Round
+from chessManager.storage.base import ConflictError, TournamentStore
+from chessManager.storage.journal import WHOLE, TournamentJournal
+from chessManager.storage.locking import FileLock
+
+
+class JsonTournamentStore(TournamentStore):
+    """Backend JSON : un fichier par tournoi + manifeste + journal en ajout seul.
+
+    Les en-têtes sont lus dans le manifeste ; l'enregistrement brut d'un
+    tournoi n'est lu qu'à son premier accès (ouverture, ou rejeu d'une entrée
+    du journal qui le concerne), puis reconstruit en objets à la demande
+    (`load_tournament`). Chaque écriture est ajoutée au journal puis appliquée
+    aux enregistrements bruts, et le tournoi concerné est marqué modifié : la
+    compaction ne réécrit que les tournois marqués.
+
+    Dans une transaction, les entrées sont appliquées en mémoire puis écrites
+    ensemble à la fin de la transaction la plus externe, en une seule ligne de
+    journal forcée sur disque (validation groupée) ; si la transaction échoue,
+    rien n'est écrit et les enregistrements sont relus depuis le disque.
+
+    Plusieurs processus peuvent partager le dossier des tournois. Toute
+    écriture se fait dans une transaction, qui prend le verrou du dossier
+    (`FileLock`) puis rattrape les entrées ajoutées au journal par les autres
+    processus (ou relit tout si l'un d'eux a compacté). Chaque entrée
+    incrémente la version du tournoi ; une écriture faite sur une version
+    dépassée (`Tournament.version`) est :
+        - fusionnée si les écritures concurrentes touchaient d'autres parties
+          du tournoi (autres rondes, autres joueurs ; voir `TournamentJournal.parts`) :
+          le tournoi en mémoire est alors périmé (voir `version_of`) ;
+        - refusée sinon (`ConflictError`), la transaction entière étant annulée.
+    Les lectures ne prennent pas le verrou : elles rattrapent les entrées
+    complètes du journal et laissent une ligne en cours d'écriture.
+
+    Au premier lancement, l'ancien fichier unique Tournaments.json est importé :
+    un fichier par tournoi et le manifeste sont écrits. Les identifiants de
+    tournoi absents des anciens fichiers sont dérivés de leur position (1-indexée).
+
+    Attributes:
+        journal (TournamentJournal): Le journal sous-jacent.
+        lock (FileLock): Le verrou du dossier des tournois, partagé entre processus.
+    """
+
+    def __init__(self, journal: TournamentJournal = None):
+        self.journal = journal or TournamentJournal()
+        self.lock = FileLock(self.journal.lock_path)
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._headers: List[Optional[TournamentHeader]] = []
+        self._positions: Dict[int, int] = {}
+        self._dirty: Set[int] = set()
+        self._loaded = False
+        self._manifest_stamp: Optional[Tuple[int, int, int]] = None
+        self._depth = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._bumped: List[Tuple[Tournament, int]] = []
+        self._external = True
+
+    def _ensure_loaded(self):
+        """Rattrape les écritures des autres processus avant une lecture (hors transaction, sans verrou)."""
+        if self._depth == 0:
+            self._refresh()
+
+    def _refresh(self):
+        """Rejoue les entrées ajoutées au journal depuis la dernière lecture, ou relit tout après une compaction."""
+        if self._loaded and self.journal.manifest_stamp() == self._manifest_stamp:
+            entries = self.journal.load_entries(self.journal.offset, repair=self.lock.held)
+            if entries is not None and self.journal.manifest_stamp() == self._manifest_stamp:
+                self._external = self._external or bool(entries)
+                for entry in entries:
+                    self._apply(entry)
+                return
+        self._loaded = False
+        self._load()
+
+    def _load(self):
+        """Lit le manifeste (ou importe l'ancien fichier unique) puis rejoue le journal.
+
+        Sans le verrou, la lecture est recommencée si un autre processus a
+        compacté entre la lecture du manifeste et celle du journal.
+        """
+        legacy_import = not self.journal.manifest_path.exists() and self.journal.legacy_snapshot_path.exists()
+        if legacy_import and not self.lock.held:
+            # L'import de l'ancien fichier écrit les fichiers des tournois : sous le verrou
+            with self.lock:
+                self._load()
+            return
+        while True:
+            stamp = self.journal.manifest_stamp()
+            headers = self.journal.load_manifest()
+            legacy = self.journal.load_legacy() if headers is None else None
+            entries = self.journal.load_entries(repair=self.lock.held)
+            if self.lock.held or self.journal.manifest_stamp() == stamp:
+                break
+        if legacy:
+            self._records = legacy
+            self._headers = [None] * len(legacy)
+            self._dirty = set(range(len(legacy)))
+        else:
+            self._records = [None] * len(headers or [])
+            self._headers = headers or []
+            self._dirty = set()
+        self._manifest_stamp = stamp
+        self._external = True
+        self._positions = {}
+        for position in range(len(self._records)):
+            self._index(position)
+        for entry in entries:
+            self._apply(entry)
+        self._loaded = True
+        if legacy:
+            self._compact()
+
+    def _index(self, position: int):
+        """Référence l'identifiant du tournoi à une position (attribué d'après la position s'il manque)."""
+        record = self._records[position]
+        if record is None:
+            self._positions[self._headers[position].tournament_id] = position
+            return
+        if record.get("id") is None:
+            record["id"] = position + 1
+        self._positions[record["id"]] = position
+
+    def _record(self, position: int) -> Dict[str, Any]:
+        """Retourne l'enregistrement brut d'un tournoi, lu depuis son fichier au premier accès."""
+        if self._records[position] is None:
+            self._records[position] = self.journal.read_shard(self._headers[position].tournament_id)
+        return self._records[position]
+
+    def _apply(self, entry: Dict[str, Any]):
+        """Applique une entrée du journal et marque les tournois concernés comme modifiés.
+
+        Une entrée dont la version est déjà atteinte par le tournoi est ignorée :
+        son fichier a été réécrit par la compaction d'un autre processus.
+
+        Args:
+            entry (Dict[str, Any]): L'entrée (éventuellement un groupe `batch`).
+        """
+        if entry.get("op") == "batch":
+            for sub_entry in entry["entries"]:
+                self._apply(sub_entry)
+            return
+        position = entry["index"]
+        version = entry.get("version")
+        if position < len(self._records) and (entry["op"] != "put" or version is not None):
+            if version is not None and self._record(position).get("version", 0) >= version:
+                return
+        TournamentJournal.apply(self._records, entry)
+        if position == len(self._headers):
+            self._headers.append(None)
+        self._index(position)
+        self._dirty.add(position)
+
+    @staticmethod
+    def _mergeable(record: Dict[str, Any], expected: int, entry: Dict[str, Any]) -> bool:
+        """Indique si une écriture faite sur une version dépassée peut être appliquée par-dessus.
+
+        Aucune des parties qu'elle touche ne doit avoir été écrite depuis la
+        version `expected`, ni le tournoi remplacé en entier.
+
+        Args:
+            record (Dict[str, Any]): L'enregistrement courant du tournoi.
+            expected (int): La version sur laquelle repose l'écriture.
+            entry (Dict[str, Any]): L'entrée à écrire.
+
+        Returns:
+            bool: True si l'écriture peut être fusionnée.
+        """
+        parts = TournamentJournal.parts(entry)
+        changes = record.get("changes", {})
+        return (
+            WHOLE not in parts
+            and changes.get(WHOLE, 0) <= expected
+            and all(changes.get(part, 0) <= expected for part in parts)
+        )
+
+    def _write(self, tournament: Tournament, entry: Dict[str, Any]):
+        """Vérifie la version du tournoi, applique l'entrée et la garde pour la fin de la transaction.
+
+        Args:
+            tournament (Tournament): Le tournoi écrit (sa version est incrémentée,
+                sauf si l'écriture est fusionnée avec celles d'un autre processus).
+            entry (Dict[str, Any]): L'entrée de journal à persister.
+
+        Raises:
+            ConflictError: Si le tournoi a changé depuis sa version et que l'écriture ne peut être fusionnée.
+        """
+        position = entry["index"]
+        expected = current = tournament.version
+        if position < len(self._records):
+            record = self._record(position)
+            current = record.get("version", 0)
+            if expected != current and not self._mergeable(record, expected, entry):
+                raise ConflictError(tournament.tournament_id, expected, current)
+        entry["version"] = current + 1
+        self._apply(entry)
+        self._pending.append(entry)
+        if expected == current:
+            self._bumped.append((tournament, expected))
+            tournament.version = current + 1
+
+    def _maybe_compact(self):
+        """Compacte le journal s'il a atteint son seuil."""
+        if self.journal.needs_compaction():
+            self._compact()
+
+    def _compact(self):
+        """Réécrit les seuls tournois modifiés depuis la dernière compaction, puis le manifeste (sous le verrou)."""
+        headers = self.list_headers()
+        self.journal.compact([self._records[position] for position in sorted(self._dirty)], headers)
+        self._headers = headers
+        self._dirty = set()
+        self._manifest_stamp = self.journal.manifest_stamp()
+
+    def _rollback(self):
+        """Abandonne la transaction : versions des tournois restaurées, enregistrements relus au prochain accès."""
+        self._pending = []
+        self._loaded = False
+        for tournament, version in reversed(self._bumped):
+            tournament.version = version
+        self._bumped = []
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Regroupe les écritures en une seule ligne de journal, sous le verrou du dossier.
+
+        La transaction la plus externe prend le verrou et rattrape les écritures
+        des autres processus ; les transactions imbriquées sont fusionnées.
+        """
+        if self._depth == 0:
+            self.lock.acquire()
+            try:
+                self._refresh()
+            except BaseException:
+                self.lock.release()
+                raise
+        self._depth += 1
+        try:
+            yield
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self._rollback()
+                self.lock.release()
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                entries, self._pending = self._pending, []
+                try:
+                    self.journal.write_group(entries)
+                except BaseException:
+                    self._rollback()
+                    raise
+                self._bumped = []
+                self._maybe_compact()
+            finally:
+                self.lock.release()
+
+    def source_paths(self) -> List[Path]:
+        return [self.journal.manifest_path, self.journal.journal_path]
+
+    def list_headers(self) -> List[TournamentHeader]:
+        self._ensure_loaded()
+        return [
+            TournamentJournal.header(self._records[position]) if position in self._dirty else header
+            for position, header in enumerate(self._headers)
+        ]
+
+    def external_changes(self) -> bool:
+        if not self._loaded:
+            # Rien n'a encore été lu : les en-têtes viennent du catalogue, qui vérifie les fichiers
+            return True
+        self._ensure_loaded()
+        changed, self._external = self._external, False
+        return changed
+
+    def version_of(self, tournament_id: int) -> Optional[int]:
+        self._ensure_loaded()
+        position = self._positions.get(tournament_id)
+        return None if position is None else self._record(position).get("version", 0)
+
+    def load_tournament(self, tournament_id: int) -> Tournament:
+        self._ensure_loaded()
+        if tournament_id not in self._positions:
+            raise KeyError(f"Tournoi introuvable : {tournament_id}")
+        return Tournament.from_record(self._record(self._positions[tournament_id]))
+
+    def insert_tournament(self, tournament: Tournament):
+        with self.transaction():
+            tournament.tournament_id = max(self._positions, default=0) + 1
+            self._positions[tournament.tournament_id] = len(self._records)
+            self._write(tournament, {"op": "put", "index": len(self._records), "record": tournament.to_record()})
+
+    def save_tournament(self, tournament: Tournament):
+        with self.transaction():
+            self._write(
+                tournament,
+                {"op": "put", "index": self._positions[tournament.tournament_id], "record": tournament.to_record()},
+            )
+
+    def save_players(self, tournament: Tournament, players: List[Player]):
+        if not players:
+            return
+        with self.transaction():
+            self._write(
+                tournament,
+                {
+                    "op": "put_players",
+                    "index": self._positions[tournament.tournament_id],
+                    "records": [p.to_record() for p in players],
+                },
+            )
+
+    def save_round(self, tournament: Tournament, rnd: Round):
+        with self.transaction():
+            self._write(
+                tournament,
+                {"op": "put_round", "index": self._positions[tournament.tournament_id], "record": rnd.to_record()},
+            )
+
+    def compact(self):
+        """Force la compaction du journal dans les fichiers des tournois modifiés."""
+        with self.transaction():
+            self._compact()
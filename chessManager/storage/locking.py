@@ -0,0 +1,95 @@
+import os
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+class FileLock:
+    """Verrou exclusif consultatif entre processus, posé sur un fichier dédié.
+
+    Plusieurs programmes (interface en ligne de commande, serveur HTTP...)
+    peuvent ouvrir le même dossier Data/ : les écrivains prennent ce verrou le
+    temps de rattraper les écritures des autres processus puis d'écrire les
+    leurs. Les lecteurs ne le prennent jamais : les fichiers sont remplacés
+    par renommage ou complétés en fin de fichier, un lecteur voit donc
+    toujours un état cohérent.
+
+    `flock` est utilisé sous POSIX, `msvcrt.locking` sous Windows. Le verrou
+    est réentrant et partagé par les threads du processus.
+
+    Attributes:
+        path (Path): Le fichier de verrou (créé au besoin, jamais supprimé).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fd = None
+        self._depth = 0
+        self._thread_lock = threading.RLock()
+
+    @property
+    def held(self) -> bool:
+        """True si le verrou est tenu par ce processus."""
+        return self._depth > 0
+
+    def acquire(self):
+        """Prend le verrou, en attendant qu'un autre processus le relâche."""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_EX)
+                    elif msvcrt is not None:
+                        self._lock_windows(fd)
+                except BaseException:
+                    os.close(fd)
+                    raise
+            except BaseException:
+                self._thread_lock.release()
+                raise
+            self._fd = fd
+        self._depth += 1
+
+    @staticmethod
+    def _lock_windows(fd: int):
+        """Verrouille le premier octet du fichier ; `LK_LOCK` abandonne après 10 s, d'où la boucle."""
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def release(self):
+        """Relâche le verrou (au dernier appel si `acquire` a été imbriqué)."""
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -0,0 +1,59 @@
+"""Migration ponctuelle des tournois d'un backend de stockage vers un autre.
+
+Usage :
+    python -m chessManager.storage.migrate json sqlite
+"""
+
+import argparse
+
+from chessManager.storage import BACKENDS, TournamentStore, open_store
+
+
+def migrate(source: TournamentStore, target: TournamentStore) -> int:
+    """Copie tous les tournois de `source` vers `target` dans une seule transaction.
+
+    Args:
+        source (TournamentStore): Backend lu.
+        target (TournamentStore): Backend écrit (doit être vide).
+
+    Returns:
+        int: Le nombre de tournois migrés.
+
+    Raises:
+        ValueError: Si le backend cible contient déjà des tournois.
+    """
+    if target.list_headers():
+        raise ValueError("Le stockage cible contient déjà des tournois, migration annulée.")
+
+    tournaments = source.load_tournaments()
+    with target.transaction():
+        for tournament in tournaments:
+            tournament.tournament_id = None
+            target.insert_tournament(tournament)
+    return len(tournaments)
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Migre les tournois entre deux backends de stockage.")
+    parser.add_argument("source", choices=sorted(BACKENDS))
+    parser.add_argument("target", choices=sorted(BACKENDS))
+    args = parser.parse_args(argv)
+    if args.source == args.target:
+        parser.error("Les backends source et cible doivent être différents.")
+
+    source, target = open_store(args.source), open_store(args.target)
+    try:
+        count = migrate(source, target)
+    except ValueError as e:
+        print(f"⚠️ {e}")
+        return 1
+    finally:
+        source.close()
+        target.close()
+    print(f"✅ {count} tournois migrés de {args.source} vers {args.target}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,354 @@
+import json
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from constant import DB_LICENSED_PLAYERS, DEFAULT_ENCODING
+from chessManager.models import Player
+from chessManager.storage.atomic import append_durable, atomic_write, discard_partial
+from chessManager.storage.codec import StdlibCodec, get_codec
+from chessManager.storage.locking import FileLock
+
+# Nombre minimal de lignes périmées avant de compacter le fichier de données
+REGISTRY_COMPACTION_MIN_STALE = 1000
+
+
+class LicensedPlayerRegistry:
+    """Registre persistant des joueurs licenciés, indexé par identifiant national.
+
+    Deux fichiers accompagnent le chemin de base (LicensedPlayers.json) :
+        - `LicensedPlayers.ndjson` : un enregistrement de joueur par ligne, en
+          ajout seul ; une mise à jour ajoute une nouvelle version du joueur ;
+        - `LicensedPlayers.idx` : l'index, une ligne `identifiant<TAB>position<TAB>longueur<TAB>crc32`
+          par écriture, la dernière ligne d'un identifiant l'emportant.
+
+    Seul l'index est lu à l'ouverture ; un joueur est relu à la demande à sa
+    position dans le fichier de données. Ajouter ou mettre à jour un joueur
+    ajoute une ligne à chacun des deux fichiers : le coût ne dépend pas de la
+    taille du registre. Un enregistrement identique (même crc32) n'est pas réécrit.
+
+    Si l'index ne correspond pas au fichier de données (arrêt entre les deux
+    écritures), il est reconstruit en relisant les données ; une dernière ligne
+    tronquée est supprimée. L'ancien LicensedPlayers.json est importé au premier
+    accès puis laissé en l'état.
+
+    Plusieurs processus peuvent partager le registre : ajouts, compaction et
+    réparations se font sous le verrou `LicensedPlayers.lock`, après avoir
+    indexé les lignes ajoutées par les autres processus (voir `_refresh`).
+    Les lectures ne prennent pas le verrou.
+
+    Attributes:
+        path (Path): Le chemin de base (ancien fichier JSON).
+        data_path (Path): Le fichier de données NDJSON.
+        index_path (Path): Le fichier d'index.
+        listeners (List[Callable[[List[Player]], None]]): Appelés avec les joueurs
+            écrits après chaque ajout ou mise à jour (ex. index de recherche).
+        codec (StdlibCodec): Le codec JSON des lignes (voir `storage.codec`).
+        lock (FileLock): Le verrou partagé entre processus.
+    """
+
+    def __init__(self, path: Path = DB_LICENSED_PLAYERS, codec: StdlibCodec = None):
+        self.path = Path(path)
+        self.codec = codec or get_codec()
+        self.data_path = self.path.with_suffix(".ndjson")
+        self.index_path = self.path.with_suffix(".idx")
+        self.lock = FileLock(self.path.with_suffix(".lock"))
+        self._index: Dict[str, Tuple[int, int, int]] = {}
+        self._size = 0
+        self._lines = 0
+        self._inode = 0
+        self.listeners: List[Callable[[List[Player]], None]] = []
+        self._load()
+
+    def _load(self):
+        """Charge l'index, le reconstruit s'il est incohérent, ou importe l'ancien fichier JSON."""
+        discard_partial(self.data_path)
+        discard_partial(self.index_path)
+        if not self.data_path.exists():
+            with self.lock:
+                if not self.data_path.exists():
+                    self._index, self._size, self._lines = {}, 0, 0
+                    self.data_path.touch()
+                    self._inode = self.data_path.stat().st_ino
+                    self.index_path.write_text("", encoding=DEFAULT_ENCODING)
+                    self._import_legacy()
+                    return
+
+        self._index, self._lines = {}, 0
+        stat = self.data_path.stat()
+        self._size, self._inode = stat.st_size, stat.st_ino
+        end = 0
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding=DEFAULT_ENCODING) as f:
+                for line in f:
+                    try:
+                        player_id, offset, length, crc = line.rstrip("\n").split("\t")
+                        entry = (int(offset), int(length), int(crc))
+                    except ValueError:
+                        end = -1
+                        break
+                    self._index[player_id] = entry
+                    self._lines += 1
+                    # Un identifiant remplacé garde sa place : la fin des données est la plus grande fin indexée
+                    end = max(end, entry[0] + entry[1])
+        if end != self._size:
+            # Arrêt entre les deux écritures, ou ajout en cours dans un autre processus
+            with self.lock:
+                self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Reconstruit l'index en relisant le fichier de données (une dernière ligne tronquée est coupée)."""
+        self._index, self._lines, offset = {}, 0, 0
+        with open(self.data_path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    record = self.codec.loads(raw)
+                except json.JSONDecodeError:
+                    break
+                self._index[record.get("national_chess_id", "")] = (offset, len(raw), zlib.crc32(raw))
+                self._lines += 1
+                offset += len(raw)
+        if offset != self.data_path.stat().st_size:
+            with open(self.data_path, "r+b") as f:
+                f.truncate(offset)
+        self._size, self._inode = offset, self.data_path.stat().st_ino
+        self._write_index()
+
+    def _refresh(self):
+        """Indexe les joueurs écrits par les autres processus depuis la dernière lecture.
+
+        Les lignes ajoutées en fin de fichier sont indexées (une ligne
+        incomplète, en cours d'écriture, est laissée) ; après une compaction par
+        un autre processus (inode différent), l'index est relu. Les joueurs
+        concernés sont transmis aux `listeners`.
+        """
+        stat = self.data_path.stat()
+        if stat.st_ino != self._inode:
+            self._load()
+            written = list(self)
+        elif stat.st_size > self._size:
+            written, offset = [], self._size
+            with open(self.data_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        record = self.codec.loads(raw)
+                    except json.JSONDecodeError:
+                        break
+                    self._index[record.get("national_chess_id", "")] = (offset, len(raw), zlib.crc32(raw))
+                    self._lines += 1
+                    offset += len(raw)
+                    written.append(Player.from_record(record))
+            self._size = offset
+        else:
+            return
+        for listener in self.listeners:
+            listener(written)
+
+    def _write_index(self):
+        """Réécrit l'index complet (reconstruction ou compaction), dans l'ordre du fichier de données."""
+        with atomic_write(self.index_path, "w", encoding=DEFAULT_ENCODING) as f:
+            for player_id, (offset, length, crc) in sorted(self._index.items(), key=lambda item: item[1][0]):
+                f.write(f"{player_id}\t{offset}\t{length}\t{crc}\n")
+
+    def _import_legacy(self):
+        """Importe l'ancien LicensedPlayers.json (`{"players": [...]}`), premier enregistrement gagnant."""
+        try:
+            with open(self.path, "rb") as f:
+                data = self.codec.loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        players = data.get("players", []) if isinstance(data, dict) else data
+        self.add_missing(Player.from_record(p) for p in players)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, national_chess_id: str) -> bool:
+        return national_chess_id in self._index
+
+    def get(self, national_chess_id: str) -> Optional[Player]:
+        """Relit un joueur à sa position dans le fichier de données.
+
+        Args:
+            national_chess_id (str): L'identifiant recherché.
+
+        Returns:
+            Optional[Player]: Le joueur, ou None s'il n'est pas enregistré.
+        """
+        self._refresh()
+        entry = self._index.get(national_chess_id)
+        if entry is None:
+            return None
+        with open(self.data_path, "rb") as f:
+            f.seek(entry[0])
+            return self.codec.decode_player(f.read(entry[1]))
+
+    def get_many(self, national_chess_ids: Iterable[str]) -> Iterator[Player]:
+        """Relit des joueurs dans l'ordre demandé, avec un seul fichier ouvert.
+
+        Args:
+            national_chess_ids (Iterable[str]): Les identifiants (les inconnus sont ignorés).
+
+        Yields:
+            Player: Chaque joueur trouvé.
+        """
+        self._refresh()
+        with open(self.data_path, "rb") as f:
+            for national_chess_id in national_chess_ids:
+                entry = self._index.get(national_chess_id)
+                if entry is None:
+                    continue
+                f.seek(entry[0])
+                yield self.codec.decode_player(f.read(entry[1]))
+
+    def stamp(self) -> Tuple[int, int]:
+        """Identifie l'état du fichier de données : (inode, taille).
+
+        La taille ne fait que croître entre deux compactions ; une compaction
+        remplace le fichier, donc change l'inode.
+
+        Returns:
+            Tuple[int, int]: L'inode et la taille du fichier de données.
+        """
+        return self.data_path.stat().st_ino, self._size
+
+    def scan(self, offset: int = 0) -> Iterator[Player]:
+        """Relit séquentiellement les lignes écrites à partir d'une position.
+
+        Args:
+            offset (int): Position de départ dans le fichier de données.
+
+        Yields:
+            Player: Chaque version écrite, y compris les versions périmées.
+        """
+        with open(self.data_path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if offset + len(raw) > self._size:
+                    return
+                offset += len(raw)
+                yield self.codec.decode_player(raw)
+
+    def __iter__(self) -> Iterator[Player]:
+        """Parcourt la version courante de chaque joueur, dans l'ordre du fichier."""
+        self._refresh()
+        current = {offset for offset, _, _ in self._index.values()}
+        offset = 0
+        with open(self.data_path, "rb") as f:
+            for raw in f:
+                if offset in current:
+                    yield self.codec.decode_player(raw)
+                offset += len(raw)
+
+    def upsert(self, player: Player) -> bool:
+        """Ajoute ou met à jour un joueur, en O(1) amorti.
+
+        Args:
+            player (Player): Le joueur à enregistrer.
+
+        Returns:
+            bool: True si une ligne a été écrite, False si l'enregistrement était identique.
+        """
+        written = self._append([player], replace=True)
+        self._maybe_compact()
+        return bool(written)
+
+    def add_missing(self, players: Iterable[Player]) -> int:
+        """Ajoute les joueurs absents du registre, sans toucher aux joueurs déjà enregistrés.
+
+        Args:
+            players (Iterable[Player]): Les joueurs candidats.
+
+        Returns:
+            int: Le nombre de joueurs ajoutés.
+        """
+        return self._append(players, replace=False)
+
+    def _append(self, players: Iterable[Player], replace: bool) -> int:
+        """Écrit en fin de fichiers les joueurs nouveaux (ou modifiés si `replace`).
+
+        Args:
+            players (Iterable[Player]): Les joueurs candidats.
+            replace (bool): Réécrire les joueurs déjà présents dont l'enregistrement a changé.
+
+        Returns:
+            int: Le nombre de lignes écrites.
+        """
+        with self.lock:
+            self._refresh()
+            return self._append_locked(players, replace)
+
+    def _append_locked(self, players: Iterable[Player], replace: bool) -> int:
+        """Corps de `_append`, sous le verrou."""
+        data_lines, index_lines, written = [], [], []
+        offset = self._size
+        for player in players:
+            player_id = player.national_chess_id
+            previous = self._index.get(player_id)
+            if previous is not None and not replace:
+                continue
+            raw = self.codec.dumps(player.to_record()) + b"\n"
+            crc = zlib.crc32(raw)
+            if previous is not None and previous[2] == crc:
+                continue
+            self._index[player_id] = (offset, len(raw), crc)
+            data_lines.append(raw)
+            written.append(player)
+            index_lines.append(f"{player_id}\t{offset}\t{len(raw)}\t{crc}\n")
+            offset += len(raw)
+        if not data_lines:
+            return 0
+
+        # Données d'abord : un index en avance sur les données serait faux,
+        # des données en avance sur l'index sont réindexées au prochain chargement
+        append_durable(self.data_path, b"".join(data_lines))
+        append_durable(self.index_path, "".join(index_lines).encode(DEFAULT_ENCODING))
+        self._size = offset
+        self._lines += len(data_lines)
+        for listener in self.listeners:
+            listener(written)
+        return len(data_lines)
+
+    def _maybe_compact(self):
+        """Compacte lorsque les versions périmées dépassent les versions courantes."""
+        stale = self._lines - len(self._index)
+        if stale >= REGISTRY_COMPACTION_MIN_STALE and stale > len(self._index):
+            self.compact()
+
+    def compact(self):
+        """Réécrit le fichier de données sans les versions périmées, puis l'index (sous le verrou)."""
+        with self.lock:
+            self._refresh()
+            index, offset = {}, 0
+            with atomic_write(self.data_path) as out:
+                for player in self:
+                    raw = self.codec.dumps(player.to_record()) + b"\n"
+                    out.write(raw)
+                    index[player.national_chess_id] = (offset, len(raw), zlib.crc32(raw))
+                    offset += len(raw)
+            self._index, self._size, self._lines = index, offset, len(index)
+            self._inode = self.data_path.stat().st_ino
+            self._write_index()
+
+
+_registries: Dict[Path, LicensedPlayerRegistry] = {}
+
+
+def registry_for(path: Path = DB_LICENSED_PLAYERS) -> LicensedPlayerRegistry:
+    """Retourne le registre associé à un chemin, ouvert une seule fois par processus.
+
+    Args:
+        path (Path): Le chemin de base du registre.
+
+    Returns:
+        LicensedPlayerRegistry: Le registre, index déjà chargé.
+    """
+    key = Path(path).resolve()
+    if key not in _registries:
+        _registries[key] = LicensedPlayerRegistry(path)
+    return _registries[key]
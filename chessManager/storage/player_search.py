@@ -0,0 +1,286 @@
+import atexit
+import json
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from constant import DB_LICENSED_PLAYERS
+from chessManager.models import Player
+from chessManager.storage.atomic import atomic_write
+from chessManager.storage.player_registry import LicensedPlayerRegistry, registry_for
+
+# Version du fichier d'index de recherche (à incrémenter si `fold` change)
+SEARCH_INDEX_VERSION = 1
+
+# Joueurs modifiés au-delà desquels les listes triées sont reconstruites en une passe (plutôt que par insertions)
+BULK_INDEX_THRESHOLD = 256
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Lettres que la décomposition Unicode ne ramène pas à une lettre latine simple
+_LIGATURES = str.maketrans({"ø": "o", "æ": "ae", "œ": "oe", "ł": "l", "đ": "d", "ð": "d", "þ": "th", "ı": "i"})
+
+
+def fold(text: str) -> str:
+    """Normalise un texte pour la recherche : sans accents, minuscules, ponctuation réduite à des espaces.
+
+    Args:
+        text (str): Le texte à normaliser.
+
+    Returns:
+        str: La clé normalisée (« Émile  D'Orléans » → « emile d orleans »).
+    """
+    decomposed = unicodedata.normalize("NFKD", (text or "").casefold().translate(_LIGATURES))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", stripped).strip()
+
+
+class PlayerSearchIndex:
+    """Index de recherche persistant sur le registre des joueurs licenciés.
+
+    Deux listes triées sont tenues à jour :
+        - `names` : (nom normalisé, identifiant), pour la recherche par préfixe du nom complet ;
+        - `tokens` : (mot normalisé, identifiant), pour retrouver un joueur par
+          n'importe quel mot de son nom (prénom, nom, nom composé...).
+    La recherche exacte par identifiant passe par l'index du registre.
+
+    L'index est enregistré à côté du registre (LicensedPlayers.search.json) avec
+    l'état du fichier de données qu'il couvre (inode, taille). Au chargement,
+    seules les lignes ajoutées depuis sont relues ; une compaction du registre
+    (inode différent) entraîne une reconstruction complète. Les ajouts faits
+    pendant la session sont reportés en mémoire via `registry.listeners` et
+    l'index est réenregistré par `save()` (à la sortie du programme via
+    `search_index_for`).
+
+    Attributes:
+        registry (LicensedPlayerRegistry): Le registre indexé.
+        path (Path): Le fichier d'index.
+    """
+
+    def __init__(self, registry: LicensedPlayerRegistry):
+        self.registry = registry
+        self.path = registry.path.with_suffix(".search.json")
+        self.names: List[Tuple[str, str]] = []
+        self.tokens: List[Tuple[str, str]] = []
+        self._keys: Dict[str, str] = {}
+        self._stamp: Tuple[int, int] = (0, 0)
+        self._dirty = False
+        self._load()
+        registry.listeners.append(self._on_written)
+
+    def _load(self):
+        """Charge l'index enregistré puis rattrape les lignes ajoutées au registre depuis."""
+        inode, size = self.registry.stamp()
+        try:
+            with open(self.path, "rb") as f:
+                data = self.registry.codec.loads(f.read())
+            stamp = tuple(data["stamp"])
+            if data.get("version") != SEARCH_INDEX_VERSION or stamp[0] != inode or stamp[1] > size:
+                raise ValueError("index périmé")
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            self._rebuild()
+            return
+
+        self.names = [tuple(entry) for entry in data["names"]]
+        self.tokens = [tuple(entry) for entry in data["tokens"]]
+        self._keys = {player_id: key for key, player_id in self.names}
+        self._stamp = stamp
+        if stamp[1] < size:
+            self._index_players(self.registry.scan(stamp[1]))
+            self.save()
+
+    def _rebuild(self):
+        """Reconstruit l'index à partir de la version courante de chaque joueur."""
+        keyed = [(fold(p.name), p.national_chess_id) for p in self.registry]
+        self._keys = dict((player_id, key) for key, player_id in keyed)
+        self.names = sorted(set(keyed))
+        self.tokens = sorted({(token, player_id) for key, player_id in keyed for token in key.split()})
+        self._dirty = True
+        self.save()
+
+    def _index_players(self, players: Iterable[Player]):
+        """Ajoute (ou remplace) des joueurs dans les listes triées.
+
+        Quelques joueurs sont insérés à leur place (`insort`) ; au-delà de
+        `BULK_INDEX_THRESHOLD`, les entrées remplacées sont retirées en une
+        passe et les nouvelles ajoutées avant un seul tri (un import massif ne
+        coûte pas une insertion par joueur dans des listes de plusieurs
+        dizaines de milliers d'entrées).
+
+        Args:
+            players (Iterable[Player]): Les joueurs écrits dans le registre.
+        """
+        # Identifiant → clé indexée avant ce lot (None : joueur absent de l'index)
+        changed: Dict[str, Optional[str]] = {}
+        for player in players:
+            player_id, key = player.national_chess_id, fold(player.name)
+            previous = self._keys.get(player_id)
+            if previous == key:
+                continue
+            changed.setdefault(player_id, previous)
+            self._keys[player_id] = key
+        if not changed:
+            return
+        self._dirty = True
+
+        if len(changed) <= BULK_INDEX_THRESHOLD:
+            for player_id, previous in changed.items():
+                if previous is not None:
+                    self._remove(self.names, (previous, player_id))
+                    for token in set(previous.split()):
+                        self._remove(self.tokens, (token, player_id))
+                key = self._keys[player_id]
+                insort(self.names, (key, player_id))
+                for token in set(key.split()):
+                    insort(self.tokens, (token, player_id))
+            return
+
+        stale = {(previous, player_id) for player_id, previous in changed.items() if previous is not None}
+        stale_tokens = {(token, player_id) for previous, player_id in stale for token in previous.split()}
+        self.names = [entry for entry in self.names if entry not in stale]
+        self.names.extend((self._keys[player_id], player_id) for player_id in changed)
+        self.names.sort()
+        self.tokens = [entry for entry in self.tokens if entry not in stale_tokens]
+        self.tokens.extend(
+            (token, player_id) for player_id in changed for token in set(self._keys[player_id].split())
+        )
+        self.tokens.sort()
+
+    @staticmethod
+    def _remove(entries: List[Tuple[str, str]], entry: Tuple[str, str]):
+        """Retire une entrée d'une liste triée."""
+        position = bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+    def _on_written(self, players: List[Player]):
+        """Reporte dans l'index les joueurs écrits dans le registre."""
+        self._index_players(players)
+        self._dirty = True
+
+    def save(self):
+        """Enregistre l'index s'il a changé (fichier temporaire puis renommage)."""
+        self._stamp = self.registry.stamp()
+        if not self._dirty and self.path.exists():
+            return
+        with atomic_write(self.path) as f:
+            f.write(
+                self.registry.codec.dumps(
+                    {
+                        "version": SEARCH_INDEX_VERSION,
+                        "stamp": list(self._stamp),
+                        "names": self.names,
+                        "tokens": self.tokens,
+                    }
+                )
+            )
+        self._dirty = False
+
+    @staticmethod
+    def _prefix(entries: List[Tuple[str, str]], prefix: str) -> Iterable[str]:
+        """Parcourt les identifiants dont la clé commence par `prefix`, dans l'ordre."""
+        position = bisect_left(entries, (prefix, ""))
+        while position < len(entries) and entries[position][0].startswith(prefix):
+            yield entries[position][1]
+            position += 1
+
+    def ordered_ids(self) -> List[str]:
+        """Retourne tous les identifiants, par ordre alphabétique des noms.
+
+        Returns:
+            List[str]: Les identifiants triés par nom normalisé.
+        """
+        return [player_id for _, player_id in self.names]
+
+    def search_ids(self, query: str, limit: int = 20) -> List[str]:
+        """Recherche des joueurs par identifiant exact, préfixe du nom ou mots du nom.
+
+        Ordre des résultats : identifiant exact, puis noms complets commençant
+        par la requête, puis noms dont chaque mot de la requête préfixe un mot
+        (« dup jea » trouve « Jean Dupont »). Accents et casse sont ignorés.
+
+        Args:
+            query (str): Le texte recherché.
+            limit (int): Nombre maximal de résultats.
+
+        Returns:
+            List[str]: Les identifiants trouvés.
+        """
+        found: List[str] = []
+        seen = set()
+
+        def add(player_id: str) -> bool:
+            if player_id not in seen:
+                seen.add(player_id)
+                found.append(player_id)
+            return len(found) >= limit
+
+        query = (query or "").strip()
+        if query in self.registry and add(query):
+            return found
+
+        key = fold(query)
+        if not key:
+            return found
+        for player_id in self._prefix(self.names, key):
+            if add(player_id):
+                return found
+
+        words = key.split()
+        # Le mot le plus long filtre le mieux ; les autres sont vérifiés sur la clé du joueur
+        words.sort(key=len, reverse=True)
+        for player_id in self._prefix(self.tokens, words[0]):
+            tokens = self._keys.get(player_id, "").split()
+            if all(any(t.startswith(w) for t in tokens) for w in words[1:]) and add(player_id):
+                return found
+        return found
+
+    def search(self, query: str, limit: int = 20) -> List[Player]:
+        """Comme `search_ids`, mais retourne les joueurs relus dans le registre.
+
+        Args:
+            query (str): Le texte recherché.
+            limit (int): Nombre maximal de résultats.
+
+        Returns:
+            List[Player]: Les joueurs trouvés.
+        """
+        players = (self.registry.get(player_id) for player_id in self.search_ids(query, limit))
+        return [p for p in players if p is not None]
+
+
+_indexes: Dict[Path, PlayerSearchIndex] = {}
+
+
+def search_index_for(path: Path = DB_LICENSED_PLAYERS) -> PlayerSearchIndex:
+    """Retourne l'index de recherche du registre associé à un chemin (ouvert une fois par processus).
+
+    Args:
+        path (Path): Le chemin de base du registre.
+
+    Returns:
+        PlayerSearchIndex: L'index, à jour du registre.
+    """
+    registry = registry_for(path)
+    key = registry.data_path.resolve()
+    if key not in _indexes:
+        _indexes[key] = PlayerSearchIndex(registry)
+        # Les ajouts de la session sont enregistrés une fois, à la sortie ; après un
+        # arrêt brutal, les lignes manquantes sont relues au prochain chargement
+        atexit.register(_indexes[key].save)
+    return _indexes[key]
+
+
+def lookup_player(national_chess_id: str, path: Path = DB_LICENSED_PLAYERS) -> Optional[Player]:
+    """Recherche exacte d'un joueur licencié par identifiant, en O(1).
+
+    Args:
+        national_chess_id (str): L'identifiant recherché.
+        path (Path): Le chemin de base du registre.
+
+    Returns:
+        Optional[Player]: Le joueur, ou None.
+    """
+    return registry_for(path).get(national_chess_id)
@@ -0,0 +1,411 @@
+from __future__ import annotations
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from constant import DB_SQLITE
+from chessManager.models import Tournament, TournamentHeader, Player, Round, Match
+from chessManager.storage.base import ConflictError, TournamentStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    number_of_rounds INTEGER NOT NULL,
+    description TEXT,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    national_chess_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    birthdate TEXT,
+    address TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_players_national_chess_id
+    ON players (national_chess_id) WHERE national_chess_id <> '';
+
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players (id),
+    tournament_score_value REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (tournament_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_tournament_players_player
+    ON tournament_players (player_id);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    round_number INTEGER NOT NULL,
+    start_datetime TEXT NOT NULL,
+    end_datetime TEXT,
+    bye TEXT,
+    PRIMARY KEY (tournament_id, round_number)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_id INTEGER NOT NULL,
+    round_number INTEGER NOT NULL,
+    board INTEGER NOT NULL,
+    white_player_id INTEGER NOT NULL REFERENCES players (id),
+    white_player_score REAL,
+    black_player_id INTEGER NOT NULL REFERENCES players (id),
+    black_player_score REAL,
+    PRIMARY KEY (tournament_id, round_number, board),
+    FOREIGN KEY (tournament_id, round_number)
+        REFERENCES rounds (tournament_id, round_number) ON DELETE CASCADE
+);
+"""
+
+
+class SqliteTournamentStore(TournamentStore):
+    """Backend SQLite : tables normalisées tournois / joueurs / rondes / matchs.
+
+    Les joueurs sont partagés entre tournois (clé : national_chess_id) ; leur
+    score propre à un tournoi vit dans `tournament_players`. Chaque opération
+    ne touche que les lignes concernées, dans une transaction.
+
+    SQLite verrouille lui-même la base entre processus. Chaque écriture
+    incrémente la version du tournoi si elle vaut encore `Tournament.version`
+    (UPDATE conditionnel) ; sinon la transaction est annulée (`ConflictError`) :
+    sans historique des écritures, aucune fusion n'est tentée.
+
+    Attributes:
+        path (Path): Chemin du fichier de base de données.
+        connection (sqlite3.Connection): La connexion ouverte.
+    """
+
+    def __init__(self, path: Path = DB_SQLITE):
+        self.path = Path(path)
+        # Mode autocommit : les transactions sont ouvertes explicitement par `transaction()`.
+        # La connexion peut être utilisée depuis un autre thread que celui qui l'a ouverte
+        # (serveur HTTP : un seul thread du stockage, les accès restent sérialisés).
+        self.connection = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self._upgrade_schema()
+        self._depth = 0
+        self._bumped: List[Tuple[Tournament, int]] = []
+        self._data_version: Optional[int] = None
+
+    def _upgrade_schema(self):
+        """Ajoute les colonnes apparues après la création d'une base existante."""
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(rounds)")}
+        if "bye" not in columns:
+            self.connection.execute("ALTER TABLE rounds ADD COLUMN bye TEXT")
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(tournaments)")}
+        if "version" not in columns:
+            self.connection.execute("ALTER TABLE tournaments ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Ouvre une transaction ; les transactions imbriquées sont fusionnées."""
+        if self._depth == 0:
+            self.connection.execute("BEGIN")
+        self._depth += 1
+        try:
+            yield
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self.connection.execute("ROLLBACK")
+                for tournament, version in reversed(self._bumped):
+                    tournament.version = version
+                self._bumped = []
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self.connection.execute("COMMIT")
+            self._bumped = []
+
+    def _bump(self, tournament: Tournament):
+        """Incrémente la version d'un tournoi si elle n'a pas changé depuis son chargement.
+
+        Args:
+            tournament (Tournament): Le tournoi écrit.
+
+        Raises:
+            ConflictError: Si un autre processus a écrit le tournoi entre-temps.
+        """
+        cursor = self.connection.execute(
+            "UPDATE tournaments SET version = version + 1 WHERE id = ? AND version = ?",
+            (tournament.tournament_id, tournament.version),
+        )
+        if cursor.rowcount == 0:
+            current = self.version_of(tournament.tournament_id)
+            raise ConflictError(tournament.tournament_id, tournament.version, current)
+        self._bumped.append((tournament, tournament.version))
+        tournament.version += 1
+
+    def close(self):
+        self.connection.close()
+
+    # Lecture
+
+    def source_paths(self) -> List[Path]:
+        return [self.path]
+
+    def list_headers(self) -> List[TournamentHeader]:
+        return [
+            TournamentHeader(
+                tournament_id=row["id"],
+                name=row["name"],
+                location=row["location"],
+                start_date=row["start_date"],
+                end_date=row["end_date"],
+                number_of_rounds=row["number_of_rounds"],
+                player_count=row["player_count"],
+                rounds_played=row["rounds_played"],
+                status=TournamentHeader.status_of(row["number_of_rounds"], row["rounds_played"], row["started"]),
+            )
+            for row in self.connection.execute(
+                """SELECT t.id, t.name, t.location, t.start_date, t.end_date, t.number_of_rounds,
+                          (SELECT COUNT(*) FROM tournament_players tp
+                           WHERE tp.tournament_id = t.id) AS player_count,
+                          (SELECT COUNT(*) FROM rounds r
+                           WHERE r.tournament_id = t.id AND r.end_datetime IS NOT NULL) AS rounds_played,
+                          EXISTS (SELECT 1 FROM matches m WHERE m.tournament_id = t.id) AS started
+                   FROM tournaments t ORDER BY t.id"""
+            )
+        ]
+
+    def external_changes(self) -> bool:
+        # `data_version` change à chaque validation faite par une autre connexion
+        version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        changed, self._data_version = version != self._data_version, version
+        return changed
+
+    def version_of(self, tournament_id: int) -> Optional[int]:
+        row = self.connection.execute("SELECT version FROM tournaments WHERE id = ?", (tournament_id,)).fetchone()
+        return None if row is None else row["version"]
+
+    def load_tournament(self, tournament_id: int) -> Tournament:
+        row = self.connection.execute(
+            "SELECT * FROM tournaments WHERE id = ?", (tournament_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Tournoi introuvable : {tournament_id}")
+
+        players_by_row: Dict[int, Player] = {}
+        players = []
+        for p in self.connection.execute(
+            """SELECT p.id, p.name, p.birthdate, p.national_chess_id, p.address,
+                      tp.tournament_score_value
+               FROM tournament_players tp JOIN players p ON p.id = tp.player_id
+               WHERE tp.tournament_id = ? ORDER BY tp.position""",
+            (tournament_id,),
+        ):
+            player = Player(
+                name=p["name"],
+                birthdate=p["birthdate"],
+                national_chess_id=p["national_chess_id"],
+                address=p["address"],
+                tournament_score_value=p["tournament_score_value"],
+            )
+            players_by_row[p["id"]] = player
+            players.append(player)
+
+        rounds = []
+        for r in self.connection.execute(
+            "SELECT * FROM rounds WHERE tournament_id = ? ORDER BY round_number",
+            (tournament_id,),
+        ):
+            rounds.append(
+                Round(
+                    round_number=r["round_number"],
+                    start_datetime=datetime.fromisoformat(r["start_datetime"]),
+                    end_datetime=(
+                        datetime.fromisoformat(r["end_datetime"]) if r["end_datetime"] else None
+                    ),
+                    bye=r["bye"],
+                )
+            )
+        rounds_by_number = {r.round_number: r for r in rounds}
+        for m in self.connection.execute(
+            "SELECT * FROM matches WHERE tournament_id = ? ORDER BY round_number, board",
+            (tournament_id,),
+        ):
+            rounds_by_number[m["round_number"]].matches.append(
+                Match(
+                    white_player=players_by_row[m["white_player_id"]],
+                    white_player_score=m["white_player_score"],
+                    black_player=players_by_row[m["black_player_id"]],
+                    black_player_score=m["black_player_score"],
+                )
+            )
+
+        return Tournament(
+            name=row["name"],
+            location=row["location"],
+            start_date=row["start_date"],
+            end_date=row["end_date"],
+            number_of_rounds=row["number_of_rounds"],
+            description=row["description"],
+            players=players,
+            rounds=rounds,
+            tournament_id=row["id"],
+            version=row["version"],
+        )
+
+    # Écriture
+
+    def insert_tournament(self, tournament: Tournament):
+        with self.transaction():
+            cursor = self.connection.execute(
+                """INSERT INTO tournaments
+                   (name, location, start_date, end_date, number_of_rounds, description)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (
+                    tournament.name,
+                    tournament.location,
+                    tournament.start_date,
+                    tournament.end_date,
+                    tournament.number_of_rounds,
+                    tournament.description,
+                ),
+            )
+            tournament.tournament_id = cursor.lastrowid
+            tournament.version = 0
+            self.save_players(tournament, tournament.players)
+            for rnd in tournament.rounds:
+                self.save_round(tournament, rnd)
+
+    def save_tournament(self, tournament: Tournament):
+        with self.transaction():
+            self.connection.execute(
+                """UPDATE tournaments SET name = ?, location = ?, start_date = ?, end_date = ?,
+                   number_of_rounds = ?, description = ? WHERE id = ?""",
+                (
+                    tournament.name,
+                    tournament.location,
+                    tournament.start_date,
+                    tournament.end_date,
+                    tournament.number_of_rounds,
+                    tournament.description,
+                    tournament.tournament_id,
+                ),
+            )
+            self._bump(tournament)
+            self.save_players(tournament, tournament.players)
+            for rnd in tournament.rounds:
+                self.save_round(tournament, rnd)
+
+    def _upsert_player(self, player: Player) -> int:
+        """Crée ou met à jour la fiche partagée d'un joueur.
+
+        Args:
+            player (Player): Le joueur à enregistrer.
+
+        Returns:
+            int: L'identifiant de ligne du joueur.
+        """
+        if player.national_chess_id:
+            row = self.connection.execute(
+                "SELECT id FROM players WHERE national_chess_id = ?", (player.national_chess_id,)
+            ).fetchone()
+            if row is not None:
+                self.connection.execute(
+                    "UPDATE players SET name = ?, birthdate = ?, address = ? WHERE id = ?",
+                    (player.name, player.birthdate, player.address, row["id"]),
+                )
+                return row["id"]
+        cursor = self.connection.execute(
+            "INSERT INTO players (national_chess_id, name, birthdate, address) VALUES (?, ?, ?, ?)",
+            (player.national_chess_id, player.name, player.birthdate, player.address),
+        )
+        return cursor.lastrowid
+
+    def _player_rows(self, tournament: Tournament) -> Dict[int, int]:
+        """Associe la position de chaque joueur du tournoi à sa ligne `players`.
+
+        Args:
+            tournament (Tournament): Le tournoi concerné.
+
+        Returns:
+            Dict[int, int]: position → identifiant de ligne.
+        """
+        return {
+            row["position"]: row["player_id"]
+            for row in self.connection.execute(
+                "SELECT position, player_id FROM tournament_players WHERE tournament_id = ?",
+                (tournament.tournament_id,),
+            )
+        }
+
+    def save_players(self, tournament: Tournament, players: List[Player]):
+        if not players:
+            return
+        positions = {id(p): i for i, p in enumerate(tournament.players)}
+        with self.transaction():
+            self._bump(tournament)
+            rows = self._player_rows(tournament)
+            for player in players:
+                position = positions[id(player)]
+                player_id = rows.get(position)
+                if player_id is None or player.national_chess_id:
+                    player_id = self._upsert_player(player)
+                else:
+                    self.connection.execute(
+                        "UPDATE players SET name = ?, birthdate = ?, address = ? WHERE id = ?",
+                        (player.name, player.birthdate, player.address, player_id),
+                    )
+                self.connection.execute(
+                    """INSERT INTO tournament_players
+                       (tournament_id, position, player_id, tournament_score_value)
+                       VALUES (?, ?, ?, ?)
+                       ON CONFLICT (tournament_id, position) DO UPDATE SET
+                           player_id = excluded.player_id,
+                           tournament_score_value = excluded.tournament_score_value""",
+                    (tournament.tournament_id, position, player_id, player.tournament_score_value),
+                )
+
+    def save_round(self, tournament: Tournament, rnd: Round):
+        positions = {id(p): i for i, p in enumerate(tournament.players)}
+        with self.transaction():
+            self._bump(tournament)
+            rows = self._player_rows(tournament)
+            self.connection.execute(
+                """INSERT INTO rounds (tournament_id, round_number, start_datetime, end_datetime, bye)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (tournament_id, round_number) DO UPDATE SET
+                       start_datetime = excluded.start_datetime,
+                       end_datetime = excluded.end_datetime,
+                       bye = excluded.bye""",
+                (
+                    tournament.tournament_id,
+                    rnd.round_number,
+                    rnd.start_datetime.isoformat(),
+                    rnd.end_datetime.isoformat() if rnd.end_datetime else None,
+                    rnd.bye,
+                ),
+            )
+            self.connection.execute(
+                "DELETE FROM matches WHERE tournament_id = ? AND round_number = ?",
+                (tournament.tournament_id, rnd.round_number),
+            )
+            self.connection.executemany(
+                """INSERT INTO matches
+                   (tournament_id, round_number, board, white_player_id, white_player_score,
+                    black_player_id, black_player_score)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        tournament.tournament_id,
+                        rnd.round_number,
+                        board,
+                        rows[positions[id(m.white_player)]],
+                        m.white_player_score,
+                        rows[positions[id(m.black_player)]],
+                        m.black_player_score,
+                    )
+                    for board, m in enumerate(rnd.matches, start=1)
+                ],
+            )
@@ -1,17 +1,38 @@
-from .menu import Menu
-from .view_models import TournamentView, PlayerView, select_tournament
-from .display_tournament import display_tournament_list
-from .display_tournament import display_tournament_players_list
-from .display_tournament import display_chessplayers_list
-from .display_round import display_round_detail
-
-__all__ = [
-    "Menu",
-    "TournamentView",
-    "select_tournament",
-    "PlayerView",
-    "display_tournament_list",
-    "display_tournament_players_list",
-    "display_chessplayers_list",
-    "display_round_detail",
-]
+"""Vues de l'interface en ligne de commande (menus, formulaires, rapports).
+
+Les noms exportés sont importés à leur premier accès (`__getattr__`), comme
+dans `chessManager.storage`.
+"""
+
+import importlib
+
+# Nom exporté → module qui le définit
+_EXPORTS = {
+    "Menu": ".menu",
+    "TournamentView": ".view_models",
+    "select_tournament": ".view_models",
+    "PlayerView": ".view_models",
+    "display_tournament_list": ".display_tournament",
+    "display_tournament_players_list": ".display_tournament",
+    "display_chessplayers_list": ".display_tournament",
+    "display_licensed_player_search": ".display_tournament",
+    "display_round_detail": ".display_round",
+    "display_pairing_report": ".display_round",
+}
+
+
+def __getattr__(name: str):
+    """Importe à la demande le module d'un nom exporté."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
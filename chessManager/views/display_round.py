@@ -1,4 +1,4 @@
-from tabulate import tabulate
+from chessManager.views.pager import paginate
 
 
 def display_tournament_rounds_list(tournament):
@@ -8,21 +8,18 @@ def display_tournament_rounds_list(tournament):
         print("⚠️ Aucun round dans ce tournoi.")
         return
 
-    # Préparer les données pour tabulate
-    table = []
-    for idx, r in enumerate(rounds, start=1):
-        table.append(
-            [
+    def rows():
+        for idx, r in enumerate(rounds, start=1):
+            yield [
                 idx,
                 r.round_number,
                 r.start_datetime,
                 r.end_datetime if r.end_datetime else "En cours",
                 len(r.matches),  # nombre de matchs au lieu d'afficher l'objet brut
             ]
-        )
 
     headers = ["#", "Round", "Début", "Fin", "Nb Matches"]
-    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+    paginate(rows, headers)
     display_round_match_list(rounds[-1])  # Affiche les matchs du dernier round
 
 
@@ -36,27 +33,36 @@ def display_round_match_list(rnd):
         print(f"⚠️ Aucun match pour le round {rnd.round_number}")
         return
 
-    table = []
     # On ajoute des entêtes pour clarifier l'affichage
     headers = ["#", "Blancs", "Res Blancs", "Noirs", "Res Noirs"]
 
-    for idx, match in enumerate(rnd.matches, start=1):
-        white_name = str(match.white_player)
-        black_name = str(match.black_player)
+    print(f"\n=== Matchs du Round {rnd.round_number} ===")
+    paginate(lambda: _match_rows(rnd), headers)
+
+
+def _match_rows(rnd, round_column: bool = False):
+    """Produit une ligne de tableau par match d'un round.
+
+    Args:
+        rnd (Round): Le round concerné.
+        round_column (bool): Préfixer chaque ligne du numéro de round.
 
+    Yields:
+        list: Les cellules de la ligne.
+    """
+    for idx, match in enumerate(rnd.matches, start=1):
         # Gestion de l'affichage des scores (peut être None si non joué)
         w_score = match.white_player_score if match.white_player_score is not None else "-"
         b_score = match.black_player_score if match.black_player_score is not None else "-"
-
-        table.append([idx, white_name, w_score, black_name, b_score])
-
-    print(f"\n=== Matchs du Round {rnd.round_number} ===")
-    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+        row = [idx, str(match.white_player), w_score, str(match.black_player), b_score]
+        yield [rnd.round_number, *row] if round_column else row
 
 
 def display_round_detail(tournament):
     """Affiche le détail complet des rondes et des matchs d'un tournoi.
 
+    Tous les matchs forment un seul tableau paginé, précédés du numéro de leur ronde.
+
     Args:
         tournament (Tournament): Le tournoi à afficher.
     """
@@ -65,7 +71,43 @@ def display_round_detail(tournament):
         return
 
     print(f"\nDétails du tournoi : {tournament.name}")
-    # display_tournament_rounds_list(tournament) # Optionnel si redondant
 
-    for rnd in tournament.rounds:
-        display_round_match_list(rnd)
+    def rows():
+        for rnd in tournament.rounds:
+            yield from _match_rows(rnd, round_column=True)
+
+    headers = ["Round", "#", "Blancs", "Res Blancs", "Noirs", "Res Noirs"]
+    if not paginate(rows, headers):
+        print("⚠️ Aucun match dans les rondes de ce tournoi.")
+
+
+def display_pairing_report(report, interactive: bool = None):
+    """Affiche le bilan d'un appariement groupé : une ligne par section, avec ses durées.
+
+    Args:
+        report (BatchPairingReport): Le bilan retourné par `pair_active_tournaments`.
+        interactive (bool, optional): Navigation au clavier (voir `paginate`).
+    """
+    if report.skipped:
+        print(f"⚠️ Sections non appariées : {', '.join(report.skipped)}")
+    if not report.sections:
+        return
+
+    def rows():
+        for section in report.sections:
+            yield [
+                section.name,
+                section.round_number,
+                len(section.pairs),
+                section.bye or "-",
+                f"{section.load_time * 1000:.1f}",
+                f"{section.pairing_time * 1000:.1f}",
+            ]
+
+    headers = ["Section", "Round", "Matchs", "Exempt", "Chargement (ms)", "Appariement (ms)"]
+    paginate(rows, headers, interactive=interactive)
+    workers = f"{report.workers} processus" if report.workers else "sans pool"
+    print(
+        f"✅ {len(report.sections)} section(s) appariée(s) en {report.elapsed:.2f} s ({workers}), "
+        f"sauvegarde groupée : {report.save_time * 1000:.1f} ms."
+    )
@@ -1,113 +1,107 @@
-import json
+from constant import DB_LICENSED_PLAYERS
+from chessManager.storage import search_index_for
+from chessManager.controllers.tie_breaks import compute_tie_breaks, standings_order
+from chessManager.views.pager import paginate
 
-from tabulate import tabulate
-from pathlib import Path
-from constant import DB_LICENSED_PLAYERS, DB_TOURNAMENTS, DEFAULT_ENCODING
 
+def display_tournament_list(controller):
+    """Affiche la liste des tournois sous forme de tableau paginé.
 
-def display_tournament_list():
-    """Affiche la liste des tournois sous forme de tableau."""
-    if not DB_TOURNAMENTS.exists():
-        print("⚠️ Aucun tournoi enregistré.")
-        return
+    Les lignes sont les en-têtes déjà chargés par le contrôleur (relus depuis
+    le catalogue seulement si un autre processus a écrit entre-temps).
 
-    with open(DB_TOURNAMENTS, "r", encoding=DEFAULT_ENCODING) as f:
-        try:
-            data = json.load(f)
-        except json.JSONDecodeError:
-            print("⚠️ Fichier de tournois corrompu ou vide.")
-            return
+    Args:
+        controller (TournamentController): Le contrôleur des tournois.
+    """
+    tournaments = controller.list_tournaments()
 
-    if not data:
+    if not tournaments:
         print("⚠️ Aucun tournoi disponible.")
         return
 
-    # Préparer les données pour tabulate
-    table = []
-    for idx, t in enumerate(data, start=1):
-        table.append(
-            [
-                idx,
-                t.get("name", ""),
-                t.get("location", ""),
-                t.get("start_date", ""),
-                t.get("end_date", ""),
-                t.get("number_of_rounds", 0),
-                len(t.get("players", [])),
-            ]
-        )
-
-    headers = ["#", "Nom", "Lieu", "Début", "Fin", "Rounds", "Nb Joueurs"]
+    def rows():
+        for idx, t in enumerate(tournaments, start=1):
+            rounds = f"{t.rounds_played}/{t.number_of_rounds}"
+            yield [idx, t.name, t.location, t.start_date, t.end_date, rounds, t.player_count, t.status]
 
-    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+    headers = ["#", "Nom", "Lieu", "Début", "Fin", "Rounds", "Nb Joueurs", "Statut"]
+    paginate(rows, headers)
 
 
 def display_tournament_players_list(tournament):
-    """Affiche la liste des joueurs d'un tournoi sous forme de tableau."""
+    """Affiche le classement des joueurs d'un tournoi, départages compris, page par page."""
     players = tournament.players
     if not players:
         print("⚠️ Aucun joueur dans ce tournoi.")
         return
 
-    # Trier les joueurs par ordre alphabétique (clé = name)
-    players = sorted(players, key=lambda p: p.name.lower())
+    # Classement par score puis départages (calculés une fois par ronde clôturée)
+    tie_breaks = compute_tie_breaks(tournament)
+    order = standings_order(tournament)
 
-    # Préparer les données pour tabulate
-    table = []
-    for idx, p in enumerate(players, start=1):
-        table.append(
-            [
-                idx,
+    def rows():
+        for rank, i in enumerate(order, start=1):
+            p = players[i]
+            yield [
+                rank,
                 p.name,
                 p.birthdate,
                 p.national_chess_id,
                 p.address or "",
                 p.tournament_score_value,
+                float(tie_breaks.buchholz[i]),
+                float(tie_breaks.median_buchholz[i]),
+                float(tie_breaks.sonneborn_berger[i]),
+                float(tie_breaks.progressive[i]),
             ]
-        )
+
     headers = [
+        "#",
         "name",
         "birthdate",
         "national_chess_id",
         "address",
         "tournament_score_value",
+        "Buchholz",
+        "Médian",
+        "S-B",
+        "Prog.",
     ]
-    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+    paginate(rows, headers)
 
 
 def display_chessplayers_list():
-    """Affiche la liste des joueurs d'échecs sous forme de tableau."""
-    players_file = Path(DB_LICENSED_PLAYERS)
-    if not players_file.exists():
+    """Affiche la liste des joueurs d'échecs sous forme de tableau paginé."""
+    index = search_index_for(DB_LICENSED_PLAYERS)
+    if not index.names:
         print("⚠️ Aucun joueur enregistré.")
         return
 
-    with open(players_file, "r", encoding="utf-8") as f:
-        try:
-            data = json.load(f)
-            players = data.get("players", [])
-        except json.JSONDecodeError:
-            print("⚠️ Fichier de joueurs corrompu ou vide.")
-            return
+    # L'ordre alphabétique vient de l'index de recherche : pas de tri à chaque
+    # affichage, et seuls les joueurs de la page affichée sont relus
+    def rows():
+        players = index.registry.get_many(index.ordered_ids())
+        for idx, p in enumerate(players, start=1):
+            yield [idx, p.name, p.birthdate, p.national_chess_id, p.address or ""]
+
+    headers = ["#", "name", "birthdate", "national_chess_id", "address"]
+    paginate(rows, headers)
 
+
+def display_licensed_player_search(query: str = None):
+    """Recherche des joueurs licenciés (nom, début de nom, mots du nom ou identifiant) et les affiche.
+
+    Args:
+        query (str, optional): Le texte recherché (demandé s'il est absent).
+    """
+    if query is None:
+        query = input("Rechercher (nom ou identifiant) : ").strip()
+    players = search_index_for(DB_LICENSED_PLAYERS).search(query)
     if not players:
-        print("⚠️ Aucun joueur disponible.")
+        print("⚠️ Aucun joueur trouvé.")
         return
-
-    # Trier les joueurs par ordre alphabétique (clé = name)
-    players = sorted(players, key=lambda p: p.get("name", "").lower())
-
-    # Préparer les données pour tabulate
-    table = []
-    for idx, p in enumerate(players, start=1):
-        table.append(
-            [
-                idx,
-                p.get("name", ""),
-                p.get("birthdate", ""),
-                p.get("national_chess_id", ""),
-                p.get("address", ""),
-            ]
-        )
-    headers = ["name", "birthdate", "national_chess_id", "address"]
-    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+    headers = ["#", "name", "birthdate", "national_chess_id", "address"]
+    paginate(
+        lambda: ([idx, p.name, p.birthdate, p.national_chess_id, p.address or ""] for idx, p in enumerate(players, 1)),
+        headers,
+    )
@@ -0,0 +1,186 @@
+"""Rendu paginé et en flux des tableaux de rapports.
+
+Les lignes sont tirées d'un générateur : seule la page affichée est en mémoire.
+Les largeurs de colonnes sont calculées sur un échantillon borné (en-têtes et
+premières lignes) puis figées ; une cellule plus large est tronquée par « … ».
+Le tracé reprend le style `fancy_grid` de tabulate.
+
+En terminal interactif, le tableau est affiché page par page avec navigation
+(suivante / précédente / quitter). Sinon (sortie redirigée), toutes les pages
+sont écrites à la suite, toujours ligne par ligne.
+"""
+
+import sys
+from collections import OrderedDict, deque
+from itertools import chain, islice
+from numbers import Number
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from constant import REPORT_PAGE_SIZE, REPORT_WIDTH_SAMPLE
+
+# Nombre de pages gardées en mémoire pour revenir en arrière sans relire la source
+PAGE_CACHE_SIZE = 4
+
+
+def _cell(value: Any) -> str:
+    """Convertit une valeur en texte de cellule (None → vide)."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return str(value)
+
+
+def _fit(text: str, width: int, numeric: bool) -> str:
+    """Aligne (nombres à droite) ou tronque un texte à la largeur de sa colonne."""
+    if len(text) > width:
+        return text[: width - 1] + "…"
+    return text.rjust(width) if numeric else text.ljust(width)
+
+
+class TableRenderer:
+    """Trace un tableau `fancy_grid` à largeurs fixes, ligne par ligne.
+
+    Attributes:
+        headers (List[str]): Les en-têtes de colonnes.
+        widths (List[int]): La largeur de chaque colonne.
+        numeric (List[bool]): Colonnes alignées à droite (valeurs numériques de l'échantillon).
+    """
+
+    def __init__(self, headers: Sequence[str], sample: Sequence[Sequence[Any]]):
+        self.headers = [str(h) for h in headers]
+        self.widths = [len(h) for h in self.headers]
+        self.numeric = [bool(sample) for _ in self.headers]
+        for row in sample:
+            for i, value in enumerate(row[: len(self.headers)]):
+                self.widths[i] = max(self.widths[i], len(_cell(value)))
+                if value is not None and not (isinstance(value, Number) and not isinstance(value, bool)):
+                    self.numeric[i] = False
+
+    def _border(self, left: str, fill: str, middle: str, right: str) -> str:
+        return left + middle.join(fill * (w + 2) for w in self.widths) + right
+
+    def _line(self, cells: Sequence[str], numeric: Sequence[bool]) -> str:
+        return "│" + "│".join(f" {_fit(c, w, n)} " for c, w, n in zip(cells, self.widths, numeric)) + "│"
+
+    def top(self) -> str:
+        return self._border("╒", "═", "╤", "╕")
+
+    def header(self) -> str:
+        return self._line(self.headers, [False] * len(self.headers))
+
+    def header_rule(self) -> str:
+        return self._border("╞", "═", "╪", "╡")
+
+    def separator(self) -> str:
+        return self._border("├", "─", "┼", "┤")
+
+    def bottom(self) -> str:
+        return self._border("╘", "═", "╧", "╛")
+
+    def row(self, values: Sequence[Any]) -> str:
+        cells = [_cell(v) for v in values[: len(self.headers)]]
+        cells += [""] * (len(self.headers) - len(cells))
+        return self._line(cells, self.numeric)
+
+    def print_page(self, rows: Sequence[Sequence[Any]], out=None):
+        """Écrit une page complète (bordures comprises), ligne par ligne."""
+        out = out or sys.stdout
+        print(self.top(), file=out)
+        print(self.header(), file=out)
+        print(self.header_rule(), file=out)
+        for i, values in enumerate(rows):
+            if i:
+                print(self.separator(), file=out)
+            print(self.row(values), file=out)
+        print(self.bottom(), file=out)
+
+
+def paginate(
+    source: Callable[[], Iterable[Sequence[Any]]],
+    headers: Sequence[str],
+    page_size: int = REPORT_PAGE_SIZE,
+    sample_size: int = REPORT_WIDTH_SAMPLE,
+    interactive: Optional[bool] = None,
+) -> int:
+    """Affiche un tableau page par page à partir d'un générateur de lignes.
+
+    Args:
+        source (Callable[[], Iterable]): Fabrique des lignes ; rappelée pour
+            revenir à une page sortie du cache.
+        headers (Sequence[str]): Les en-têtes de colonnes.
+        page_size (int): Nombre de lignes par page.
+        sample_size (int): Nombre de lignes lues pour calculer les largeurs.
+        interactive (bool, optional): Navigation au clavier (défaut : si la
+            sortie standard est un terminal).
+
+    Returns:
+        int: Le nombre de lignes affichées (0 si la source est vide).
+    """
+    if interactive is None:
+        interactive = sys.stdout.isatty()
+
+    rows = iter(source())
+    sample = list(islice(rows, sample_size))
+    if not sample:
+        return 0
+    renderer = TableRenderer(headers, sample)
+    rows = chain(sample, rows)
+    del sample
+
+    if interactive:
+        return _navigate(source, renderer, rows, page_size)
+
+    shown = 0
+    while True:
+        page = list(islice(rows, page_size))
+        if not page:
+            return shown
+        renderer.print_page(page)
+        shown += len(page)
+
+
+def _navigate(source, renderer: TableRenderer, rows: Iterator, page_size: int) -> int:
+    """Boucle de navigation interactive entre les pages.
+
+    Les dernières pages lues restent en cache ; revenir plus loin en arrière
+    relit la source depuis le début.
+
+    Returns:
+        int: Le nombre de lignes jusqu'à la page la plus lointaine affichée.
+    """
+    cache: "OrderedDict[int, List]" = OrderedDict()
+    next_page = 0  # page que `rows` produira ensuite
+
+    def load(number: int) -> List:
+        nonlocal rows, next_page
+        if number in cache:
+            cache.move_to_end(number)
+            return cache[number]
+        if number < next_page:
+            rows, next_page = iter(source()), 0
+        if number > next_page:
+            deque(islice(rows, (number - next_page) * page_size), maxlen=0)
+        page = list(islice(rows, page_size))
+        next_page = number + 1
+        cache[number] = page
+        while len(cache) > PAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return page
+
+    current = shown = 0
+    while True:
+        page = load(current)
+        renderer.print_page(page)
+        shown = max(shown, current * page_size + len(page))
+        has_next = len(page) == page_size and bool(load(current + 1))
+        if not has_next and not current:
+            return shown  # une seule page : rien à parcourir
+        choices = ("[Entrée] suivante, " if has_next else "") + ("[p] précédente, " if current else "")
+        answer = input(f"Page {current + 1} — {choices}[q] quitter : ").strip().lower()
+        if answer == "q" or (answer == "" and not has_next):
+            return shown
+        if answer == "p" and current:
+            current -= 1
+        elif answer == "" and has_next:
+            current += 1
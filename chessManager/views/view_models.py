@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, Optional, Any
 from type_validation import validate_cast  # déjà utilisé dans ton projet
+from constant import DB_LICENSED_PLAYERS
+from chessManager.storage import search_index_for
 
 
 class FormView(ABC):
@@ -64,14 +66,23 @@ def select_tournament(controller):
 
     try:
         choice = int(input("Choisissez un tournoi (numéro) : ").strip())
-        return tournaments[choice - 1] if 1 <= choice <= len(tournaments) else None
     except ValueError:
         print("⚠ Entrée invalide.")
         return None
+    if not 1 <= choice <= len(tournaments):
+        return None
+    try:
+        return controller.open_tournament(tournaments[choice - 1])
+    except ValueError as e:
+        print(f"⚠ Tournoi illisible : {e}")
+        return None
 
 
 class PlayerView(FormView):
     def ask_fields(self) -> Dict[str, Optional[str]]:
+        existing = self.find_existing()
+        if existing is not None:
+            return existing
         print("\n=== Création d’un joueur ===")
         data: Dict[str, Optional[str]] = {
             "name": self.ask_str("Nom complet : "),
@@ -80,3 +91,27 @@ class PlayerView(FormView):
             "address": self.ask_optional_str("Adresse (optionnelle) : "),
         }
         return self.validate(data)
+
+    def find_existing(self) -> Optional[Dict[str, Any]]:
+        """Propose de rattacher un joueur déjà licencié, retrouvé via l'index de recherche.
+
+        Returns:
+            Optional[Dict[str, Any]]: L'enregistrement du joueur choisi, ou None
+            pour créer un nouveau joueur.
+        """
+        index = search_index_for(DB_LICENSED_PLAYERS)
+        while True:
+            query = input("Rechercher un joueur licencié (nom ou identifiant, Entrée pour en créer un) : ").strip()
+            if not query:
+                return None
+            players = index.search(query, limit=10)
+            if not players:
+                print("⚠ Aucun joueur trouvé.")
+                continue
+            for idx, p in enumerate(players, start=1):
+                print(f"{idx}. {p.name} ({p.national_chess_id}, né(e) le {p.birthdate})")
+            choice = input("Numéro du joueur (Entrée pour une autre recherche) : ").strip()
+            if choice.isdigit() and 1 <= int(choice) <= len(players):
+                record = players[int(choice) - 1].to_record()
+                record["tournament_score_value"] = 0.0
+                return record
@@ -6,9 +6,56 @@ DB_PLAYERS = Path("Data") / "ImportedPlayers.json"
 # Fichier JSON contenant la DB des joueurs licenciés
 DB_LICENSED_PLAYERS = Path("Data") / "LicensedPlayers.json"
 
-# Fichier JSON contenant les tournois
+# Dossier des tournois : un fichier par tournoi, un manifeste et le journal des modifications
+DB_TOURNAMENTS_DIR = Path("Data") / "tournaments"
+
+# Ancien fichier unique des tournois, importé dans DB_TOURNAMENTS_DIR au premier lancement
 DB_TOURNAMENTS = Path("Data") / "Tournaments.json"
 
+# Version du format des fichiers de tournois (v2 : matchs référençant les joueurs par identifiant)
+DB_FORMAT_VERSION = 2
+
+# Ancien journal associé à DB_TOURNAMENTS, rejoué lors de l'import
+DB_TOURNAMENTS_JOURNAL = Path("Data") / "Tournaments.journal"
+
+# Nombre d'entrées du journal au-delà duquel il est compacté dans les fichiers des tournois
+JOURNAL_COMPACTION_THRESHOLD = 200
+
+# Forcer sur disque (fsync) chaque sauvegarde avant de rendre la main
+DURABLE_WRITES = True
+
+# Base SQLite (backend de stockage alternatif)
+DB_SQLITE = Path("Data") / "chessManager.sqlite3"
+
+# Backend de stockage des tournois : "json" ou "sqlite"
+STORAGE_BACKEND = "json"
+
+# Codec JSON des fichiers de données : "auto" (msgspec, puis orjson, puis json), "msgspec", "orjson" ou "json"
+JSON_CODEC = "auto"
+
+# Snapshots JSON compacts (sans indentation) : plus petits et plus rapides, moins lisibles
+JSON_COMPACT = False
+
+# Adresse et port du serveur HTTP local (python -m chessManager.server)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+
+# Délai (s) entre deux vérifications qu'un tournoi ouvert par le serveur n'a pas été modifié par un autre processus
+SERVER_REFRESH_INTERVAL = 0.5
+
+# Nombre de tournois complets (joueurs + rondes) gardés en mémoire
+TOURNAMENT_CACHE_SIZE = 8
+
+# Processus utilisés pour apparier plusieurs tournois en parallèle (None : nombre de cœurs)
+PAIRING_WORKERS = None
+
+# Nombre de joueurs sauvegardés par lot lors d'un import
+IMPORT_BATCH_SIZE = 5000
+
+# Rapports : lignes par page et lignes lues pour calculer la largeur des colonnes
+REPORT_PAGE_SIZE = 50
+REPORT_WIDTH_SAMPLE = 200
+
 # Encodage de lecture/écriture
 DEFAULT_ENCODING = "utf-8"
 
@@ -2,27 +2,23 @@
 
 Ce script lance l'application, affiche le menu principal et route les actions
 vers les contrôleurs appropriés.
+
+Les vues sont importées à leur première utilisation (`chessManager.views`) et
+le contrôleur au lancement : le premier menu n'attend ni NumPy ni les
+rapports. `python main.py --startup-report [--json]` détaille le temps et la
+mémoire de ce démarrage (voir `chessManager.benchmarks.startup`).
 """
 
-from constant import DB_PLAYERS
-from chessManager.controllers.tournaments_control import TournamentController
-from chessManager.controllers.rounds_control import reset_last_round_and_rescore
-
-# Note: Il serait préférable d'importer depuis chessManager.views sans underscore si possible,
-# mais on garde les imports existants.
-from chessManager.views import (
-    Menu,
-    TournamentView,
-    select_tournament,
-    PlayerView,
-    display_tournament_list,
-    display_tournament_players_list,
-    display_round_detail,
-    display_chessplayers_list,
-)
-
-
-def manage_tournament(controller: TournamentController):
+import sys
+from typing import TYPE_CHECKING
+
+from chessManager import views
+
+if TYPE_CHECKING:
+    from chessManager.controllers.tournaments_control import TournamentController
+
+
+def manage_tournament(controller: "TournamentController"):
     """Gère le sous-menu d'un tournoi spécifique.
 
     Permet d'ajouter des joueurs, de lancer des rounds, de voir les résultats, etc.
@@ -30,6 +26,8 @@ def manage_tournament(controller: TournamentController):
     Args:
         controller (TournamentController): Le contrôleur principal contenant la liste des tournois.
     """
+    from constant import DB_PLAYERS
+
     tournaments = controller.list_tournaments()
     if not tournaments:
         print("⚠️ Aucun tournoi disponible.")
@@ -47,15 +45,19 @@ def manage_tournament(controller: TournamentController):
 
     if not (0 <= idx < len(tournaments)):
         return
-    tournament = tournaments[idx]
+    try:
+        tournament = controller.open_tournament(tournaments[idx])
+    except ValueError as e:
+        print(f"⚠️ Tournoi illisible : {e}")
+        return
 
     # Sous-menu gestion
-    manage_menu = Menu(f"Gérer le tournoi {tournament.name}")
+    manage_menu = views.Menu(f"Gérer le tournoi {tournament.name}")
     manage_menu.add_option(
         1,
         "Ajouter un joueur",
         lambda: controller.add_player_to_tournament(
-            tournament, PlayerView().ask_fields()
+            tournament, views.PlayerView().ask_fields()
         ),
     )
     # Reste du code inchangé...
@@ -68,7 +70,7 @@ def manage_tournament(controller: TournamentController):
     manage_menu.add_option(
         3,
         "Liste des joueurs du tournoi",
-        lambda: display_tournament_players_list(tournament),
+        lambda: views.display_tournament_players_list(tournament),
     )
     manage_menu.add_option(
         4, "Initier un tournois", lambda: controller.start_tournament(tournament)
@@ -81,28 +83,35 @@ def manage_tournament(controller: TournamentController):
     manage_menu.add_option(
         6,
         "Modifier les résultats du round précédent",
-        lambda: reset_last_round_and_rescore(tournament),
+        lambda: controller.reset_last_round_results(tournament),
+    )
+    manage_menu.add_option(
+        7,
+        "Importer les résultats du round en cours (CSV/JSON/NDJSON)",
+        lambda: controller.import_round_results(
+            tournament, input("Fichier de résultats : ").strip()
+        ),
     )
     manage_menu.add_option(0, "Retour", None)
     manage_menu.run()
 
 
 def display_report(controller):
-    reports_menu = Menu("Afficher les rapports")
+    reports_menu = views.Menu("Afficher les rapports")
     reports_menu.add_option(
         1,
         "Liste des joueurs de la FFE (ordre alphabétique)",
-        lambda: display_chessplayers_list(),
+        lambda: views.display_chessplayers_list(),
     )
     reports_menu.add_option(
-        2, "Liste de tous les tournois", lambda: display_tournament_list()
+        2, "Liste de tous les tournois", lambda: views.display_tournament_list(controller)
     )
     reports_menu.add_option(
         3,
-        "Liste des joueurs d'un tournoi (ordre alphabétique)",
+        "Classement des joueurs d'un tournoi (score puis départages)",
         lambda: (
-            lambda t=select_tournament(controller): (
-                display_tournament_players_list(t) if t else None
+            lambda t=views.select_tournament(controller): (
+                views.display_tournament_players_list(t) if t else None
             )
         )(),
     )
@@ -110,31 +119,72 @@ def display_report(controller):
         4,
         "Liste des rounds et matchs d'un tournois",
         lambda: (
-            lambda t=select_tournament(controller): (
-                display_round_detail(t) if t else None
+            lambda t=views.select_tournament(controller): (
+                views.display_round_detail(t) if t else None
             )
         )(),
     )
 
+    reports_menu.add_option(
+        5,
+        "Rechercher un joueur licencié (nom ou identifiant)",
+        lambda: views.display_licensed_player_search(),
+    )
     reports_menu.add_option(0, "Retour", None)
     reports_menu.run()
 
 
-def main():
-    """Point d'entrée principal. Affiche le menu racine."""
-    controller = TournamentController()
-    tview = TournamentView()
+def build_main_menu(controller: "TournamentController") -> "views.Menu":
+    """Construit le menu racine.
 
-    main_menu = Menu("Menu Principal")
+    Args:
+        controller (TournamentController): Le contrôleur des tournois.
+
+    Returns:
+        Menu: Le menu principal, prêt à être lancé.
+    """
+    main_menu = views.Menu("Menu Principal")
     main_menu.add_option(
         1,
         "Créer un tournoi",
-        lambda: controller.create_tournament(**tview.ask_fields()),
+        lambda: controller.create_tournament(**views.TournamentView().ask_fields()),
     )
     main_menu.add_option(2, "Gérer un tournoi", lambda: manage_tournament(controller))
     main_menu.add_option(3, "Afficher les rapports", lambda: display_report(controller))
+    main_menu.add_option(
+        4,
+        "Apparier tous les tournois en cours",
+        lambda: views.display_pairing_report(controller.pair_active_tournaments()),
+    )
     main_menu.add_option(0, "Quitter", None)
-    main_menu.run()
+    return main_menu
+
+
+def main(argv=None):
+    """Point d'entrée principal. Affiche le menu racine.
+
+    Avec --startup-report, mesure le démarrage jusqu'au premier menu et
+    affiche le rapport (--json : document JSON) au lieu de lancer le menu.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--startup-report" in argv:
+        from chessManager.benchmarks.startup import measure_startup, print_startup_report
+
+        as_json = "--json" in argv
+        # En JSON, les messages du chargement (import de l'ancien fichier...) vont sur la sortie d'erreur
+        stdout = sys.stdout
+        if as_json:
+            sys.stdout = sys.stderr
+        try:
+            report = measure_startup(build_main_menu)
+        finally:
+            sys.stdout = stdout
+        print_startup_report(report, as_json)
+        return
+
+    from chessManager.controllers.tournaments_control import TournamentController
+
+    build_main_menu(TournamentController()).run()
 
 
 if __name__ == "__main__":